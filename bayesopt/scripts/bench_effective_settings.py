@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+EFFECTIVE SETTINGS MICROBENCHMARK
+
+Times CoefficientConfig.get_effective_autotune_settings() and
+get_effective_auto_advance_settings() on their three resolution paths
+(force_global, local override, global default). The tuner resolves these
+on every update, so this is the number to check before caching them.
+
+Each lookup is also timed on _MemoizedCoefficientConfig, which keeps the
+last result per (global_enabled, global_threshold, force_global) key on
+the instance, so the plain lookup and a memoized one are compared in the
+same run. Figures are the best of 5 repeats, in ns per call, and include
+the cost of the lambda that timeit calls.
+
+Usage:
+  python bench_effective_settings.py [loops]
+"""
+
+import sys
+import os
+import platform
+import timeit
+
+# Add parent directory (bayesopt) to path to import tuner module
+script_dir = os.path.dirname(os.path.abspath(__file__))
+bayesopt_dir = os.path.dirname(script_dir)
+sys.path.insert(0, bayesopt_dir)
+
+from tuner.config import CoefficientConfig
+
+
+class _MemoizedCoefficientConfig(CoefficientConfig):
+    """CoefficientConfig that reuses its last effective settings per argument key."""
+    
+    __slots__ = ('_autotune_cache', '_auto_advance_cache')
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._autotune_cache = None
+        self._auto_advance_cache = None
+    
+    def get_effective_autotune_settings(self, global_enabled, global_threshold, force_global=False):
+        key = (global_enabled, global_threshold, force_global)
+        cache = self._autotune_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        result = super().get_effective_autotune_settings(global_enabled, global_threshold, force_global)
+        self._autotune_cache = (key, result)
+        return result
+    
+    def get_effective_auto_advance_settings(self, global_auto_advance, global_threshold, force_global=False):
+        key = (global_auto_advance, global_threshold, force_global)
+        cache = self._auto_advance_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        result = super().get_effective_auto_advance_settings(global_auto_advance, global_threshold, force_global)
+        self._auto_advance_cache = (key, result)
+        return result
+
+
+def make_coeff(override, cls=CoefficientConfig):
+    """Build a float coefficient with both per-coefficient overrides on or off."""
+    return cls(
+        name="bench",
+        default_value=0.5,
+        min_value=0.0,
+        max_value=1.0,
+        initial_step_size=0.1,
+        step_decay_rate=0.9,
+        is_integer=False,
+        enabled=True,
+        nt_key="/bench",
+        autotune_override=override,
+        autotune_enabled=False,
+        autotune_shot_threshold=5,
+        auto_advance_override=override,
+        auto_advance_on_success=False,
+        auto_advance_shot_threshold=7,
+    )
+
+
+def bench(loops, repeat=5):
+    """Return (label, plain ns per call, memoized ns per call) for each method and path."""
+    results = []
+    for path, override, force_global in (
+        ("force_global", True, True),
+        ("local override", True, False),
+        ("global default", False, False),
+    ):
+        coeffs = (make_coeff(override), make_coeff(override, _MemoizedCoefficientConfig))
+        for method in ("get_effective_autotune_settings", "get_effective_auto_advance_settings"):
+            timings = []
+            for coeff in coeffs:
+                call = getattr(coeff, method)
+                best = min(timeit.repeat(
+                    lambda: call(True, 10, force_global=force_global), number=loops, repeat=repeat
+                ))
+                timings.append(best / loops * 1e9)
+            results.append((f"{method} [{path}]", *timings))
+    return results
+
+
+def main():
+    loops = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    print(f"Python {platform.python_version()} ({platform.python_implementation()}), "
+          f"{loops} loops, best of 5")
+    print(f"{'lookup':<55} {'plain':>8} {'memoized':>9}  (ns/call)")
+    for label, plain_ns, memo_ns in bench(loops):
+        print(f"{label:<55} {plain_ns:8.1f} {memo_ns:9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+BINARY SHOT LOG -> CSV
+
+Converts a binary shot log (.bin, written when LOG_BINARY is enabled in
+TunerConfig) into a CSV file for spreadsheets and offline analysis.
+
+The default output is <log>.from_bin.csv next to the .bin, so the
+session's own CSV log (same name, more columns) is never replaced. An
+existing default output is not overwritten; name the output explicitly
+to replace it.
+
+Usage:
+  python bin2csv.py tuner_logs/bayesian_tuner_20250101_120000.bin [output.csv]
+"""
+
+import sys
+import os
+import csv
+from datetime import datetime
+
+# Add parent directory (bayesopt) to path to import tuner module
+script_dir = os.path.dirname(os.path.abspath(__file__))
+bayesopt_dir = os.path.dirname(script_dir)
+sys.path.insert(0, bayesopt_dir)
+
+from tuner.logger import read_binary_log
+
+
+def convert(bin_path, csv_path):
+    """Write every record of a binary shot log to a CSV file."""
+    count = 0
+    with open(csv_path, 'w', newline='') as f:
+        writer = None
+        for record in read_binary_log(bin_path):
+            if writer is None:
+                writer = csv.writer(f)
+                writer.writerow(['timestamp', *record])
+            timestamp = datetime.fromtimestamp(record['timestamp_ns'] / 1e9).isoformat()
+            writer.writerow([timestamp, *('' if v != v else v for v in record.values())])
+            count += 1
+    return count
+
+
+def main():
+    if len(sys.argv) not in (2, 3):
+        print(__doc__)
+        return 1
+    
+    bin_path = sys.argv[1]
+    if len(sys.argv) == 3:
+        csv_path = sys.argv[2]
+    else:
+        csv_path = os.path.splitext(bin_path)[0] + '.from_bin.csv'
+        if os.path.exists(csv_path):
+            print(f"{csv_path} already exists; pass an output path to overwrite it")
+            return 1
+    
+    count = convert(bin_path, csv_path)
+    print(f"Wrote {count} shots to {csv_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,11 +16,36 @@ Usage:
 
 __version__ = "1.0.0"
 
+import importlib
+
 from .config import TunerConfig, CoefficientConfig
-from .tuner import BayesianTunerCoordinator, run_tuner
-from .nt_interface import NetworkTablesInterface, ShotData
-from .optimizer import BayesianOptimizer, CoefficientTuner
-from .logger import TunerLogger, setup_logging
+
+# Everything else is imported on first access (PEP 562) so that tools which
+# only need the config don't pay for skopt/sklearn/NetworkTables imports.
+_LAZY_IMPORTS = {
+    'BayesianTunerCoordinator': '.tuner',
+    'run_tuner': '.tuner',
+    'NetworkTablesInterface': '.nt_interface',
+    'ShotData': '.nt_interface',
+    'BayesianOptimizer': '.optimizer',
+    'CoefficientTuner': '.optimizer',
+    'TunerLogger': '.logger',
+    'setup_logging': '.logger',
+}
+
+
+def __getattr__(name):
+    """Import lazily exported names on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # Cache so __getattr__ isn't hit again
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __all__ = [
     'TunerConfig',
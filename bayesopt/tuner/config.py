@@ -23,14 +23,33 @@ From COEFFICIENT_TUNING.py:
     - Optimization parameters (N_INITIAL_POINTS, N_CALLS_PER_COEFFICIENT, etc.)
 """
 
-from dataclasses import dataclass
-from typing import Dict, List
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+from typing import Dict, List, Tuple
 import os
+import sys
 import configparser
+import copy
+import functools
 import importlib.util
 
+import numpy as np
 
-@dataclass
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@functools.lru_cache(maxsize=64)
+def _step_schedule(initial_step: float, decay_rate: float, min_ratio: float, n: int) -> np.ndarray:
+    """Read-only array of initial_step * decay_rate**i, floored at initial_step * min_ratio."""
+    steps = initial_step * np.power(decay_rate, np.arange(n, dtype=np.float64))
+    np.maximum(steps, initial_step * min_ratio, out=steps)
+    steps.flags.writeable = False  # Shared between callers via the cache
+    return steps
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class CoefficientConfig:
     """
     Configuration for a single tunable coefficient.
@@ -78,13 +97,71 @@ class CoefficientConfig:
             value: The value to clamp
             
         Returns:
-            Value clamped to [min_value, max_value], rounded if is_integer=True
+            Value clamped to [min_value, max_value], rounded if is_integer=True;
+            NaN maps to default_value (itself clamped), or to min_value if
+            default_value is NaN too
         """
-        clamped = max(self.min_value, min(self.max_value, value))
+        # Plain comparisons are several times cheaper than max(min(...))
+        if value > self.max_value:
+            clamped = self.max_value
+        elif value >= self.min_value:
+            clamped = value
+        elif value != value:
+            # NaN fails both range checks; fall back to the configured default,
+            # clamped the same way (a NaN default lands on min_value)
+            default = self.default_value
+            if default > self.max_value:
+                clamped = self.max_value
+            elif default >= self.min_value:
+                clamped = default
+            else:
+                clamped = self.min_value
+        else:
+            clamped = self.min_value
         if self.is_integer:
             clamped = round(clamped)
         return clamped
     
+    def clamp_array(self, values) -> np.ndarray:
+        """
+        Vectorized clamp() for a batch of candidate values.
+        
+        Intended for screening many optimizer candidates at once instead of
+        calling clamp() per point. A float64 ndarray is clamped in place
+        (no copy); any other input is converted to a new float64 array.
+        
+        Args:
+            values: Array-like of values to clamp
+            
+        Returns:
+            Array clamped to [min_value, max_value], rounded if is_integer=True;
+            NaN maps to the same value as clamp(nan)
+        """
+        arr = np.asarray(values, dtype=np.float64)
+        np.nan_to_num(arr, copy=False, nan=self.clamp(float('nan')))
+        np.clip(arr, self.min_value, self.max_value, out=arr)
+        if self.is_integer:
+            # np.rint rounds half to even, same as the built-in round()
+            np.rint(arr, out=arr)
+        return arr
+    
+    def schedule(self, n: int, min_ratio: float) -> np.ndarray:
+        """
+        Step size for each of the first n iterations.
+        
+        Closed form of the per-iteration decay: step i is
+        initial_step_size * step_decay_rate**i, never below
+        initial_step_size * min_ratio. Cached per (step, rate, ratio, n).
+        
+        Args:
+            n: Number of iterations
+            min_ratio: Minimum step as a fraction of initial_step_size
+            
+        Returns:
+            Read-only float64 array of length n
+        """
+        return _step_schedule(self.initial_step_size, self.step_decay_rate, min_ratio, n)
+    
     def get_effective_autotune_settings(self, global_enabled: bool, global_threshold: int, force_global: bool = False) -> tuple:
         """
         Get the effective autotune settings for this coefficient.
@@ -154,6 +231,110 @@ class CoefficientConfig:
             return global_auto_advance
 
 
+# Module-level settings copied from COEFFICIENT_TUNING.py into TunerConfig
+_COEFFICIENT_SETTINGS = (
+    'N_INITIAL_POINTS',
+    'N_CALLS_PER_COEFFICIENT',
+    'MAX_WRITE_RATE_HZ',
+    'MAX_READ_RATE_HZ',
+    'BATCH_WRITES',
+    'PHYSICAL_MAX_VELOCITY_MPS',
+    'PHYSICAL_MIN_VELOCITY_MPS',
+    'PHYSICAL_MAX_ANGLE_RAD',
+    'PHYSICAL_MIN_ANGLE_RAD',
+    'PHYSICAL_MAX_DISTANCE_M',
+    'PHYSICAL_MIN_DISTANCE_M',
+)
+
+
+# Per-coefficient validation messages, in the order _collect_warnings() checks them
+_COEFFICIENT_CHECK_MESSAGES = (
+    "min_value must be < max_value",
+    "default_value outside valid range",
+    "initial_step_size must be positive",
+    "step_decay_rate must be in (0, 1]",
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_toggles(toggles_file: str, mtime_ns) -> configparser.ConfigParser:
+    """
+    Parse TUNER_TOGGLES.ini, cached per (path, modification time).
+    
+    The returned parser is shared between TunerConfig instances and must
+    only be read from. A missing file (mtime_ns None) gives an empty parser,
+    same as ConfigParser.read().
+    """
+    parser = configparser.ConfigParser()
+    if mtime_ns is not None:
+        with open(toggles_file, 'r', encoding='utf-8') as f:
+            parser.read_file(f, toggles_file)
+    return parser
+
+
+@dataclass(frozen=True)
+class _CoefficientRegistry:
+    """Parsed contents of COEFFICIENT_TUNING.py (shared, read-only)."""
+    
+    tuning_order: tuple
+    coefficients: MappingProxyType  # name -> CoefficientConfig template
+    settings: MappingProxyType      # name -> value for _COEFFICIENT_SETTINGS
+
+
+@functools.lru_cache(maxsize=4)
+def _load_coefficient_registry(coeff_file: str, mtime_ns: int) -> _CoefficientRegistry:
+    """
+    Execute COEFFICIENT_TUNING.py and build CoefficientConfig templates.
+    
+    Cached per (path, modification time), so the file is only compiled and
+    run once per process unless it is edited while the program is running.
+    
+    Args:
+        coeff_file: Path to COEFFICIENT_TUNING.py
+        mtime_ns: Modification time of the file (cache key only)
+        
+    Returns:
+        _CoefficientRegistry with the tuning order, templates and settings
+    """
+    # Load as module
+    spec = importlib.util.spec_from_file_location("coeff_config", coeff_file)
+    coeff_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(coeff_module)
+    
+    # Convert coefficient dicts to CoefficientConfig templates. Names and NT
+    # keys are interned here, once per load, so the name used as the dict key,
+    # coeff.name and the TUNING_ORDER entries are the same object and lookups
+    # compare by identity
+    coefficients = {}
+    for name, cfg in coeff_module.COEFFICIENTS.items():
+        name = sys.intern(name)
+        coefficients[name] = CoefficientConfig(
+            name=name,
+            default_value=cfg['default_value'],
+            min_value=cfg['min_value'],
+            max_value=cfg['max_value'],
+            initial_step_size=cfg['initial_step_size'],
+            step_decay_rate=cfg['step_decay_rate'],
+            is_integer=cfg['is_integer'],
+            enabled=cfg['enabled'],
+            nt_key=sys.intern(cfg['nt_key']) if cfg['nt_key'] else cfg['nt_key'],
+            # Per-coefficient autotune settings (default to global if not specified)
+            autotune_override=cfg.get('autotune_override', False),
+            autotune_enabled=cfg.get('autotune_enabled', False),
+            autotune_shot_threshold=cfg.get('autotune_shot_threshold', 10),
+            # Per-coefficient auto-advance settings
+            auto_advance_override=cfg.get('auto_advance_override', False),
+            auto_advance_on_success=cfg.get('auto_advance_on_success', False),
+            auto_advance_shot_threshold=cfg.get('auto_advance_shot_threshold', 10),
+        )
+    
+    return _CoefficientRegistry(
+        tuning_order=tuple(sys.intern(name) for name in coeff_module.TUNING_ORDER),
+        coefficients=MappingProxyType(coefficients),
+        settings=MappingProxyType({key: getattr(coeff_module, key) for key in _COEFFICIENT_SETTINGS}),
+    )
+
+
 class TunerConfig:
     """
     Global configuration for the Bayesian tuner system.
@@ -169,7 +350,7 @@ class TunerConfig:
         AUTOTUNE_SHOT_THRESHOLD (int): Number of shots to collect before 
                                         automatic optimization (sample size)
         COEFFICIENTS (dict): Map of coefficient names to CoefficientConfig objects
-        TUNING_ORDER (list): Order in which to optimize coefficients
+        TUNING_ORDER (tuple): Order in which to optimize coefficients
     """
     
     def __init__(self):
@@ -204,8 +385,12 @@ class TunerConfig:
         parent_dir = os.path.dirname(module_dir)
         toggles_file = os.path.join(parent_dir, "config", "TUNER_TOGGLES.ini")
         
-        config = configparser.ConfigParser()
-        config.read(toggles_file)
+        # Only re-parsed when the file changes on disk
+        try:
+            mtime_ns = os.stat(toggles_file).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        config = _read_toggles(toggles_file, mtime_ns)
         
         # ── Master Switch ──
         self.TUNER_ENABLED = config.getboolean('main_controls', 'tuner_enabled', fallback=True)
@@ -237,53 +422,38 @@ class TunerConfig:
         parent_dir = os.path.dirname(module_dir)
         coeff_file = os.path.join(parent_dir, "config", "COEFFICIENT_TUNING.py")
         
-        # Load as module
-        spec = importlib.util.spec_from_file_location("coeff_config", coeff_file)
-        coeff_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(coeff_module)
-        
-        # Load tuning order
-        self.TUNING_ORDER = coeff_module.TUNING_ORDER
-        
-        # Convert coefficient dicts to CoefficientConfig objects
-        self.COEFFICIENTS = {}
-        for name, cfg in coeff_module.COEFFICIENTS.items():
-            self.COEFFICIENTS[name] = CoefficientConfig(
-                name=name,
-                default_value=cfg['default_value'],
-                min_value=cfg['min_value'],
-                max_value=cfg['max_value'],
-                initial_step_size=cfg['initial_step_size'],
-                step_decay_rate=cfg['step_decay_rate'],
-                is_integer=cfg['is_integer'],
-                enabled=cfg['enabled'],
-                nt_key=cfg['nt_key'],
-                # Per-coefficient autotune settings (default to global if not specified)
-                autotune_override=cfg.get('autotune_override', False),
-                autotune_enabled=cfg.get('autotune_enabled', False),
-                autotune_shot_threshold=cfg.get('autotune_shot_threshold', 10),
-                # Per-coefficient auto-advance settings
-                auto_advance_override=cfg.get('auto_advance_override', False),
-                auto_advance_on_success=cfg.get('auto_advance_on_success', False),
-                auto_advance_shot_threshold=cfg.get('auto_advance_shot_threshold', 10),
-            )
+        # The file is only executed when it changes on disk; otherwise the
+        # cached registry is reused and we just stamp out fresh copies.
+        registry = _load_coefficient_registry(coeff_file, os.stat(coeff_file).st_mtime_ns)
+        
+        # Load tuning order (immutable, so the registry's tuple is shared)
+        self.TUNING_ORDER = registry.tuning_order
+        
+        # Copy the prebuilt CoefficientConfig templates so runtime edits
+        # (e.g. dashboard threshold overrides) never leak between configs
+        self.COEFFICIENTS = {
+            name: replace(template)
+            for name, template in registry.coefficients.items()
+        }
+        
+        settings = registry.settings
         
         # Load optimization settings
-        self.N_INITIAL_POINTS = coeff_module.N_INITIAL_POINTS
-        self.N_CALLS_PER_COEFFICIENT = coeff_module.N_CALLS_PER_COEFFICIENT
+        self.N_INITIAL_POINTS = settings['N_INITIAL_POINTS']
+        self.N_CALLS_PER_COEFFICIENT = settings['N_CALLS_PER_COEFFICIENT']
         
         # Load RoboRIO protection settings
-        self.MAX_NT_WRITE_RATE_HZ = coeff_module.MAX_WRITE_RATE_HZ
-        self.MAX_NT_READ_RATE_HZ = coeff_module.MAX_READ_RATE_HZ
-        self.NT_BATCH_WRITES = coeff_module.BATCH_WRITES
+        self.MAX_NT_WRITE_RATE_HZ = settings['MAX_WRITE_RATE_HZ']
+        self.MAX_NT_READ_RATE_HZ = settings['MAX_READ_RATE_HZ']
+        self.NT_BATCH_WRITES = settings['BATCH_WRITES']
         
         # Load physical limits
-        self.PHYSICAL_MAX_VELOCITY_MPS = coeff_module.PHYSICAL_MAX_VELOCITY_MPS
-        self.PHYSICAL_MIN_VELOCITY_MPS = coeff_module.PHYSICAL_MIN_VELOCITY_MPS
-        self.PHYSICAL_MAX_ANGLE_RAD = coeff_module.PHYSICAL_MAX_ANGLE_RAD
-        self.PHYSICAL_MIN_ANGLE_RAD = coeff_module.PHYSICAL_MIN_ANGLE_RAD
-        self.PHYSICAL_MAX_DISTANCE_M = coeff_module.PHYSICAL_MAX_DISTANCE_M
-        self.PHYSICAL_MIN_DISTANCE_M = coeff_module.PHYSICAL_MIN_DISTANCE_M
+        self.PHYSICAL_MAX_VELOCITY_MPS = settings['PHYSICAL_MAX_VELOCITY_MPS']
+        self.PHYSICAL_MIN_VELOCITY_MPS = settings['PHYSICAL_MIN_VELOCITY_MPS']
+        self.PHYSICAL_MAX_ANGLE_RAD = settings['PHYSICAL_MAX_ANGLE_RAD']
+        self.PHYSICAL_MIN_ANGLE_RAD = settings['PHYSICAL_MIN_ANGLE_RAD']
+        self.PHYSICAL_MAX_DISTANCE_M = settings['PHYSICAL_MAX_DISTANCE_M']
+        self.PHYSICAL_MIN_DISTANCE_M = settings['PHYSICAL_MIN_DISTANCE_M']
     
     def _initialize_constants(self):
         """Initialize constants that don't come from config files."""
@@ -304,6 +474,12 @@ class TunerConfig:
         
         # Bayesian optimization settings
         self.ACQUISITION_FUNCTION = "EI"  # Expected Improvement
+        self.INITIAL_POINT_GENERATOR = "lhs"  # Stratified Latin hypercube warm-up instead of uniform random
+        self.SUGGESTION_BATCH_SIZE = 1  # Points drawn per GP fit (constant-liar batch; 0 = MIN_VALID_SHOTS_BEFORE_UPDATE)
+        self.CONTINUOUS_ACQUISITION_GRID_POINTS = 0  # >1: score continuous coefficients on a dense EI grid
+        self.SHARE_OBSERVATIONS_ACROSS_COEFFICIENTS = False  # Seed a re-tuned coefficient's GP with the values earlier rounds tried
+        self.ACQUISITION_N_JOBS = 1  # Worker processes for the L-BFGS acquisition restarts (-1 = all cores)
+        self.GP_MAX_OBSERVATIONS = 50  # Sliding window of points the GP is fit on (0 = keep all)
         
         # Safety and validation
         self.MIN_VALID_SHOTS_BEFORE_UPDATE = 3
@@ -314,6 +490,8 @@ class TunerConfig:
         self.LOG_DIRECTORY = "./tuner_logs"
         self.LOG_FILENAME_PREFIX = "bayesian_tuner"
         self.LOG_TO_CONSOLE = True
+        self.LOG_CSV = True  # Human-readable shot log (.csv)
+        self.LOG_BINARY = False  # Compact shot log (.bin), decode with scripts/bin2csv.py
         
         # Threading configuration
         self.TUNER_UPDATE_RATE_HZ = 10.0  # How often to check for new data
@@ -323,6 +501,19 @@ class TunerConfig:
         self.STEP_SIZE_DECAY_ENABLED = True
         self.MIN_STEP_SIZE_RATIO = 0.1  # Minimum step size as ratio of initial
     
+    @property
+    def TUNING_ORDER(self) -> Tuple[str, ...]:
+        """Coefficient names in the order they are tuned."""
+        return self._tuning_order
+    
+    @TUNING_ORDER.setter
+    def TUNING_ORDER(self, order):
+        # Stored as a tuple, with a frozenset alongside for membership checks
+        self._tuning_order = tuple(order)
+        self._tuning_order_set = frozenset(self._tuning_order)
+        # The cached warnings depend on the order
+        self.__dict__.pop('validation_warnings', None)
+    
     def get_enabled_coefficients_in_order(self) -> List[CoefficientConfig]:
         """Get list of enabled coefficients in tuning order."""
         return [
@@ -331,19 +522,51 @@ class TunerConfig:
             if name in self.COEFFICIENTS and self.COEFFICIENTS[name].enabled
         ]
     
+    @functools.cached_property
+    def validation_warnings(self) -> Tuple[str, ...]:
+        """
+        Configuration warnings, computed once and cached.
+        
+        Assigning TUNING_ORDER and copy() drop the cache. After editing
+        coefficients in place, call validate_config() to re-validate and
+        refresh the cached tuple.
+        """
+        return tuple(self._collect_warnings())
+    
     def validate_config(self) -> List[str]:
         """
-        Validate configuration and return list of warnings.
+        Validate configuration and return list of warnings (refreshes the cache).
         
         Returns:
             List of warning messages (empty if no issues)
         """
+        self.__dict__.pop('validation_warnings', None)
+        return list(self.validation_warnings)
+    
+    def copy(self) -> 'TunerConfig':
+        """
+        Copy this config without re-reading the config files.
+        
+        Settings are plain values and TUNING_ORDER is a tuple, so they are
+        shared; each coefficient gets its own copy so edits stay local.
+        The cached warnings are dropped and rebuilt on first use.
+        
+        Returns:
+            New TunerConfig with the same settings
+        """
+        new = copy.copy(self)
+        new.COEFFICIENTS = {name: replace(coeff) for name, coeff in self.COEFFICIENTS.items()}
+        new.__dict__.pop('validation_warnings', None)
+        return new
+    
+    def _collect_warnings(self) -> List[str]:
+        """Run all configuration checks and return the warning messages."""
         warnings = []
         
         # Check that enabled coefficients are in tuning order
         enabled_coeffs = [name for name, cfg in self.COEFFICIENTS.items() if cfg.enabled]
         for name in enabled_coeffs:
-            if name not in self.TUNING_ORDER:
+            if name not in self._tuning_order_set:
                 warnings.append(f"Enabled coefficient '{name}' not in TUNING_ORDER")
         
         # Check for coefficients in tuning order that don't exist
@@ -351,19 +574,27 @@ class TunerConfig:
             if name not in self.COEFFICIENTS:
                 warnings.append(f"Coefficient '{name}' in TUNING_ORDER but not defined")
         
-        # Validate coefficient configurations
-        for name, coeff in self.COEFFICIENTS.items():
-            if coeff.min_value >= coeff.max_value:
-                warnings.append(f"{name}: min_value must be < max_value")
-            
-            if coeff.default_value < coeff.min_value or coeff.default_value > coeff.max_value:
-                warnings.append(f"{name}: default_value outside valid range")
-            
-            if coeff.initial_step_size <= 0:
-                warnings.append(f"{name}: initial_step_size must be positive")
-            
-            if not 0 < coeff.step_decay_rate <= 1.0:
-                warnings.append(f"{name}: step_decay_rate must be in (0, 1]")
+        # Validate coefficient configurations (all coefficients checked at once,
+        # messages only built for the ones that fail)
+        names = list(self.COEFFICIENTS)
+        coeffs = list(self.COEFFICIENTS.values())
+        n = len(coeffs)
+        mins = np.fromiter((c.min_value for c in coeffs), dtype=np.float64, count=n)
+        maxs = np.fromiter((c.max_value for c in coeffs), dtype=np.float64, count=n)
+        defaults = np.fromiter((c.default_value for c in coeffs), dtype=np.float64, count=n)
+        steps = np.fromiter((c.initial_step_size for c in coeffs), dtype=np.float64, count=n)
+        decays = np.fromiter((c.step_decay_rate for c in coeffs), dtype=np.float64, count=n)
+        
+        failed = np.column_stack((
+            mins >= maxs,
+            ~((defaults >= mins) & (defaults <= maxs)),  # also catches NaN
+            steps <= 0,
+            ~((decays > 0) & (decays <= 1.0)),
+        ))
+        for i in np.flatnonzero(failed.any(axis=1)):
+            for check, message in zip(failed[i], _COEFFICIENT_CHECK_MESSAGES):
+                if check:
+                    warnings.append(f"{names[i]}: {message}")
         
         # Validate physical limits make sense
         if self.PHYSICAL_MIN_VELOCITY_MPS >= self.PHYSICAL_MAX_VELOCITY_MPS:
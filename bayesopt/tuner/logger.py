@@ -4,6 +4,12 @@ Data logging module for the Bayesian Tuner.
 This module handles logging of all tuning data to CSV files for offline analysis.
 Logs shot data, coefficient values, step sizes, and NT connection status.
 
+Shots can also be written to a compact binary log (.bin, see LOG_BINARY in
+TunerConfig). Use read_binary_log() or scripts/bin2csv.py to decode it.
+
+System events (START, STOP, STATISTICS, ...) go to a separate
+<prefix>_<timestamp>.events.jsonl file, one JSON object per line.
+
 Also logs coefficient combinations with timestamps to track what values were
 used together and when they were last modified.
 """
@@ -11,23 +17,159 @@ used together and when they were last modified.
 import os
 import csv
 import json
+import math
+import time
+import struct
+import operator
 import logging
+import functools
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
 from pathlib import Path
 
 
 logger = logging.getLogger(__name__)
 
 
+# ── Binary shot log format ──
+# File = BINARY_LOG_MAGIC, uint32 header length, JSON header, then fixed-size
+# records. The header lists the record fields and struct format, so the file
+# is self-describing. Missing floats are NaN; shot_hit is -1 without shot data.
+# shot_distance ... projectile_area_m2 follow TunerLogger._SHOT_FIELDS order.
+BINARY_LOG_MAGIC = b"BAYESOPT-SHOTLOG\x01"
+_BINARY_HEADER_LENGTH = struct.Struct('<I')
+_BINARY_BASE_FIELDS = (
+    ('timestamp_ns', 'Q'),
+    ('session_time_s', 'd'),
+    ('coefficient_index', 'h'),  # Index into header "coefficients", -1 if unknown
+    ('coefficient_value', 'd'),
+    ('step_size', 'd'),
+    ('iteration', 'i'),
+    ('shot_hit', 'b'),
+    ('shot_distance', 'd'),
+    ('shot_angle_rad', 'd'),
+    ('shot_velocity_mps', 'd'),
+    ('shot_yaw_rad', 'd'),
+    ('target_height_m', 'd'),
+    ('launch_height_m', 'd'),
+    ('drag_coefficient_used', 'd'),
+    ('air_density_used', 'd'),
+    ('projectile_mass_kg', 'd'),
+    ('projectile_area_m2', 'd'),
+    ('nt_connected', '?'),
+    ('match_mode', '?'),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path: str):
+    """Create a log directory (at most once per absolute path per process)."""
+    Path(path).mkdir(parents=True, exist_ok=True)
+
+
+def _open_log_file(path: Path, *args, **kwargs):
+    """
+    open() a log file, re-creating its directory if it was removed after
+    _ensure_dir() cached it.
+    """
+    try:
+        return open(path, *args, **kwargs)
+    except FileNotFoundError:
+        _ensure_dir.cache_clear()
+        _ensure_dir(os.path.abspath(path.parent))
+        return open(path, *args, **kwargs)
+
+
+def read_binary_log(path) -> Iterator[Dict]:
+    """
+    Decode a binary shot log written by TunerLogger.
+    
+    Args:
+        path: Path to a .bin shot log
+        
+    Yields:
+        One dict per shot, keyed by the field names from the file header
+        (coefficient values appear as "coeff:<name>")
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(BINARY_LOG_MAGIC)) != BINARY_LOG_MAGIC:
+            raise ValueError(f"{path} is not a binary shot log")
+        (header_length,) = _BINARY_HEADER_LENGTH.unpack(f.read(_BINARY_HEADER_LENGTH.size))
+        header = json.loads(f.read(header_length).decode('utf-8'))
+        
+        record = struct.Struct(header['format'])
+        fields = header['fields']
+        while True:
+            chunk = f.read(record.size)
+            if len(chunk) < record.size:
+                break  # EOF (or a partial record from an unclean shutdown)
+            yield dict(zip(fields, record.unpack(chunk)))
+
+
 class TunerLogger:
     """
     CSV logger for tuner data.
     
     Logs every shot with coefficient values, step sizes, hit/miss results,
     and system status.
+    
+    Shot rows and binary records are buffered and written in batches (every
+    _FLUSH_EVERY_N shots or _FLUSH_EVERY_S seconds, whichever comes first).
+    The age check runs on each log_shot() and on flush_if_due(), which the
+    tuning loop calls every tick so shots are written even when shooting
+    pauses. flush(), log_event()
+    and close() write everything out immediately. Events are written to
+    their own JSONL file as they happen.
     """
     
+    # Shot row batching
+    _FLUSH_EVERY_N = 32  # Shots buffered before writing
+    _FLUSH_EVERY_S = 1.0  # Max seconds a row may sit in the buffer
+    _FILE_BUFFER_BYTES = 1 << 16  # 64KB userspace file buffer
+    
+    # CSV header row - captures ALL robot state at shot time
+    _CSV_HEADERS = (
+        'timestamp',
+        'session_time_s',
+        'coefficient_name',
+        'coefficient_value',
+        'step_size',
+        'iteration',
+        'shot_hit',
+        'shot_distance',
+        'shot_angle_rad',
+        'shot_velocity_mps',
+        'shot_yaw_rad',
+        'target_height_m',
+        'launch_height_m',
+        'drag_coefficient_used',
+        'air_density_used',
+        'projectile_mass_kg',
+        'projectile_area_m2',
+        'nt_connected',
+        'match_mode',
+        'tuner_status',
+        'all_coefficients',
+    )
+    _CSV_HEADER_LINE = ",".join(_CSV_HEADERS) + "\r\n"  # csv.writer's line terminator
+    
+    # ShotData columns written after shot_hit: (attribute, format spec, blank when zero)
+    # distance/angle/velocity of 0 mean "not reported" and are left blank
+    _SHOT_FIELDS = (
+        ('distance', '.3f', True),
+        ('angle', '.6f', True),
+        ('velocity', '.3f', True),
+        ('yaw', '.6f', False),
+        ('target_height', '.3f', False),
+        ('launch_height', '.3f', False),
+        ('drag_coefficient', '.6f', False),
+        ('air_density', '.6f', False),
+        ('projectile_mass', '.6f', False),
+        ('projectile_area', '.6f', False),
+    )
+    # Reads (hit, *_SHOT_FIELDS values) from a ShotData in one call
+    _shot_values = operator.attrgetter('hit', *[name for name, _, _ in _SHOT_FIELDS])
+    
     def __init__(self, config):
         """
         Initialize tuner logger.
@@ -39,21 +181,50 @@ class TunerLogger:
         self.log_directory = Path(config.LOG_DIRECTORY)
         self.csv_file = None
         self.csv_writer = None
+        self.bin_file = None
+        self._bin_handle = None
+        self.events_file = None
+        self._events_handle = None
         self.session_start_time = datetime.now()
+        # YYYYMMDD_HHMMSS stamp shared by this session's file names
+        # (built from the fields directly - no locale-dependent strftime)
+        t = self.session_start_time
+        self._session_id = f"{t.year:04d}{t.month:02d}{t.day:02d}_{t.hour:02d}{t.minute:02d}{t.second:02d}"
+        # Monotonic reference for the session_time_s column
+        self._session_start_monotonic = time.monotonic()
+        
+        # "k1=%.6f; k2=%.6f" template for the all_coefficients column,
+        # rebuilt only when the set of coefficient names changes
+        self._coeff_keys = None
+        self._coeff_fmt = ""
+        
+        # Pending shot rows (written by flush())
+        self._row_buffer = []
+        # Shots logged (CSV and/or binary) since the last flush()
+        self._pending_shots = 0
+        self._last_flush = time.monotonic()
         
         # Create log directory if it doesn't exist
-        self.log_directory.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(os.path.abspath(self.log_directory))
         
         # Initialize CSV log file
-        self._initialize_csv_log()
+        self._file_handle = None
+        if config.LOG_CSV:
+            self._initialize_csv_log()
+        
+        # Initialize binary shot log
+        if config.LOG_BINARY:
+            self._initialize_binary_log()
         
-        logger.info(f"Logger initialized, writing to {self.csv_file}")
+        # Initialize event log
+        self._initialize_events_log()
+        
+        logger.info("Logger initialized, writing to %s", self.get_log_file_path())
     
     def _initialize_csv_log(self):
         """Create and initialize CSV log file."""
         # Generate filename with timestamp
-        timestamp = self.session_start_time.strftime("%Y%m%d_%H%M%S")
-        filename = f"{self.config.LOG_FILENAME_PREFIX}_{timestamp}.csv"
+        filename = f"{self.config.LOG_FILENAME_PREFIX}_{self._session_id}.csv"
         self.csv_file = self.log_directory / filename
         
         # Initialize file handle to None in case of early failure
@@ -61,46 +232,97 @@ class TunerLogger:
         
         # Create CSV file with headers
         try:
-            file_handle = open(self.csv_file, 'w', newline='')
+            file_handle = _open_log_file(self.csv_file, 'w', newline='', encoding='utf-8',
+                                         buffering=self._FILE_BUFFER_BYTES)
             self.csv_writer = csv.writer(file_handle)
             
-            # Write header row - captures ALL robot state at shot time
-            headers = [
-                'timestamp',
-                'session_time_s',
-                'coefficient_name',
-                'coefficient_value',
-                'step_size',
-                'iteration',
-                'shot_hit',
-                'shot_distance',
-                'shot_angle_rad',
-                'shot_velocity_mps',
-                'shot_yaw_rad',
-                'target_height_m',
-                'launch_height_m',
-                'drag_coefficient_used',
-                'air_density_used',
-                'projectile_mass_kg',
-                'projectile_area_m2',
-                'nt_connected',
-                'match_mode',
-                'tuner_status',
-                'all_coefficients',
-            ]
-            self.csv_writer.writerow(headers)
+            # Static header, no quoting needed - written directly
+            file_handle.write(self._CSV_HEADER_LINE)
+            file_handle.flush()
             
             # Store file handle for later closing
             self._file_handle = file_handle
             
-            logger.info(f"Created CSV log: {self.csv_file}")
+            logger.info("Created CSV log: %s", self.csv_file)
             
         except Exception as e:
-            logger.error(f"Failed to create CSV log: {e}")
+            logger.error("Failed to create CSV log: %s", e)
             self.csv_writer = None
             # Ensure file handle is None if initialization failed
             self._file_handle = None
     
+    def _initialize_events_log(self):
+        """Create the JSONL event log (line buffered, tail-friendly)."""
+        self.events_file = self.log_directory / f"{self.config.LOG_FILENAME_PREFIX}_{self._session_id}.events.jsonl"
+        
+        try:
+            self._events_handle = _open_log_file(self.events_file, 'w', encoding='utf-8', buffering=1)
+        except Exception as e:
+            logger.error("Failed to create event log: %s", e)
+            self._events_handle = None
+    
+    def _initialize_binary_log(self):
+        """Create the binary shot log and write its self-describing header."""
+        self.bin_file = self.log_directory / f"{self.config.LOG_FILENAME_PREFIX}_{self._session_id}.bin"
+        
+        # Every record carries the value of each configured coefficient
+        self._bin_coefficients = tuple(self.config.COEFFICIENTS)
+        self._bin_coefficient_index = {name: i for i, name in enumerate(self._bin_coefficients)}
+        
+        fields = [name for name, _ in _BINARY_BASE_FIELDS]
+        fields.extend(f"coeff:{name}" for name in self._bin_coefficients)
+        fmt = '<' + ''.join(code for _, code in _BINARY_BASE_FIELDS) + 'd' * len(self._bin_coefficients)
+        self._bin_record = struct.Struct(fmt)
+        
+        try:
+            bin_handle = _open_log_file(self.bin_file, 'wb', buffering=self._FILE_BUFFER_BYTES)
+            header = json.dumps({
+                'fields': fields,
+                'format': fmt,
+                'coefficients': list(self._bin_coefficients),
+                'session_start': self.session_start_time.isoformat(),
+            }).encode('utf-8')
+            bin_handle.write(BINARY_LOG_MAGIC)
+            bin_handle.write(_BINARY_HEADER_LENGTH.pack(len(header)))
+            bin_handle.write(header)
+            bin_handle.flush()
+            
+            self._bin_handle = bin_handle
+            logger.info("Created binary log: %s", self.bin_file)
+            
+        except Exception as e:
+            logger.error("Failed to create binary log: %s", e)
+            self._bin_handle = None
+    
+    def _write_binary_shot(self, timestamp_ns, session_time, coefficient_name, coefficient_value,
+                           step_size, iteration, shot_data, nt_connected, match_mode,
+                           all_coefficient_values):
+        """Pack one shot into the binary log (buffered, written by flush())."""
+        nan = math.nan
+        if shot_data is not None:
+            hit, *shot_values = self._shot_values(shot_data)
+            hit = 1 if hit else 0
+            shot_values = [nan if v is None else v for v in shot_values]
+        else:
+            hit = -1
+            shot_values = [nan] * len(self._SHOT_FIELDS)
+        
+        coeff_values = [all_coefficient_values.get(name) for name in self._bin_coefficients]
+        
+        self._bin_handle.write(self._bin_record.pack(
+            timestamp_ns,
+            session_time,
+            self._bin_coefficient_index.get(coefficient_name, -1),
+            nan if coefficient_value is None else coefficient_value,
+            nan if step_size is None else step_size,
+            iteration or 0,
+            hit,
+            *shot_values,
+            bool(nt_connected),
+            bool(match_mode),
+            *[nan if v is None else v for v in coeff_values],
+        ))
+    
     def log_shot(
         self,
         coefficient_name: str,
@@ -127,91 +349,126 @@ class TunerLogger:
             tuner_status: Current tuner status string
             all_coefficient_values: Dict of all coefficient values
         """
-        if not self.csv_writer:
+        if not self.csv_writer and not self._bin_handle:
             logger.warning("CSV writer not initialized, cannot log")
             return
         
         try:
-            current_time = datetime.now()
-            session_time = (current_time - self.session_start_time).total_seconds()
+            # Raw epoch time; converted to ISO text in flush()
+            timestamp_ns = time.time_ns()
+            session_time = time.monotonic() - self._session_start_monotonic
             
-            # Format all coefficients as JSON-like string
-            coeff_str = "; ".join([f"{k}={v:.6f}" for k, v in all_coefficient_values.items()])
+            if self._bin_handle:
+                self._write_binary_shot(
+                    timestamp_ns, session_time, coefficient_name, coefficient_value,
+                    step_size, iteration, shot_data, nt_connected, match_mode,
+                    all_coefficient_values,
+                )
             
-            # Create row with ALL captured data
-            row = [
-                current_time.isoformat(),
-                f"{session_time:.3f}",
-                coefficient_name,
-                f"{coefficient_value:.6f}",
-                f"{step_size:.6f}",
-                iteration,
-                shot_data.hit if shot_data else '',
-                f"{shot_data.distance:.3f}" if shot_data and shot_data.distance else '',
-                f"{shot_data.angle:.6f}" if shot_data and shot_data.angle else '',
-                f"{shot_data.velocity:.3f}" if shot_data and shot_data.velocity else '',
-                f"{shot_data.yaw:.6f}" if shot_data and hasattr(shot_data, 'yaw') else '',
-                f"{shot_data.target_height:.3f}" if shot_data and hasattr(shot_data, 'target_height') else '',
-                f"{shot_data.launch_height:.3f}" if shot_data and hasattr(shot_data, 'launch_height') else '',
-                f"{shot_data.drag_coefficient:.6f}" if shot_data and hasattr(shot_data, 'drag_coefficient') else '',
-                f"{shot_data.air_density:.6f}" if shot_data and hasattr(shot_data, 'air_density') else '',
-                f"{shot_data.projectile_mass:.6f}" if shot_data and hasattr(shot_data, 'projectile_mass') else '',
-                f"{shot_data.projectile_area:.6f}" if shot_data and hasattr(shot_data, 'projectile_area') else '',
-                nt_connected,
-                match_mode,
-                tuner_status,
-                coeff_str,
-            ]
+            if self.csv_writer:
+                # Format all coefficients as JSON-like string
+                coeff_str = self._format_coefficients(all_coefficient_values)
+                
+                # Create row with ALL captured data
+                row = [
+                    timestamp_ns / 1e9,
+                    f"{session_time:.3f}",
+                    coefficient_name,
+                    f"{coefficient_value:.6f}",
+                    f"{step_size:.6f}",
+                    iteration,
+                    *self._format_shot_columns(shot_data),
+                    nt_connected,
+                    match_mode,
+                    tuner_status,
+                    coeff_str,
+                ]
+                
+                # Buffer the row, write out in batches
+                self._row_buffer.append(row)
             
-            self.csv_writer.writerow(row)
-            self._file_handle.flush()  # Ensure data is written immediately
+            # Counted for both formats: a binary-only log has no buffered rows
+            self._pending_shots += 1
+            if self._pending_shots >= self._FLUSH_EVERY_N:
+                self.flush()
+            else:
+                self.flush_if_due()
             
-            logger.debug(f"Logged shot: {coefficient_name}={coefficient_value:.6f}, hit={shot_data.hit if shot_data else 'N/A'}")
+            logger.debug("Logged shot: %s=%.6f, hit=%s", coefficient_name, coefficient_value,
+                         shot_data.hit if shot_data is not None else 'N/A')
             
         except Exception as e:
-            logger.error(f"Error logging shot: {e}")
+            logger.error("Error logging shot: %s", e)
+    
+    def _format_coefficients(self, coefficient_values: Dict[str, float]) -> str:
+        """
+        Format coefficient values as "name=value; ..." with 6 decimals.
+        
+        Args:
+            coefficient_values: Dict of coefficient names to values
+            
+        Returns:
+            Formatted string for the all_coefficients column
+        """
+        keys = tuple(coefficient_values)
+        if keys != self._coeff_keys:
+            self._coeff_keys = keys
+            self._coeff_fmt = "; ".join(f"{str(k).replace('%', '%%')}=%.6f" for k in keys)
+        return self._coeff_fmt % tuple(coefficient_values.values())
+    
+    @classmethod
+    def _format_shot_columns(cls, shot_data) -> list:
+        """
+        Format the shot_hit ... projectile_area columns for a CSV row.
+        
+        Args:
+            shot_data: ShotData object (or None)
+            
+        Returns:
+            List of column values, blank where data is missing
+        """
+        if shot_data is None:
+            return [''] * (len(cls._SHOT_FIELDS) + 1)
+        
+        hit, *values = cls._shot_values(shot_data)
+        columns = [hit]
+        for value, (_, spec, blank_if_zero) in zip(values, cls._SHOT_FIELDS):
+            if value is None or (blank_if_zero and not value):
+                columns.append('')
+            else:
+                columns.append(format(value, spec))
+        return columns
     
     def log_event(self, event_type: str, message: str, data: Optional[Dict] = None):
         """
-        Log a system event.
+        Log a system event to the JSONL event log.
         
         Args:
             event_type: Type of event (e.g., 'START', 'STOP', 'ERROR')
             message: Event message
             data: Optional additional data
         """
-        if not self.csv_writer:
+        if not self._events_handle:
             return
         
         try:
-            current_time = datetime.now()
-            session_time = (current_time - self.session_start_time).total_seconds()
-            
-            # Log as special row with event info
-            row = [
-                current_time.isoformat(),
-                f"{session_time:.3f}",
-                f"EVENT_{event_type}",
-                '',  # coefficient_value
-                '',  # step_size
-                '',  # iteration
-                '',  # shot_hit
-                '',  # shot_distance
-                '',  # shot_angle
-                '',  # shot_velocity
-                '',  # nt_connected
-                '',  # match_mode
-                message,
-                str(data) if data else '',
-            ]
+            event = {
+                'ts': datetime.now().isoformat(),
+                't': round(time.monotonic() - self._session_start_monotonic, 3),
+                'type': event_type,
+                'msg': message,
+                'data': data,
+            }
+            self._events_handle.write(json.dumps(event, default=str) + '\n')
             
-            self.csv_writer.writerow(row)
-            self._file_handle.flush()
+            # Keep shot rows ahead of (or alongside) the events that follow them
+            if self._pending_shots:
+                self.flush()
             
-            logger.info(f"Logged event: {event_type} - {message}")
+            logger.info("Logged event: %s - %s", event_type, message)
             
         except Exception as e:
-            logger.error(f"Error logging event: {e}")
+            logger.error("Error logging event: %s", e)
     
     def log_statistics(self, statistics: Dict):
         """
@@ -222,15 +479,66 @@ class TunerLogger:
         """
         self.log_event('STATISTICS', 'Optimization statistics', statistics)
     
+    def flush_if_due(self, now: Optional[float] = None):
+        """
+        Flush if logged shots have waited _FLUSH_EVERY_S seconds or more.
+        
+        Args:
+            now: time.monotonic() reading to compare against (sampled if None)
+        """
+        if not self._pending_shots:
+            return
+        if now is None:
+            now = time.monotonic()
+        if now - self._last_flush >= self._FLUSH_EVERY_S:
+            self.flush()
+    
+    def flush(self):
+        """Write any buffered rows to the CSV file (and flush the binary log)."""
+        if self._bin_handle:
+            self._bin_handle.flush()
+        self._last_flush = time.monotonic()
+        self._pending_shots = 0
+        if not self._file_handle:
+            return
+        if self._row_buffer:
+            rows = self._row_buffer
+            self._row_buffer = []
+            # Timestamps are only turned into ISO strings when written out
+            for row in rows:
+                row[0] = datetime.fromtimestamp(row[0]).isoformat()
+            self.csv_writer.writerows(rows)
+        self._file_handle.flush()
+    
     def close(self):
-        """Close the log file."""
+        """Close the log files (buffered rows are written first)."""
+        try:
+            if getattr(self, '_events_handle', None):
+                self._events_handle.close()
+                self._events_handle = None
+        except Exception as e:
+            logger.error("Error closing event log file: %s", e)
+        
+        try:
+            if getattr(self, '_bin_handle', None):
+                self._bin_handle.close()
+                self._bin_handle = None
+                logger.info("Closed binary log file: %s", self.bin_file)
+        except Exception as e:
+            logger.error("Error closing binary log file: %s", e)
+        
         try:
             if hasattr(self, '_file_handle') and self._file_handle:
+                try:
+                    self.flush()
+                except Exception as e:
+                    logger.error("Error flushing log file: %s", e)
                 self._file_handle.close()
                 self._file_handle = None  # Mark as closed to prevent double-close
-                logger.info(f"Closed log file: {self.csv_file}")
+                self.csv_writer = None
+                logger.info("Closed log file: %s", self.csv_file)
         except Exception as e:
-            logger.error(f"Error closing log file: {e}")
+            logger.error("Error closing log file: %s", e)
     
     def __enter__(self):
         """Context manager entry."""
@@ -254,9 +562,10 @@ class TunerLogger:
         Get path to current log file.
         
         Returns:
-            Path to log file or None if not initialized
+            Path to the CSV log (or the binary log if CSV logging is off),
+            None if not initialized
         """
-        return self.csv_file
+        return self.csv_file or self.bin_file
     
     def log_coefficient_combination(self, coefficient_values: Dict[str, float], event: str = "SNAPSHOT"):
         """
@@ -276,7 +585,7 @@ class TunerLogger:
         """
         try:
             # Create coefficient history file
-            history_file = self.log_directory / f"coefficient_history_{self.session_start_time.strftime('%Y%m%d')}.json"
+            history_file = self.log_directory / f"coefficient_history_{self._session_id[:8]}.json"
             
             # Load existing history or create new
             history = []
@@ -302,9 +611,9 @@ class TunerLogger:
             with open(history_file, 'w') as f:
                 json.dump(history, f, indent=2)
             
-            logger.debug(f"Logged coefficient combination: {event}")
+            logger.debug("Logged coefficient combination: %s", event)
         except Exception as e:
-            logger.error(f"Error logging coefficient combination: {e}")
+            logger.error("Error logging coefficient combination: %s", e)
     
     def log_coefficient_interaction(self, coeff1: str, coeff2: str, interaction_type: str, notes: str = ""):
         """
@@ -322,7 +631,7 @@ class TunerLogger:
             notes: Optional notes about the interaction
         """
         try:
-            interaction_file = self.log_directory / f"coefficient_interactions_{self.session_start_time.strftime('%Y%m%d')}.json"
+            interaction_file = self.log_directory / f"coefficient_interactions_{self._session_id[:8]}.json"
             
             # Load existing or create new
             interactions = []
@@ -348,9 +657,9 @@ class TunerLogger:
             with open(interaction_file, 'w') as f:
                 json.dump(interactions, f, indent=2)
             
-            logger.info(f"Logged coefficient interaction: {coeff1} <-> {coeff2} ({interaction_type})")
+            logger.info("Logged coefficient interaction: %s <-> %s (%s)", coeff1, coeff2, interaction_type)
         except Exception as e:
-            logger.error(f"Error logging coefficient interaction: {e}")
+            logger.error("Error logging coefficient interaction: %s", e)
     
     def get_last_used_coefficients(self) -> Optional[Dict[str, float]]:
         """
@@ -376,7 +685,7 @@ class TunerLogger:
             
             return None
         except Exception as e:
-            logger.error(f"Error reading coefficient history: {e}")
+            logger.error("Error reading coefficient history: %s", e)
             return None
     
     def __enter__(self):
@@ -20,39 +20,51 @@ import sys
 import time
 import signal
 
-# Add parent directory to path for imports
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Run as a plain script (python bayesopt/tuner/main.py) there is no package
+# context, so make the repo root importable once. `python -m` and installed
+# packages already resolve bayesopt.* and skip this.
+if not __package__:
+    from pathlib import Path
+    _REPO_ROOT = str(Path(__file__).resolve().parents[2])
+    if _REPO_ROOT not in sys.path:
+        sys.path.insert(0, _REPO_ROOT)
 
 from bayesopt.tuner.config import TunerConfig
 from bayesopt.tuner.tuner import BayesianTunerCoordinator
 
 
+# Startup text, built once at import rather than on every call
+BANNER = f"""
+{"═" * 75}
+  BAYESIAN OPTIMIZATION TUNER
+  Running on your laptop - connecting to robot via NetworkTables
+{"═" * 75}
+"""
+
+DASHBOARD_INFO = """\
+Dashboard Controls at /Tuning/BayesianTuner/:
+┌─────────────────────────────┬─────────────────────────────────────────┐
+│ Control                     │ Description                             │
+├─────────────────────────────┼─────────────────────────────────────────┤
+│ TunerEnabled                │ Toggle entire system on/off             │
+│ RunOptimization             │ Manual trigger (when autotune OFF)      │
+│ SkipToNextCoefficient       │ Skip to next (when auto-advance OFF)    │
+│ ManualControl/              │ Manually adjust any coefficient         │
+│ FineTuning/                 │ Adjust aim bias (LEFT, RIGHT, etc.)     │
+│ Backtrack/                  │ Re-tune earlier coefficients            │
+│ CoefficientsLive/           │ View current vs default values          │
+└─────────────────────────────┴─────────────────────────────────────────┘
+"""
+
+
 def print_banner():
     """Print startup banner."""
-    print()
-    print("═" * 75)
-    print("  BAYESIAN OPTIMIZATION TUNER")
-    print("  Running on your laptop - connecting to robot via NetworkTables")
-    print("═" * 75)
-    print()
+    print(BANNER)
 
 
 def print_dashboard_info():
     """Print dashboard control information."""
-    print("Dashboard Controls at /Tuning/BayesianTuner/:")
-    print("┌─────────────────────────────┬─────────────────────────────────────────┐")
-    print("│ Control                     │ Description                             │")
-    print("├─────────────────────────────┼─────────────────────────────────────────┤")
-    print("│ TunerEnabled                │ Toggle entire system on/off             │")
-    print("│ RunOptimization             │ Manual trigger (when autotune OFF)      │")
-    print("│ SkipToNextCoefficient       │ Skip to next (when auto-advance OFF)    │")
-    print("│ ManualControl/              │ Manually adjust any coefficient         │")
-    print("│ FineTuning/                 │ Adjust aim bias (LEFT, RIGHT, etc.)     │")
-    print("│ Backtrack/                  │ Re-tune earlier coefficients            │")
-    print("│ CoefficientsLive/           │ View current vs default values          │")
-    print("└─────────────────────────────┴─────────────────────────────────────────┘")
-    print()
+    print(DASHBOARD_INFO)
 
 
 def main():
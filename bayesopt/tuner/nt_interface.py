@@ -45,62 +45,169 @@ When autotune_enabled = True:
     ShotThreshold. The dashboard shows progress toward this threshold.
 """
 
+import sys
 import time
+import numbers
+import operator
+import functools
+import threading
+import contextlib
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 import logging
+import numpy as np
 
-try:
-    # Try pyntcore first (modern WPILib 2024+)
-    import ntcore
-    
-    class NetworkTables:
-        """Wrapper to provide pynetworktables-like API for pyntcore."""
-        _inst = None
-        
-        @staticmethod
-        def initialize(server=None):
-            NetworkTables._inst = ntcore.NetworkTableInstance.getDefault()
-            if server:
-                NetworkTables._inst.setServer(server)
-            NetworkTables._inst.startClient4("BayesOptTuner")
-        
-        @staticmethod
-        def isConnected():
-            if NetworkTables._inst is None:
-                return False
-            return NetworkTables._inst.isConnected()
-        
-        @staticmethod
-        def getTable(name):
-            if NetworkTables._inst is None:
-                return None
-            return NetworkTables._inst.getTable(name)
+ntcore = None  # Imported on first NetworkTables use (see _load_network_tables)
+
+
+class _NtcoreNetworkTables:
+    """Wrapper to provide pynetworktables-like API for pyntcore."""
+    _inst = None
+    
+    @staticmethod
+    def initialize(server=None):
+        inst = _NtcoreNetworkTables._inst = ntcore.NetworkTableInstance.getDefault()
+        if server:
+            inst.setServer(server)
+        inst.startClient4("BayesOptTuner")
+    
+    @staticmethod
+    def isConnected():
+        if _NtcoreNetworkTables._inst is None:
+            return False
+        return _NtcoreNetworkTables._inst.isConnected()
+    
+    @staticmethod
+    def getTable(name):
+        if _NtcoreNetworkTables._inst is None:
+            return None
+        return _NtcoreNetworkTables._inst.getTable(name)
+    
+    @staticmethod
+    def flush():
+        if _NtcoreNetworkTables._inst is not None:
+            _NtcoreNetworkTables._inst.flush()
+    
+    @staticmethod
+    def addConnectionListener(listener, immediateNotify=False):
+        """Call listener(connected, info) on connect/disconnect (pynetworktables signature)."""
+        def on_event(event):
+            listener(event.is_(ntcore.EventFlags.kConnected), event.data)
+        _NtcoreNetworkTables._inst.addConnectionListener(immediateNotify, on_event)
+    
+    @staticmethod
+    def addValueListener(entry, listener):
+        """Call listener(value) now and whenever the robot/dashboard changes entry."""
+        _NtcoreNetworkTables._inst.addListener(
+            entry,
+            ntcore.EventFlags.kImmediate | ntcore.EventFlags.kValueRemote,
+            lambda event: listener(event.data.value.value()),
+        )
+
+
+class _MissingNetworkTables:
+    """Backend used when no NetworkTables library is installed: every call fails loudly."""
+    
+    @staticmethod
+    def _unavailable(*args, **kwargs):
+        raise ImportError(
+            "No NetworkTables library installed (pip install pyntcore, "
+            "or pynetworktables for older setups)"
+        )
     
-except ImportError:
+    initialize = isConnected = getTable = flush = _unavailable
+    addConnectionListener = addValueListener = _unavailable
+
+
+def _load_network_tables():
+    """Import the NT backend: pyntcore (WPILib 2024+) first, then pynetworktables."""
+    global ntcore
+    try:
+        import ntcore
+        return _NtcoreNetworkTables
+    except ImportError:
+        pass
     try:
         # Fall back to pynetworktables (older API)
-        from networktables import NetworkTables
+        from networktables import NetworkTables as backend
+        return backend
     except ImportError:
-        # Provide a mock for testing without any NetworkTables library
-        class NetworkTables:
-            @staticmethod
-            def initialize(server=None):
-                pass
-            
-            @staticmethod
-            def isConnected():
-                return False
-            
-            @staticmethod
-            def getTable(name):
-                return None
+        return _MissingNetworkTables
+
+
+class _LazyNetworkTables:
+    """
+    Placeholder for NetworkTables until it is first used.
+    
+    The first attribute access imports the backend and rebinds the module's
+    NetworkTables global to it, so importing this module never pulls in the
+    NT bindings and later calls go straight to the backend. Attribute
+    writes/deletes are forwarded too, so patch('nt_interface.NetworkTables.x')
+    still reaches the real backend.
+    """
+    
+    def _resolve(self):
+        global NetworkTables
+        backend = _load_network_tables()
+        if NetworkTables is self:
+            NetworkTables = backend
+        return backend
+    
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+    
+    def __setattr__(self, name, value):
+        setattr(self._resolve(), name, value)
+    
+    def __delattr__(self, name):
+        delattr(self._resolve(), name)
+
+
+NetworkTables = _LazyNetworkTables()
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Shot data keys in the firing solver table and its "Solution" subtable
+_SHOT_KEYS = (
+    "ShotTimestamp", "Hit", "Distance", "TargetHeight", "LaunchHeight",
+    "DragCoefficient", "AirDensity", "ProjectileMass", "ProjectileArea",
+)
+_SOLUTION_KEYS = ("pitchRadians", "exitVelocity", "yawRadians")
+
+# Value read_shot_data() uses for each shot key the robot has not published
+_SHOT_DEFAULTS = {
+    "ShotTimestamp": 0.0, "Hit": False, "Distance": 0.0,
+    "TargetHeight": 0.0, "LaunchHeight": 0.0,
+    "DragCoefficient": 0.0, "AirDensity": 1.225,
+    "ProjectileMass": 0.0, "ProjectileArea": 0.0,
+    "pitchRadians": 0.0, "exitVelocity": 0.0, "yawRadians": 0.0,
+}
+
+# Dashboard buttons/toggles whose changes wake the tuning loop (besides ShotTimestamp)
+_WAKE_ENTRIES = (
+    ("/Tuning/BayesianTuner", "TunerEnabled"),
+    ("/Tuning/BayesianTuner", "RunOptimization"),
+    ("/Tuning/BayesianTuner", "SkipToNextCoefficient"),
+    ("/Tuning/BayesianTuner", "UpdateGlobalThreshold"),
+    ("/Tuning/BayesianTuner", "UpdateLocalThreshold"),
+    ("/Tuning/BayesianTuner/ManualControl", "ApplyManualValue"),
+    ("/Tuning/BayesianTuner/Backtrack", "TriggerBacktrack"),
+)
+
+# Reads all physical limits used by ShotData.is_valid() from a config in one call
+_PHYSICAL_LIMITS = operator.attrgetter(
+    'PHYSICAL_MIN_DISTANCE_M', 'PHYSICAL_MAX_DISTANCE_M',
+    'PHYSICAL_MIN_VELOCITY_MPS', 'PHYSICAL_MAX_VELOCITY_MPS',
+    'PHYSICAL_MIN_ANGLE_RAD', 'PHYSICAL_MAX_ANGLE_RAD',
+)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ShotData:
     """Container for shot data from NetworkTables."""
     
@@ -121,6 +228,25 @@ class ShotData:
     projectile_mass: float = 0.0
     projectile_area: float = 0.0
     
+    def __post_init__(self):
+        """
+        Coerce the validated fields once so is_valid() only checks bounds.
+        
+        Raises:
+            TypeError: If hit is not a bool/0/1 or a measurement is not a real number
+        """
+        if not isinstance(self.hit, bool):
+            if isinstance(self.hit, str) or self.hit not in (0, 1):
+                raise TypeError(f"ShotData.hit must be a bool, got {self.hit!r}")
+            self.hit = bool(self.hit)
+        
+        for name in ('distance', 'angle', 'velocity'):
+            value = getattr(self, name)
+            if type(value) is not float:
+                if not isinstance(value, numbers.Real):
+                    raise TypeError(f"ShotData.{name} must be a number, got {value!r}")
+                setattr(self, name, float(value))
+    
     def is_valid(self, config) -> bool:
         """
         Check if shot data is valid and within physical limits.
@@ -131,19 +257,33 @@ class ShotData:
         Returns:
             True if shot data is valid and physically reasonable
         """
+        min_distance, max_distance, min_velocity, max_velocity, min_angle, max_angle = (
+            _PHYSICAL_LIMITS(config)
+        )
+        # Field types are guaranteed by __post_init__
         return (
-            isinstance(self.hit, bool)
-            and isinstance(self.distance, (int, float))
-            and isinstance(self.angle, (int, float))
-            and isinstance(self.velocity, (int, float))
             # Distance bounds check (field geometry)
-            and config.PHYSICAL_MIN_DISTANCE_M <= self.distance <= config.PHYSICAL_MAX_DISTANCE_M
+            min_distance <= self.distance <= max_distance
             # Velocity bounds check (motor/mechanism physical limits)
-            and config.PHYSICAL_MIN_VELOCITY_MPS <= self.velocity <= config.PHYSICAL_MAX_VELOCITY_MPS
+            and min_velocity <= self.velocity <= max_velocity
             # Angle bounds check (mechanism physical limits)
-            and config.PHYSICAL_MIN_ANGLE_RAD <= self.angle <= config.PHYSICAL_MAX_ANGLE_RAD
+            and min_angle <= self.angle <= max_angle
         )
 
+
+# Structured (one row per shot) layout of ShotData, for array-based history/analysis
+SHOT_DTYPE = np.dtype([
+    ('hit', '?'), ('distance', 'f8'), ('angle', 'f8'), ('velocity', 'f8'),
+    ('timestamp', 'f8'), ('yaw', 'f8'), ('target_height', 'f8'),
+    ('launch_height', 'f8'), ('drag_coefficient', 'f8'), ('air_density', 'f8'),
+    ('projectile_mass', 'f8'), ('projectile_area', 'f8'),
+])
+_SHOT_RECORD = operator.attrgetter(*SHOT_DTYPE.names)
+
+# Rows kept in the shot history ring buffer; older shots are overwritten
+SHOT_HISTORY_CAPACITY = 1024
+
+
 class NetworkTablesInterface:
     """Interface for NetworkTables communication with RoboRIO protection."""
     
@@ -156,25 +296,63 @@ class NetworkTablesInterface:
         """
         self.config = config
         self.connected = False
-        self.last_connection_attempt = 0.0
+        # Rate-limit timestamps are time.monotonic() values; -inf = never
+        self.last_connection_attempt = float('-inf')
         self.shot_data_listeners = []
         
+        # Connection state pushed by the NT connection listener (see start())
+        self._connected_event = threading.Event()
+        self._connection_listener_active = False
+        
+        # Set by NT entry listeners when there is work for the tuning loop
+        self._wake_event = threading.Event()
+        self._wake_listeners_active = False
+        
+        # Local copy of the shot entries, kept current by NT entry listeners
+        self._shot_mirror: Dict[str, Any] = {}
+        self._shot_mirror_lock = threading.Lock()
+        self._shot_mirror_active = False
+        
+        # FMSControlData pushed by its entry listener (see is_match_mode())
+        self._fms_control = 0
+        self._fms_listener_active = False
+        
         # Rate limiting to prevent RoboRIO overload
-        self.last_write_time = 0.0
+        self.last_write_time = float('-inf')
         self.min_write_interval = 1.0 / config.MAX_NT_WRITE_RATE_HZ
-        self.last_read_time = 0.0
+        self.last_read_time = float('-inf')
         self.min_read_interval = 1.0 / config.MAX_NT_READ_RATE_HZ
         self.pending_writes = {}  # For batching writes if enabled
+        self._write_lock = threading.Lock()  # Guards pending_writes / _flush_timer
+        self._flush_timer: Optional[threading.Timer] = None  # Drains pending_writes
+        self._batch_depth = 0  # > 0 inside batched_writes(): NT flush is deferred
+        self._flush_deferred = False
+        self._backend_missing = False  # Set once poll_connection() finds no NT library
         
         # Tables
         self.root_table = None
         self.tuning_table = None
         self.firing_solver_table = None
         
+        # Coefficient entry handles, resolved once per tuning_table
+        self._coeff_entries: Dict[str, Any] = {}
+        self._coeff_entries_table = None
+        
+        # Shot data entry handles, resolved once per firing_solver_table
+        self._shot_entries: Dict[str, Any] = {}
+        self._shot_entries_table = None
+        # ShotTimestamp entry's NT change stamp when it was last read
+        self._last_shot_change = None
+        
         # Last shot data
         self.last_shot_timestamp = 0.0
         self.last_shot_data: Optional[ShotData] = None
         
+        # The last SHOT_HISTORY_CAPACITY captured shots as SHOT_DTYPE rows
+        # (see get_shot_history()); _shot_history_count counts every shot
+        self._shot_history = np.zeros(SHOT_HISTORY_CAPACITY, dtype=SHOT_DTYPE)
+        self._shot_history_count = 0
+        
         logger.info("NetworkTables interface initialized with rate limiting")
         logger.info(f"Write rate limit: {config.MAX_NT_WRITE_RATE_HZ} Hz, "
                    f"Read rate limit: {config.MAX_NT_READ_RATE_HZ} Hz")
@@ -189,7 +367,7 @@ class NetworkTablesInterface:
         Returns:
             True if connected successfully, False otherwise
         """
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Throttle connection attempts
         if current_time - self.last_connection_attempt < self.config.NT_RECONNECT_DELAY_SECONDS:
@@ -203,21 +381,28 @@ class NetworkTablesInterface:
             
             logger.info(f"Attempting to connect to NetworkTables at {server_ip}")
             NetworkTables.initialize(server=server_ip)
+            self._add_connection_listener()
             
             # Wait for connection
             timeout = self.config.NT_TIMEOUT_SECONDS
-            start_time = time.time()
-            
-            while not NetworkTables.isConnected():
-                if time.time() - start_time > timeout:
+            if self._connection_listener_active:
+                # Woken by the listener as soon as the connection comes up
+                if not self._connected_event.wait(timeout):
                     logger.warning(f"Connection timeout after {timeout}s")
                     return False
-                time.sleep(0.1)
+            else:
+                start_time = time.monotonic()
+                while not NetworkTables.isConnected():
+                    if time.monotonic() - start_time > timeout:
+                        logger.warning(f"Connection timeout after {timeout}s")
+                        return False
+                    time.sleep(0.1)
             
             # Get tables
             self.root_table = NetworkTables.getTable("")
             self.tuning_table = NetworkTables.getTable("/Tuning")
             self.firing_solver_table = NetworkTables.getTable(self.config.NT_SHOT_DATA_TABLE)
+            self._add_entry_listeners()
             
             self.connected = True
             logger.info("Connected to NetworkTables successfully")
@@ -242,14 +427,162 @@ class NetworkTablesInterface:
         """
         return self.start(server_ip)
     
+    def _add_connection_listener(self):
+        """Register for NT connect/disconnect notifications (once per interface)."""
+        if self._connection_listener_active:
+            return
+        try:
+            NetworkTables.addConnectionListener(self._on_connection_changed, immediateNotify=True)
+            self._connection_listener_active = True
+        except Exception as e:
+            # Older/mock NT without listeners: fall back to polling isConnected()
+            logger.warning(f"Connection listener unavailable, polling instead: {e}")
+    
+    def _on_connection_changed(self, connected: bool, info=None):
+        """NT connection listener callback (runs on the NT thread)."""
+        self.connected = connected
+        if connected:
+            self._connected_event.set()
+            self._resume_pending_writes()
+        else:
+            self._connected_event.clear()
+        logger.info(f"NetworkTables {'connected' if connected else 'disconnected'}")
+    
+    def _add_entry_listeners(self):
+        """
+        Register NT entry listeners (once per interface).
+        
+        The shot entries feed _shot_mirror, which read_shot_data() reads
+        instead of querying NT, and FMSControlData feeds is_match_mode().
+        ShotTimestamp, FMSControlData and the dashboard controls in
+        _WAKE_ENTRIES also wake the tuning loop.
+        """
+        if self._wake_listeners_active:
+            return
+        try:
+            if not self._shot_mirror_active:
+                for key, entry in self._get_shot_entries().items():
+                    self._add_value_listener(entry, functools.partial(self._on_shot_value, key))
+                self._shot_mirror_active = True
+            
+            if not self._fms_listener_active:
+                fms_entry = NetworkTables.getTable("/FMSInfo").getEntry("FMSControlData")
+                self._add_value_listener(fms_entry, self._on_fms_value)
+                self._fms_listener_active = True
+            
+            for table, key in _WAKE_ENTRIES:
+                entry = NetworkTables.getTable(table).getEntry(key)
+                self._add_value_listener(entry, lambda value: self.wake())
+            self._wake_listeners_active = True
+        except Exception as e:
+            # Without listeners read_shot_data() reads entries directly and
+            # wait_for_activity() falls back to fixed-rate polling
+            logger.warning(f"Entry listeners unavailable, polling instead: {e}")
+    
+    @staticmethod
+    def _add_value_listener(entry, listener):
+        """Call listener(value) with entry's current value and on each remote change."""
+        add_value_listener = getattr(NetworkTables, 'addValueListener', None)
+        if add_value_listener is not None:
+            add_value_listener(entry, listener)
+        else:
+            # pynetworktables: per-entry listener(entry, key, value, param)
+            flags = NetworkTables.NotifyFlags
+            entry.addListener(
+                lambda entry, key, value, param: listener(value),
+                flags.IMMEDIATE | flags.NEW | flags.UPDATE,
+            )
+    
+    def _on_shot_value(self, key: str, value):
+        """
+        Shot entry listener (runs on the NT thread): update the local mirror.
+        
+        The robot publishes ShotTimestamp after every other field of a shot
+        (FiringSolutionSolver.logShot), and listeners fire in that order, so
+        the mirror holds the whole shot by the time its timestamp lands.
+        """
+        with self._shot_mirror_lock:
+            self._shot_mirror[key] = value
+        if key == "ShotTimestamp":
+            self.wake()
+    
+    def _on_fms_value(self, value):
+        """FMSControlData listener (runs on the NT thread): cache it for is_match_mode()."""
+        self._fms_control = value
+        self.wake()
+    
+    def wake(self):
+        """Wake a tuning loop blocked in wait_for_activity()."""
+        self._wake_event.set()
+    
+    def wait_for_activity(self, timeout: float, poll_interval: float) -> bool:
+        """
+        Block the tuning loop until there is NT work to process.
+        
+        With entry listeners registered this returns as soon as a new shot or
+        dashboard change arrives, or after timeout seconds when idle. Without
+        them it simply sleeps poll_interval seconds.
+        
+        Args:
+            timeout: Longest time to wait for a listener wake-up (seconds)
+            poll_interval: Fixed sleep used when no listeners are registered (seconds)
+        
+        Returns:
+            True if woken by a listener, False on timeout or when polling
+        """
+        if not self._wake_listeners_active:
+            time.sleep(poll_interval)
+            return False
+        
+        woken = self._wake_event.wait(timeout)
+        # Cleared before the caller processes, so changes arriving after this re-arm it
+        self._wake_event.clear()
+        return woken
+    
     def is_connected(self) -> bool:
         """Check if connected to NetworkTables."""
+        if self._connection_listener_active:
+            # Kept up to date by _on_connection_changed, no NT call needed
+            return self.connected
+        
+        return self.poll_connection()
+    
+    def poll_connection(self) -> bool:
+        """
+        Ask NetworkTables directly whether we are connected.
+        
+        Without a connection listener this backs every is_connected() call.
+        With one it is only a low-rate sanity check against missed
+        notifications (the coordinator calls it about once a second).
+        
+        Returns:
+            True if connected, False otherwise
+        """
+        if self._backend_missing:
+            return False
+        
+        was_connected = self.connected
         try:
             self.connected = NetworkTables.isConnected()
+        except ImportError as e:
+            # No NT library installed: that won't change while running, so
+            # report it once instead of on every poll
+            logger.error(f"Error checking connection status: {e}")
+            self._backend_missing = True
+            self.connected = False
         except Exception as e:
             logger.error(f"Error checking connection status: {e}")
             self.connected = False
         
+        if self.connected and not was_connected:
+            self._resume_pending_writes()
+        
+        if self._connection_listener_active:
+            if self.connected:
+                self._connected_event.set()
+            else:
+                self._connected_event.clear()
+        
         return self.connected
     
     def stop(self):
@@ -257,6 +590,10 @@ class NetworkTablesInterface:
         try:
             # NetworkTables doesn't have an explicit stop in pynetworktables
             self.connected = False
+            with self._write_lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
             logger.info("Stopped NetworkTables connection")
         except Exception as e:
             logger.error(f"Error during stop: {e}")
@@ -291,50 +628,108 @@ class NetworkTablesInterface:
             logger.error(f"Error reading {nt_key}: {e}")
             return default_value
     
-    def write_coefficient(self, nt_key: str, value: float, force: bool = False) -> bool:
+    def write_coefficient(self, nt_key: str, value: float, force: bool = False,
+                          now: Optional[float] = None) -> bool:
         """
         Write a coefficient value to NetworkTables with rate limiting.
         
         Protects RoboRIO from being overloaded with too frequent updates.
+        Writes that arrive too soon are queued (if NT_BATCH_WRITES) and sent
+        by a timer in the next free write slot.
         
         Args:
             nt_key: NetworkTables key path
             value: Coefficient value to write
             force: If True, bypass rate limiting (use sparingly)
+            now: time.monotonic() sampled by the caller for this update tick
         
         Returns:
-            True if write succeeded, False otherwise
+            True if written now, False if queued, dropped or failed
         """
         if not self.is_connected():
             logger.warning(f"Not connected, cannot write {nt_key}")
             return False
         
         # Rate limiting check (unless forced)
-        current_time = time.time()
+        current_time = time.monotonic() if now is None else now
         if not force:
             time_since_last_write = current_time - self.last_write_time
             if time_since_last_write < self.min_write_interval:
                 # Too soon, queue for batching if enabled
                 if self.config.NT_BATCH_WRITES:
-                    self.pending_writes[nt_key] = value
-                    logger.debug(f"Queueing write for {nt_key} due to rate limit")
+                    with self._write_lock:
+                        self.pending_writes[nt_key] = value
+                        self._schedule_flush()
+                    logger.debug("Queueing write for %s due to rate limit", nt_key)
                     return False
                 else:
-                    logger.debug(f"Skipping write for {nt_key} due to rate limit")
+                    logger.debug("Skipping write for %s due to rate limit", nt_key)
                     return False
         
+        if not self._put_coefficient(nt_key, value):
+            return False
+        
+        # An older queued value must not overwrite this one when the timer fires
+        with self._write_lock:
+            self.pending_writes.pop(nt_key, None)
+        
+        # No flush of its own: the client's periodic update sends it, or the
+        # enclosing batched_writes() block flushes once on exit
+        if self._batch_depth > 0:
+            self._flush_deferred = True
+        self.last_write_time = current_time
+        logger.debug("Wrote %s = %s", nt_key, value)
+        return True
+    
+    def _put_coefficient(self, nt_key: str, value: float) -> bool:
+        """Set a coefficient through its cached entry handle (no rate limiting)."""
         try:
-            self.tuning_table.putNumber(nt_key, value)
-            self.last_write_time = current_time
-            logger.info(f"Wrote {nt_key} = {value}")
+            self._get_coefficient_entry(nt_key).setDouble(value)
             return True
         except Exception as e:
             logger.error(f"Error writing {nt_key}: {e}")
             return False
     
-    def flush_pending_writes(self) -> int:
+    def _schedule_flush(self, delay: Optional[float] = None):
+        """
+        Arm the flush timer for the next free write slot (caller holds _write_lock).
+        
+        At most one timer is pending; writes queued before it fires go out
+        together in that single flush.
+        
+        Args:
+            delay: Seconds until the flush; defaults to the next free write slot
+        """
+        if self._flush_timer is not None:
+            return
+        if delay is None:
+            delay = max(0.0, self.last_write_time + self.min_write_interval - time.monotonic())
+        self._flush_timer = threading.Timer(delay, self._on_flush_timer)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+    
+    def _on_flush_timer(self):
+        """Timer callback: write out everything queued since the timer was armed."""
+        with self._write_lock:
+            self._flush_timer = None
+        self.flush_pending_writes()
+    
+    def _resume_pending_writes(self):
+        """Arm the flush timer for writes left queued while the link was down."""
+        with self._write_lock:
+            if self.pending_writes:
+                self._schedule_flush()
+    
+    def flush_pending_writes(self, now: Optional[float] = None) -> int:
         """
-        Flush any pending batched writes to NetworkTables.
+        Flush any pending batched writes to NetworkTables in one pass.
+        
+        Called automatically by the flush timer; can also be called directly.
+        Writes that fail stay queued and the timer is re-armed to retry them;
+        writes queued while disconnected go out once the link comes back.
+        
+        Args:
+            now: time.monotonic() sampled by the caller for this update tick
         
         Returns:
             Number of writes flushed
@@ -342,18 +737,76 @@ class NetworkTablesInterface:
         if not self.pending_writes:
             return 0
         
+        # Checked outside _write_lock: a polled reconnect re-arms the timer under it
+        if not self.is_connected():
+            logger.warning(f"Not connected, keeping {len(self.pending_writes)} writes queued")
+            return 0
+        
+        with self._write_lock:
+            if not self.pending_writes:
+                return 0
+            
+            # Take the whole queue; writers queue into a fresh dict meanwhile
+            pending, self.pending_writes = self.pending_writes, {}
+        
         count = 0
-        for nt_key, value in list(self.pending_writes.items()):
-            if self.write_coefficient(nt_key, value, force=True):
+        failed = {}
+        for nt_key, value in pending.items():
+            if self._put_coefficient(nt_key, value):
                 count += 1
-                del self.pending_writes[nt_key]
+            else:
+                failed[nt_key] = value
+        
+        if failed:
+            with self._write_lock:
+                # Values queued during the flush are newer; only re-queue the rest
+                for nt_key, value in failed.items():
+                    self.pending_writes.setdefault(nt_key, value)
+                # Retry a full write interval later rather than spinning on errors
+                self._schedule_flush(self.min_write_interval)
         
         if count > 0:
-            logger.info(f"Flushed {count} batched writes to NetworkTables")
+            self.last_write_time = time.monotonic() if now is None else now
+            # Send the whole batch in one network update
+            self._flush_network()
+            logger.debug("Flushed %d batched writes to NetworkTables", count)
         
         return count
     
-    def read_shot_data(self) -> Optional[ShotData]:
+    def _flush_network(self):
+        """Push queued NT value changes out now, or at the end of batched_writes()."""
+        if self._batch_depth > 0:
+            self._flush_deferred = True
+            return
+        try:
+            NetworkTables.flush()
+        except Exception as e:
+            logger.error(f"Error flushing NetworkTables: {e}")
+    
+    @contextlib.contextmanager
+    def batched_writes(self):
+        """
+        Group several writes into a single NetworkTables flush.
+        
+        Writes made inside the block (coefficients, interlocks, status) are
+        flushed once when the outermost block exits, so they reach the robot
+        together instead of as several small updates.
+        
+        Example:
+            with nt_interface.batched_writes():
+                nt_interface.write_coefficient(key, value)
+                nt_interface.signal_coefficients_updated()
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._flush_deferred:
+                self._flush_deferred = False
+                self._flush_network()
+    
+    def read_shot_data(self, now: Optional[float] = None) -> Optional[ShotData]:
         """
         Read the latest shot data from NetworkTables with rate limiting.
         
@@ -364,49 +817,36 @@ class NetworkTablesInterface:
         - Physical parameters (target height, launch height)
         - Current coefficient values being used
         
+        Args:
+            now: time.monotonic() sampled by the caller for this update tick
+        
         Returns:
             ShotData object if new data available, None otherwise
         """
         if not self.is_connected():
             return None
         
-        # Rate limiting check
-        current_time = time.time()
-        time_since_last_read = current_time - self.last_read_time
-        if time_since_last_read < self.min_read_interval:
-            return None  # Skip read to avoid overloading RoboRIO
+        if self._shot_mirror_active:
+            # Listener-maintained copy: a dict read, no NT traffic to rate limit
+            with self._shot_mirror_lock:
+                values = dict(self._shot_mirror)
+            if values.get("ShotTimestamp", 0.0) <= self.last_shot_timestamp:
+                return None
+        else:
+            values = self._read_shot_entries(now)
+            if values is None:
+                return None
         
-        self.last_read_time = current_time
+        # Keys the robot has not published yet fall back to their defaults
+        values = {**_SHOT_DEFAULTS, **values}
+        shot_timestamp = values["ShotTimestamp"]
         
         try:
-            # Check if there's new shot data by monitoring timestamp
-            shot_timestamp = self.firing_solver_table.getNumber("ShotTimestamp", 0.0)
-            
-            # Only process if this is a new shot
-            if shot_timestamp <= self.last_shot_timestamp:
-                return None
-            
-            # Read shot result (hit or miss)
-            hit = self.firing_solver_table.getBoolean("Hit", False)
-            
-            # Read calculated firing solution data
-            distance = self.firing_solver_table.getNumber("Distance", 0.0)
-            
-            # Read from solution subtable
-            solution_table = self.firing_solver_table.getSubTable("Solution")
-            angle = solution_table.getNumber("pitchRadians", 0.0)
-            velocity = solution_table.getNumber("exitVelocity", 0.0)
-            yaw = solution_table.getNumber("yawRadians", 0.0)
-            
-            # Read physical parameters used in calculation
-            target_height = self.firing_solver_table.getNumber("TargetHeight", 0.0)
-            launch_height = self.firing_solver_table.getNumber("LaunchHeight", 0.0)
-            
-            # Read current coefficient values AT TIME OF SHOT
-            drag_coeff = self.firing_solver_table.getNumber("DragCoefficient", 0.0)
-            air_density = self.firing_solver_table.getNumber("AirDensity", 1.225)
-            projectile_mass = self.firing_solver_table.getNumber("ProjectileMass", 0.0)
-            projectile_area = self.firing_solver_table.getNumber("ProjectileArea", 0.0)
+            hit = values["Hit"]
+            distance = values["Distance"]
+            angle = values["pitchRadians"]
+            velocity = values["exitVelocity"]
+            drag_coeff = values["DragCoefficient"]
             
             # Create comprehensive shot data object
             shot_data = ShotData(
@@ -415,29 +855,135 @@ class NetworkTablesInterface:
                 angle=angle,
                 velocity=velocity,
                 timestamp=shot_timestamp,
-                yaw=yaw,
-                target_height=target_height,
-                launch_height=launch_height,
+                yaw=values["yawRadians"],
+                target_height=values["TargetHeight"],
+                launch_height=values["LaunchHeight"],
                 drag_coefficient=drag_coeff,
-                air_density=air_density,
-                projectile_mass=projectile_mass,
-                projectile_area=projectile_area,
+                air_density=values["AirDensity"],
+                projectile_mass=values["ProjectileMass"],
+                projectile_area=values["ProjectileArea"],
             )
             
             # Update tracking
             self.last_shot_timestamp = shot_timestamp
             self.last_shot_data = shot_data
+            self._append_shot_history(shot_data)
             
-            logger.info(f"New shot captured: hit={hit}, dist={distance:.2f}m, "
-                       f"angle={angle:.3f}rad, vel={velocity:.2f}m/s, "
-                       f"drag={drag_coeff:.6f}")
+            logger.info("New shot captured: hit=%s, dist=%.2fm, angle=%.3frad, "
+                        "vel=%.2fm/s, drag=%.6f",
+                        hit, distance, angle, velocity, drag_coeff)
             
             return shot_data
+        
+        except Exception as e:
+            # Consume the bad shot so it is not re-read and re-logged every tick
+            self.last_shot_timestamp = shot_timestamp
+            logger.error(f"Error reading shot data: {e}")
+            return None
+    
+    def _read_shot_entries(self, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Read a new shot directly from the NT entries (no listener mirror).
+        
+        Args:
+            now: time.monotonic() sampled by the caller for this update tick
+        
+        Returns:
+            Dict of shot key -> value if a new shot is available, None otherwise
+        """
+        # Fast path: ShotTimestamp not updated since the last read, nothing new
+        last_change = self._get_shot_last_change()
+        if last_change is not None and last_change == self._last_shot_change:
+            return None
+        
+        # Rate limiting check
+        current_time = time.monotonic() if now is None else now
+        time_since_last_read = current_time - self.last_read_time
+        if time_since_last_read < self.min_read_interval:
+            return None  # Skip read to avoid overloading RoboRIO
+        
+        self.last_read_time = current_time
+        
+        try:
+            entries = self._get_shot_entries()
+            
+            # Check if there's new shot data by monitoring timestamp
+            shot_timestamp = entries["ShotTimestamp"].getDouble(0.0)
+            self._last_shot_change = last_change
+            
+            # Only process if this is a new shot
+            if shot_timestamp <= self.last_shot_timestamp:
+                return None
+            
+            # Shot result, firing solution, physical parameters and the
+            # coefficient values AT TIME OF SHOT
+            values = {
+                key: entry.getDouble(_SHOT_DEFAULTS[key])
+                for key, entry in entries.items() if key not in ("ShotTimestamp", "Hit")
+            }
+            values["ShotTimestamp"] = shot_timestamp
+            values["Hit"] = entries["Hit"].getBoolean(False)
+            return values
             
         except Exception as e:
             logger.error(f"Error reading shot data: {e}")
             return None
     
+    def _get_shot_entries(self) -> Dict[str, Any]:
+        """
+        Get the NT entry handles read for each shot.
+        
+        Resolved once per firing_solver_table (dropped on reconnect), so
+        read_shot_data() does no key or subtable lookups per call.
+        
+        Returns:
+            Dict of entry name -> NetworkTableEntry ("Solution" subtable
+            entries are keyed by their own name, e.g. "pitchRadians")
+        """
+        table = self.firing_solver_table
+        if self._shot_entries_table is not table:
+            solution_table = table.getSubTable("Solution")
+            entries = {key: table.getEntry(key) for key in _SHOT_KEYS}
+            entries.update({key: solution_table.getEntry(key) for key in _SOLUTION_KEYS})
+            self._shot_entries = entries
+            self._shot_entries_table = table
+            self._last_shot_change = None
+        return self._shot_entries
+    
+    def _get_shot_last_change(self):
+        """
+        Get the ShotTimestamp entry's last-change stamp (a cheap NT counter).
+        
+        Returns:
+            Change stamp, or None if unavailable (e.g. pynetworktables, not connected)
+        """
+        try:
+            return self._get_shot_entries()["ShotTimestamp"].getLastChange()
+        except Exception:
+            return None
+    
+    def _append_shot_history(self, shot_data: ShotData):
+        """Store a captured shot in the history ring buffer, over the oldest when full."""
+        count = self._shot_history_count
+        self._shot_history[count % len(self._shot_history)] = _SHOT_RECORD(shot_data)
+        self._shot_history_count = count + 1
+    
+    def get_shot_history(self) -> np.ndarray:
+        """
+        Get the most recent captured shots as a structured array.
+        
+        Returns:
+            SHOT_DTYPE array, one row per shot in capture order for up to
+            SHOT_HISTORY_CAPACITY shots (e.g. history['distance'] for all
+            distances); a view until the buffer wraps, a copy after
+        """
+        count = self._shot_history_count
+        capacity = len(self._shot_history)
+        if count <= capacity:
+            return self._shot_history[:count]
+        start = count % capacity
+        return np.concatenate((self._shot_history[start:], self._shot_history[:start]))
+    
     def is_match_mode(self) -> bool:
         """
         Check if robot is in match mode (FMS attached).
@@ -448,6 +994,10 @@ class NetworkTablesInterface:
         if not self.is_connected():
             return False
         
+        if self._fms_listener_active:
+            # Kept current by _on_fms_value, no NT lookup needed
+            return self._fms_control != 0
+        
         try:
             # Check FMSInfo for FMS control data
             fms_table = NetworkTables.getTable("/FMSInfo")
@@ -486,30 +1036,75 @@ class NetworkTablesInterface:
         Returns:
             Dict mapping coefficient names to current values
         """
+        if not self.is_connected():
+            logger.warning("Not connected, returning defaults for all coefficients")
+            return {name: coeff.default_value for name, coeff in coefficients.items()}
+        
         values = {}
         for name, coeff in coefficients.items():
-            values[name] = self.read_coefficient(coeff.nt_key, coeff.default_value)
+            try:
+                values[name] = self._get_coefficient_entry(coeff.nt_key).getDouble(coeff.default_value)
+            except Exception as e:
+                logger.error(f"Error reading {coeff.nt_key}: {e}")
+                values[name] = coeff.default_value
         
         return values
     
+    def _get_coefficient_entry(self, nt_key: str):
+        """
+        Get the NT entry handle for a coefficient key.
+        
+        Handles are cached so repeated reads skip the table's key lookup.
+        The cache is dropped whenever tuning_table is replaced (reconnect).
+        
+        Args:
+            nt_key: NetworkTables key path
+        
+        Returns:
+            NetworkTableEntry for the key
+        """
+        if self._coeff_entries_table is not self.tuning_table:
+            self._coeff_entries = {}
+            self._coeff_entries_table = self.tuning_table
+        
+        entry = self._coeff_entries.get(nt_key)
+        if entry is None:
+            entry = self._coeff_entries[nt_key] = self.tuning_table.getEntry(nt_key)
+        return entry
+    
     def write_all_coefficients(self, coefficient_values: Dict[str, float]) -> bool:
         """
-        Write multiple coefficient values to NetworkTables.
+        Write multiple coefficient values to NetworkTables as one batch.
+        
+        All values are queued together and sent in a single flush: right
+        away if the write rate limit allows, otherwise by the flush timer.
         
         Args:
             coefficient_values: Dict mapping coefficient names to values
         
         Returns:
-            True if all writes succeeded, False otherwise
-        """
-        success = True
-        for name, value in coefficient_values.items():
-            if name in self.config.COEFFICIENTS:
-                coeff = self.config.COEFFICIENTS[name]
-                if not self.write_coefficient(coeff.nt_key, value):
-                    success = False
+            True if all writes were sent now, False if queued or failed
+        """
+        batch = {
+            self.config.COEFFICIENTS[name].nt_key: value
+            for name, value in coefficient_values.items()
+            if name in self.config.COEFFICIENTS
+        }
+        if not batch:
+            return True
+        
+        if not self.is_connected():
+            logger.warning(f"Not connected, cannot write {len(batch)} coefficients")
+            return False
+        
+        with self._write_lock:
+            self.pending_writes.update(batch)
+            if time.monotonic() - self.last_write_time < self.min_write_interval:
+                self._schedule_flush()
+                return False
         
-        return success
+        self.flush_pending_writes()
+        return not any(nt_key in self.pending_writes for nt_key in batch)
     
     def write_interlock_settings(self, require_shot_logged: bool, require_coefficients_updated: bool):
         """
@@ -5,42 +5,16 @@ This module implements Bayesian optimization using scikit-optimize to tune
 shooting coefficients based on hit/miss feedback with adaptive step sizes.
 """
 
+import functools
 import importlib
 import logging
-from typing import List, Tuple, Optional, Dict
+from typing import List, Tuple, Optional, Dict, Sequence
 import numpy as np
 
 try:
-    skopt_module = importlib.import_module("scikit_optimize")
+    from .optimizer_kernels import expected_improvement
 except ImportError:
-    try:
-        skopt_module = importlib.import_module("skopt")
-    except ImportError:
-        skopt_module = None
-
-if skopt_module:
-    Optimizer = skopt_module.Optimizer
-    Real = skopt_module.space.Real
-    Integer = skopt_module.space.Integer
-else:
-    # Provide mock for testing without scikit-optimize
-    class Optimizer:
-        def __init__(self, *args, **kwargs):
-            pass
-        
-        def ask(self):
-            return [0.5]
-        
-        def tell(self, x, y):
-            pass
-    
-    class Real:
-        def __init__(self, *args, **kwargs):
-            pass
-    
-    class Integer:
-        def __init__(self, *args, **kwargs):
-            pass
+    from optimizer_kernels import expected_improvement
 
 
 logger = logging.getLogger(__name__)
@@ -51,6 +25,84 @@ SCORE_HIT = 1.0  # Score bonus for successful shot
 SCORE_MISS = -1.0  # Score penalty for missed shot
 DISTANCE_BONUS_WEIGHT = 0.01  # Weight for distance-based score adjustment
 CONVERGENCE_VARIANCE_THRESHOLD = 0.01  # Variance threshold for convergence detection
+CONVERGENCE_WINDOW = 5  # Number of recent scores the variance check looks at
+GRID_ACQUISITION_MAX_POINTS = 64  # Integer domains up to this size are searched exhaustively
+EI_XI = 0.01  # Exploration margin for grid Expected Improvement (skopt's default)
+
+
+class _FallbackOptimizer:
+    """Stand-in for skopt.Optimizer so the tuner can run without scikit-optimize."""
+    
+    def __init__(self, *args, **kwargs):
+        self.Xi = []
+        self.yi = []
+    
+    def ask(self, n_points=None, strategy="cl_min"):
+        if n_points is None:
+            return [0.5]
+        return [[0.5]] * n_points
+    
+    def tell(self, x, y, fit=True):
+        # Same bookkeeping as skopt: one point or a list of points
+        if isinstance(y, (list, tuple)):
+            self.Xi.extend(x)
+            self.yi.extend(y)
+        else:
+            self.Xi.append(x)
+            self.yi.append(y)
+
+
+class _FallbackDimension:
+    """Stand-in for skopt's Real/Integer search-space dimensions."""
+    
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+@functools.lru_cache(maxsize=None)
+def _load_skopt() -> Tuple[type, type, type]:
+    """
+    Import scikit-optimize on first use.
+    
+    skopt pulls in scipy and scikit-learn (about a second of import time), so
+    it is only loaded once an optimizer is actually built rather than when
+    this module is imported.
+    
+    Returns:
+        Tuple of (Optimizer, Real, Integer); stand-ins if skopt is not installed
+    """
+    for module_name in ("scikit_optimize", "skopt"):
+        try:
+            skopt_module = importlib.import_module(module_name)
+        except ImportError:
+            continue
+        return skopt_module.Optimizer, skopt_module.space.Real, skopt_module.space.Integer
+    
+    logger.warning("scikit-optimize not installed; optimizer suggestions will be placeholders")
+    return _FallbackOptimizer, _FallbackDimension, _FallbackDimension
+
+
+def _initial_point_generator(name: str):
+    """
+    Resolve the INITIAL_POINT_GENERATOR setting for skopt.
+    
+    "lhs" maps to classic (randomized, stratified) Latin hypercube sampling.
+    skopt's own "lhs" runs a 1000-iteration maximin search for every new
+    optimizer (~50 ms), which buys nothing over classic LHS in one dimension.
+    
+    Args:
+        name: Generator name ("random", "lhs", "sobol", "halton", ...)
+    
+    Returns:
+        Generator name or sampler instance to pass to skopt.Optimizer
+    """
+    if name != "lhs":
+        return name
+    try:
+        sampler = importlib.import_module("skopt.sampler")
+    except ImportError:
+        return "random"
+    return sampler.Lhs(lhs_type="classic", criterion=None)
 
 
 class BayesianOptimizer:
@@ -61,16 +113,20 @@ class BayesianOptimizer:
     to efficiently explore the parameter space.
     """
     
-    def __init__(self, coeff_config, tuner_config):
+    def __init__(self, coeff_config, tuner_config,
+                 prior_observations: Optional[Sequence[Tuple[float, float]]] = None):
         """
         Initialize optimizer for a specific coefficient.
         
         Args:
             coeff_config: CoefficientConfig object
             tuner_config: TunerConfig object
+            prior_observations: Optional (value, score) pairs already measured
+                for this coefficient, told to the GP before the first ask()
         """
         self.coeff_config = coeff_config
         self.tuner_config = tuner_config
+        Optimizer, Real, Integer = _load_skopt()
         
         # Create search space
         if coeff_config.is_integer:
@@ -86,22 +142,85 @@ class BayesianOptimizer:
                 name=coeff_config.name
             )]
         
+        # GP training set cap; the oldest observations are forgotten past it
+        self.max_observations = max(0, int(getattr(tuner_config, 'GP_MAX_OBSERVATIONS', 0)))
+        prior_observations = list(prior_observations or ())
+        if self.max_observations:
+            prior_observations = prior_observations[-self.max_observations:]
+        
+        # Earlier rounds count toward the initial design, leaving
+        # max(0, N_INITIAL_POINTS - len(prior)) points to sample. skopt
+        # subtracts every told point from n_initial_points, so the priors
+        # are added back on top of the remaining budget
+        n_initial_points = max(0, tuner_config.N_INITIAL_POINTS - len(prior_observations))
+        
         # Initialize optimizer
         self.optimizer = Optimizer(
             dimensions=self.search_space,
-            n_initial_points=tuner_config.N_INITIAL_POINTS,
+            n_initial_points=n_initial_points + len(prior_observations),
+            initial_point_generator=_initial_point_generator(
+                getattr(tuner_config, 'INITIAL_POINT_GENERATOR', "random")
+            ),
             acq_func=tuner_config.ACQUISITION_FUNCTION,
+            acq_optimizer_kwargs={"n_jobs": int(getattr(tuner_config, 'ACQUISITION_N_JOBS', 1))},
             random_state=None,  # Use random seed for exploration
         )
         
+        # Seed the GP with earlier rounds (not counted as our iterations)
+        if prior_observations:
+            self.optimizer.tell(
+                [[coeff_config.clamp(x)] for x, _ in prior_observations],
+                [float(y) for _, y in prior_observations],
+            )
+        
+        # Small integer domains are enumerated instead of searched with L-BFGS,
+        # and continuous ones can opt into a dense grid scored in one predict()
+        self.candidate_grid = None
+        grid_points = int(getattr(tuner_config, 'CONTINUOUS_ACQUISITION_GRID_POINTS', 0))
+        if tuner_config.ACQUISITION_FUNCTION == "EI":
+            if coeff_config.is_integer:
+                if coeff_config.max_value - coeff_config.min_value < GRID_ACQUISITION_MAX_POINTS:
+                    self.candidate_grid = np.arange(
+                        int(coeff_config.min_value), int(coeff_config.max_value) + 1
+                    )
+            elif grid_points > 1:
+                self.candidate_grid = np.linspace(
+                    coeff_config.min_value, coeff_config.max_value, grid_points
+                )
+        self._grid_points = None  # candidate_grid in the GP's normalized space
+        self._grid_posterior = None  # (model, mu, sigma) for the last fitted GP
+        
+        # Suggestions drawn from the last model fit but not handed out yet
+        batch_size = int(getattr(tuner_config, 'SUGGESTION_BATCH_SIZE', 1))
+        if batch_size <= 0:
+            # One candidate per shot of a validation round
+            batch_size = tuner_config.MIN_VALID_SHOTS_BEFORE_UPDATE
+        self.batch_size = max(1, int(batch_size))
+        self._pending_suggestions: List[float] = []
+        
         # Tracking
         self.iteration = 0
         self.current_step_size = coeff_config.initial_step_size
+        self._step_schedule = coeff_config.schedule(
+            max(1, int(tuner_config.N_CALLS_PER_COEFFICIENT)), tuner_config.MIN_STEP_SIZE_RATIO
+        )
         self.best_value = coeff_config.default_value
         self.best_score = float('-inf')
-        self.evaluation_history = []
         
-        logger.info(f"Initialized optimizer for {coeff_config.name}")
+        # Evaluation history as parallel columns indexed by iteration. Values
+        # stay float64 since they are written back to the robot; scores and
+        # step sizes are only summarized, so float32 is plenty
+        capacity = max(1, int(tuner_config.N_CALLS_PER_COEFFICIENT))
+        self._history_values = np.empty(capacity, dtype=np.float64)
+        self._history_hits = np.empty(capacity, dtype=np.bool_)
+        self._history_scores = np.empty(capacity, dtype=np.float32)
+        self._history_steps = np.empty(capacity, dtype=np.float32)
+        self._history_extra: List[Dict] = []
+        self._recent_score_var = float('inf')  # Variance of the last CONVERGENCE_WINDOW scores
+        self._converged: Optional[bool] = None  # is_converged() result until the state changes
+        self._converged_logged = False
+        
+        logger.info("Initialized optimizer for %s", coeff_config.name)
     
     def suggest_next_value(self) -> float:
         """
@@ -111,31 +230,126 @@ class BayesianOptimizer:
             Suggested coefficient value
         """
         try:
-            # Get next point from optimizer
-            suggested = self.optimizer.ask()
-            value = suggested[0]
+            # Get next point from optimizer, refilling the batch when it runs dry
+            if not self._pending_suggestions:
+                self._pending_suggestions = self._ask_batch()
+            value = self._pending_suggestions.pop(0)
             
             # Apply step size decay if enabled
             if self.tuner_config.STEP_SIZE_DECAY_ENABLED and self.iteration > 0:
-                # Calculate decayed step size
-                decay_factor = self.coeff_config.step_decay_rate ** self.iteration
-                min_step = self.coeff_config.initial_step_size * self.tuner_config.MIN_STEP_SIZE_RATIO
-                self.current_step_size = max(
-                    min_step,
-                    self.coeff_config.initial_step_size * decay_factor
-                )
+                # Look up decayed step size in the precomputed schedule,
+                # doubling it if tuning has run past the call budget
+                if self.iteration >= len(self._step_schedule):
+                    self._step_schedule = self.coeff_config.schedule(
+                        2 * self.iteration, self.tuner_config.MIN_STEP_SIZE_RATIO
+                    )
+                self.current_step_size = float(self._step_schedule[self.iteration])
+                self._converged = None
             
             # Clamp to valid range
             value = self.coeff_config.clamp(value)
             
-            logger.info(f"Suggesting {self.coeff_config.name} = {value:.6f} (step size: {self.current_step_size:.6f})")
+            logger.info("Suggesting %s = %.6f (step size: %.6f)", self.coeff_config.name, value, self.current_step_size)
             return value
             
         except Exception as e:
-            logger.error(f"Error suggesting next value: {e}")
+            logger.error("Error suggesting next value: %s", e)
             return self.coeff_config.default_value
     
-    def report_result(self, value: float, hit: bool, additional_data: Optional[Dict] = None):
+    def _ask_batch(self) -> List[float]:
+        """
+        Draw the next batch of suggestions from a single model fit.
+        
+        Batches larger than one use the constant-liar strategy (skopt's, or
+        the same idea on the candidate grid) so the points in a batch spread
+        out instead of repeating the same optimum.
+        
+        Returns:
+            List of up to batch_size suggested values
+        """
+        values = self._suggest_from_grid(self.batch_size)
+        if values is not None:
+            return values
+        
+        if self.batch_size == 1:
+            return [self.optimizer.ask()[0]]
+        
+        suggested = self.optimizer.ask(n_points=self.batch_size, strategy="cl_min")
+        return [point[0] for point in suggested]
+    
+    def _suggest_from_grid(self, n_points: int = 1) -> Optional[List[float]]:
+        """
+        Pick grid candidates by Expected Improvement.
+        
+        Like skopt's ask(n_points, strategy="cl_min"), each pick after the
+        first comes from a GP refitted with the earlier picks told the lowest
+        score seen so far (constant liar), so a batch spreads out instead of
+        clustering around one EI maximum.
+        
+        Args:
+            n_points: Number of candidates to return
+        
+        Returns:
+            Suggested values in pick order, or None to fall back to the
+            optimizer's own ask() (no candidate grid, or still sampling
+            initial points)
+        """
+        models = getattr(self.optimizer, 'models', None)
+        if self.candidate_grid is None or not models:
+            return None
+        # A model fitted on seeded priors must not cut the initial design short
+        if getattr(self.optimizer, '_n_initial_points', 0) > 0:
+            return None
+        
+        y_lie = float(np.min(self.optimizer.yi))
+        model = models[-1]
+        mu, sigma = self._grid_predict(model)
+        picks = []
+        while True:
+            ei = expected_improvement(mu, sigma, y_lie, EI_XI)
+            picks.append(self.candidate_grid[int(np.argmax(ei))].item())
+            if len(picks) >= n_points:
+                return picks
+            model = self._fit_with_lies(model, picks, y_lie)
+            mu, sigma = model.predict(self._grid_points, return_std=True)
+    
+    def _fit_with_lies(self, model, picks: List[float], y_lie: float):
+        """Clone model and fit it on the observations plus picks scored y_lie."""
+        # skopt is installed whenever a model exists, and it depends on sklearn
+        from sklearn.base import clone
+        
+        X = list(self.optimizer.Xi) + [[value] for value in picks]
+        y = list(self.optimizer.yi) + [y_lie] * len(picks)
+        return clone(model).fit(self.optimizer.space.transform(X), y)
+    
+    def _grid_predict(self, model) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        GP posterior mean and std over the candidate grid, cached per fit.
+        
+        The training set only changes on tell(), so repeated asks against the
+        same fitted model reuse the previous prediction instead of solving
+        against the kernel factor again.
+        
+        Args:
+            model: Fitted GP regressor (the optimizer's latest model)
+        
+        Returns:
+            Tuple of (mu, sigma) as contiguous float64 arrays
+        """
+        if self._grid_posterior is not None and self._grid_posterior[0] is model:
+            return self._grid_posterior[1], self._grid_posterior[2]
+        
+        if self._grid_points is None:
+            self._grid_points = self.optimizer.space.transform(
+                self.candidate_grid.reshape(-1, 1).tolist()
+            )
+        mu, sigma = model.predict(self._grid_points, return_std=True)
+        mu = np.ascontiguousarray(mu, dtype=np.float64)
+        sigma = np.ascontiguousarray(sigma, dtype=np.float64)
+        self._grid_posterior = (model, mu, sigma)
+        return mu, sigma
+    
+    def report_result(self, value: float, hit: bool, additional_data: Optional[Dict] = None) -> Optional[float]:
         """
         Report the result of testing a coefficient value.
         
@@ -143,6 +357,9 @@ class BayesianOptimizer:
             value: The coefficient value that was tested
             hit: Whether the shot hit (True) or missed (False)
             additional_data: Optional dict with distance, velocity, etc.
+        
+        Returns:
+            Score told to the optimizer, or None if reporting failed
         """
         try:
             # Convert hit/miss to optimization score (maximize hit rate)
@@ -156,63 +373,115 @@ class BayesianOptimizer:
                     distance_bonus = -DISTANCE_BONUS_WEIGHT / max(distance, 1.0)
                     score += distance_bonus
             
-            # Tell optimizer the result
-            self.optimizer.tell([value], score)
+            # Tell optimizer the result; refit only once the batch is used up
+            refit = not self._pending_suggestions
+            self._forget_oldest_observations()
+            self.optimizer.tell([value], score, fit=refit)
+            if refit:
+                self._grid_posterior = None
             
             # Track best result
             if score > self.best_score:
                 self.best_score = score
                 self.best_value = value
-                logger.info(f"New best for {self.coeff_config.name}: {value:.6f} (score: {score:.3f})")
+                logger.info("New best for %s: %.6f (score: %.3f)", self.coeff_config.name, value, score)
             
             # Record in history
-            self.evaluation_history.append({
-                'iteration': self.iteration,
-                'value': value,
-                'hit': hit,
-                'score': score,
-                'step_size': self.current_step_size,
-                'additional_data': additional_data or {}
-            })
+            i = self.iteration
+            if i == len(self._history_scores):
+                self._grow_history()
+            self._history_values[i] = value
+            self._history_hits[i] = hit
+            self._history_scores[i] = score
+            self._history_steps[i] = self.current_step_size
+            self._history_extra.append(additional_data or {})
             
             self.iteration += 1
+            self._converged = None
+            
+            # Update the convergence window once here rather than on every check
+            if self.iteration >= CONVERGENCE_WINDOW:
+                window = self._history_scores[self.iteration - CONVERGENCE_WINDOW:self.iteration].tolist()
+                mean = sum(window) / CONVERGENCE_WINDOW
+                self._recent_score_var = sum((s - mean) ** 2 for s in window) / CONVERGENCE_WINDOW
             
-            logger.debug(f"Reported result: {self.coeff_config.name}={value:.6f}, hit={hit}, score={score:.3f}")
+            logger.debug("Reported result: %s=%.6f, hit=%s, score=%.3f", self.coeff_config.name, value, hit, score)
+            return score
             
         except Exception as e:
-            logger.error(f"Error reporting result: {e}")
+            logger.error("Error reporting result: %s", e)
+            return None
+    
+    def _grow_history(self):
+        """Double the capacity of the evaluation history columns."""
+        size = 2 * len(self._history_scores)
+        self._history_values = np.resize(self._history_values, size)
+        self._history_hits = np.resize(self._history_hits, size)
+        self._history_scores = np.resize(self._history_scores, size)
+        self._history_steps = np.resize(self._history_steps, size)
+    
+    @property
+    def evaluation_history(self) -> List[Dict]:
+        """
+        Evaluation history as one dict per reported result.
+        
+        Built on demand from the history columns; use get_statistics() or the
+        columns directly on hot paths.
+        """
+        return [
+            {
+                'iteration': i,
+                'value': float(self._history_values[i]),
+                'hit': bool(self._history_hits[i]),
+                'score': float(self._history_scores[i]),
+                'step_size': float(self._history_steps[i]),
+                'additional_data': extra,
+            }
+            for i, extra in enumerate(self._history_extra)
+        ]
     
     def is_converged(self) -> bool:
         """
         Check if optimization has converged.
         
+        The result is cached until the next report_result() or step size
+        change, so repeated status checks don't re-log the reason.
+        
         Returns:
             True if converged or max iterations reached
         """
+        if self._converged is None:
+            self._converged = self._check_converged()
+        return self._converged
+    
+    def _check_converged(self) -> bool:
+        """Evaluate the convergence criteria (see is_converged)."""
         # Check if we've reached max iterations
         if self.iteration >= self.tuner_config.N_CALLS_PER_COEFFICIENT:
-            logger.info(f"{self.coeff_config.name} reached max iterations ({self.iteration})")
+            self._log_converged("%s reached max iterations (%d)", self.coeff_config.name, self.iteration)
             return True
         
         # Check if step size is below minimum (indicates convergence)
         min_step = self.coeff_config.initial_step_size * self.tuner_config.MIN_STEP_SIZE_RATIO
         if self.current_step_size <= min_step * 1.1:  # Small tolerance
-            logger.info(f"{self.coeff_config.name} converged (step size: {self.current_step_size:.6f})")
+            self._log_converged("%s converged (step size: %.6f)", self.coeff_config.name, self.current_step_size)
             return True
         
-        # Check if we have enough history to evaluate convergence
-        if len(self.evaluation_history) >= 5:
-            # Check variance in recent scores
-            recent_scores = [h['score'] for h in self.evaluation_history[-5:]]
-            variance = np.var(recent_scores)
-            
+        # Check variance in recent scores (inf until the window has filled)
+        variance = self._recent_score_var
+        if variance < CONVERGENCE_VARIANCE_THRESHOLD:
             # If variance is very low, we've converged
-            if variance < CONVERGENCE_VARIANCE_THRESHOLD:
-                logger.info(f"{self.coeff_config.name} converged (low variance: {variance:.6f})")
-                return True
+            self._log_converged("%s converged (low variance: %.6f)", self.coeff_config.name, variance)
+            return True
         
         return False
     
+    def _log_converged(self, msg: str, *args):
+        """Log the convergence reason the first time it is detected only."""
+        if not self._converged_logged:
+            self._converged_logged = True
+            logger.info(msg, *args)
+    
     def get_best_value(self) -> float:
         """
         Get the best coefficient value found so far.
@@ -222,6 +491,21 @@ class BayesianOptimizer:
         """
         return self.best_value
     
+    def _forget_oldest_observations(self):
+        """
+        Drop the oldest GP observations so the next tell() stays within
+        max_observations.
+        
+        The GP fit is cubic in the number of points, so an unbounded history
+        slows every iteration; a sliding window also follows drift in the
+        robot better than remembering every early shot.
+        """
+        keep = self.max_observations - 1
+        if keep < 0 or len(self.optimizer.yi) <= keep:
+            return
+        del self.optimizer.Xi[:len(self.optimizer.Xi) - keep]
+        del self.optimizer.yi[:len(self.optimizer.yi) - keep]
+    
     def get_statistics(self) -> Dict:
         """
         Get optimization statistics.
@@ -230,9 +514,8 @@ class BayesianOptimizer:
             Dict with statistics (iterations, best value, convergence, etc.)
         """
         hit_rate = 0.0
-        if self.evaluation_history:
-            hits = sum(1 for h in self.evaluation_history if h['hit'])
-            hit_rate = hits / len(self.evaluation_history)
+        if self.iteration:
+            hit_rate = np.count_nonzero(self._history_hits[:self.iteration]) / self.iteration
         
         return {
             'coefficient_name': self.coeff_config.name,
@@ -241,8 +524,8 @@ class BayesianOptimizer:
             'best_score': self.best_score,
             'current_step_size': self.current_step_size,
             'hit_rate': hit_rate,
-            'is_converged': self.is_converged(),
-            'total_evaluations': len(self.evaluation_history),
+            'is_converged': bool(self._converged),  # last is_converged() result, not re-evaluated
+            'total_evaluations': self.iteration,
         }
 
 
@@ -268,11 +551,18 @@ class CoefficientTuner:
         self.current_optimizer: Optional[BayesianOptimizer] = None
         self.completed_coefficients = []
         
-        # Shot accumulation for validation
-        self.pending_shots = []
+        # Shot accumulation for validation: running [shots, hits, distance sum]
+        # per tested coefficient value, so each candidate is scored on its own
+        self._pending: Dict[float, List[float]] = {}
+        self._pending_count = 0
         self.consecutive_invalid_shots = 0
         
-        logger.info(f"Initialized tuner for {len(self.coefficients)} coefficients")
+        # Every reported round as (all coefficient values, score), so a
+        # coefficient can start from what earlier rounds measured at its value
+        self.observations: List[Tuple[Dict[str, float], float]] = []
+        self._coefficient_values: Dict[str, float] = {}
+        
+        logger.info("Initialized tuner for %d coefficients", len(self.coefficients))
         
         # Start with first coefficient
         if self.coefficients:
@@ -286,10 +576,40 @@ class CoefficientTuner:
             return
         
         coeff = self.coefficients[self.current_index]
-        logger.info(f"Starting optimization for {coeff.name} ({self.current_index + 1}/{len(self.coefficients)})")
-        
-        self.current_optimizer = BayesianOptimizer(coeff, self.config)
-        self.pending_shots = []
+        logger.info("Starting optimization for %s (%d/%d)", coeff.name, self.current_index + 1, len(self.coefficients))
+        
+        prior = None
+        if getattr(self.config, 'SHARE_OBSERVATIONS_ACROSS_COEFFICIENTS', False):
+            # Mean score per value this coefficient was held at. Rounds spent
+            # on other coefficients all sit at one value, which says nothing
+            # about this axis, so only seed once it has actually varied
+            # (e.g. going back to re-tune it)
+            totals: Dict[float, List[float]] = {}
+            for values, score in self.observations:
+                if coeff.name in values:
+                    total = totals.setdefault(values[coeff.name], [0.0, 0])
+                    total[0] += score
+                    total[1] += 1
+            if len(totals) > 1:
+                prior = [(value, score / n) for value, (score, n) in totals.items()]
+        
+        self.current_optimizer = BayesianOptimizer(coeff, self.config, prior_observations=prior)
+        self._clear_pending_shots()
+    
+    @property
+    def pending_shot_count(self) -> int:
+        """Number of valid shots recorded but not yet reported."""
+        return self._pending_count
+    
+    def _drop_stale_pending(self, current_value: float):
+        """Discard partial rounds at any value other than current_value."""
+        for value in [v for v in self._pending if v != current_value]:
+            self._pending_count -= self._pending.pop(value)[0]
+    
+    def _clear_pending_shots(self):
+        """Drop accumulated shots."""
+        self._pending = {}
+        self._pending_count = 0
     
     def get_current_coefficient_name(self) -> Optional[str]:
         """Get name of coefficient currently being tuned."""
@@ -310,6 +630,9 @@ class CoefficientTuner:
         value = self.current_optimizer.suggest_next_value()
         name = self.current_optimizer.coeff_config.name
         
+        # The robot moves to the new value, so partial rounds at older ones end here
+        self._drop_stale_pending(value)
+        
         return (name, value)
     
     def record_shot(self, shot_data, coefficient_values: Dict[str, float]):
@@ -327,7 +650,7 @@ class CoefficientTuner:
         # Validate shot data
         if not shot_data.is_valid(self.config):
             self.consecutive_invalid_shots += 1
-            logger.warning(f"Invalid shot data (consecutive: {self.consecutive_invalid_shots})")
+            logger.warning("Invalid shot data (consecutive: %d)", self.consecutive_invalid_shots)
             
             if self.consecutive_invalid_shots >= self.config.MAX_CONSECUTIVE_INVALID_SHOTS:
                 logger.error("Too many consecutive invalid shots, stopping tuning")
@@ -338,50 +661,53 @@ class CoefficientTuner:
         self.consecutive_invalid_shots = 0
         
         # Get current coefficient value
+        self._coefficient_values = coefficient_values
         coeff_name = self.current_optimizer.coeff_config.name
         current_value = coefficient_values.get(coeff_name, self.current_optimizer.coeff_config.default_value)
         
-        # Add to pending shots
-        self.pending_shots.append({
-            'shot_data': shot_data,
-            'coefficient_value': current_value,
-        })
-        
-        # Check if we have enough shots to report
-        if len(self.pending_shots) >= self.config.MIN_VALID_SHOTS_BEFORE_UPDATE:
-            self._process_pending_shots()
+        # Add to pending shots for the value that was actually tested
+        bucket = self._pending.get(current_value)
+        if bucket is None:
+            # A new value (suggestion or dashboard edit) ends partial rounds at older ones
+            self._drop_stale_pending(current_value)
+            bucket = self._pending[current_value] = [0, 0, 0.0]
+        bucket[0] += 1
+        bucket[1] += bool(shot_data.hit)
+        bucket[2] += shot_data.distance
+        self._pending_count += 1
+        
+        # Report a value once it has a full validation round of its own;
+        # a partial round is dropped, not reported as a short observation
+        if bucket[0] >= self.config.MIN_VALID_SHOTS_BEFORE_UPDATE:
+            self._process_pending_shots(current_value)
     
-    def _process_pending_shots(self):
-        """Process accumulated shots and report to optimizer."""
-        if not self.pending_shots or not self.current_optimizer:
+    def _process_pending_shots(self, value: float):
+        """Report the accumulated shots at one tested value to the optimizer."""
+        bucket = self._pending.pop(value, None)
+        if bucket is None or not self.current_optimizer:
             return
+        n, hits, distance_sum = bucket
+        self._pending_count -= n
         
         # Aggregate shots - use majority vote for hit/miss
-        hits = sum(1 for s in self.pending_shots if s['shot_data'].hit)
-        hit = hits > len(self.pending_shots) / 2
-        
-        # Use average coefficient value
-        avg_value = np.mean([s['coefficient_value'] for s in self.pending_shots])
-        
-        # Average distance
-        avg_distance = np.mean([s['shot_data'].distance for s in self.pending_shots])
-        
-        # Report to optimizer
+        hit = 2 * hits > n
         additional_data = {
-            'distance': avg_distance,
-            'num_shots': len(self.pending_shots),
-            'hit_rate': hits / len(self.pending_shots),
+            'distance': distance_sum / n,
+            'num_shots': n,
+            'hit_rate': hits / n,
         }
         
-        self.current_optimizer.report_result(avg_value, hit, additional_data)
-        
-        # Clear pending shots
-        self.pending_shots = []
+        score = self.current_optimizer.report_result(value, hit, additional_data)
+        if score is not None:
+            values = dict(self._coefficient_values)
+            values[self.current_optimizer.coeff_config.name] = float(value)
+            self.observations.append((values, score))
         
         # Check for convergence
         if self.current_optimizer.is_converged():
             stats = self.current_optimizer.get_statistics()
-            logger.info(f"Coefficient {stats['coefficient_name']} converged: best={stats['best_value']:.6f}, hit_rate={stats['hit_rate']:.2%}")
+            logger.info("Coefficient %s converged: best=%.6f, hit_rate=%.2f%%",
+                        stats['coefficient_name'], stats['best_value'], stats['hit_rate'] * 100)
             
             self.completed_coefficients.append(self.current_optimizer)
             self.current_index += 1
@@ -404,13 +730,13 @@ class CoefficientTuner:
         
         if self.current_optimizer:
             coeff_name = self.current_optimizer.coeff_config.name
-            logger.info(f"Manually advancing from {coeff_name} to next coefficient")
+            logger.info("Manually advancing from %s to next coefficient", coeff_name)
             
             # Optionally save current optimizer to completed list
             self.completed_coefficients.append(self.current_optimizer)
         
         # Clear pending shots
-        self.pending_shots = []
+        self._clear_pending_shots()
         
         # Move to next
         self.current_index += 1
@@ -437,10 +763,10 @@ class CoefficientTuner:
         
         if self.current_optimizer:
             coeff_name = self.current_optimizer.coeff_config.name
-            logger.info(f"Going back from {coeff_name} to previous coefficient")
+            logger.info("Going back from %s to previous coefficient", coeff_name)
         
         # Clear pending shots
-        self.pending_shots = []
+        self._clear_pending_shots()
         
         # Move to previous
         self.current_index -= 1
@@ -0,0 +1,39 @@
+"""
+Shared TunerConfig fixture for the configuration test modules.
+
+TunerConfig() reads the toggle and coefficient files, so one instance is built
+on first use and never used directly; tests get copies so cached properties
+and coefficient edits stay per-test.
+"""
+
+import sys
+import os
+import unittest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import TunerConfig
+
+
+_BASE_CONFIG = None
+
+
+def base_config() -> TunerConfig:
+    """The shared TunerConfig (read-only; tests modify copies)."""
+    global _BASE_CONFIG
+    if _BASE_CONFIG is None:
+        _BASE_CONFIG = TunerConfig()
+    return _BASE_CONFIG
+
+
+def config_copy() -> TunerConfig:
+    """Copy of the shared TunerConfig with its own coefficients."""
+    return base_config().copy()
+
+
+class SharedConfigTestCase(unittest.TestCase):
+    """Hands each test a cheap copy of the shared TunerConfig."""
+    
+    def setUp(self):
+        self.config = config_copy()
@@ -10,50 +10,53 @@ This test suite covers:
 - Runtime toggle changes
 """
 
+import itertools
 import unittest
-from unittest.mock import Mock, patch
 import sys
 import os
-import tempfile
-import shutil
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import TunerConfig, CoefficientConfig
+from tests.shared_config import SharedConfigTestCase
 
 
-class TestTunerEnabledToggle(unittest.TestCase):
+# Float coefficient on [0, 1]; tests override only the fields they exercise
+_COEFF_DEFAULTS = dict(
+    name="test_coeff",
+    default_value=0.5,
+    min_value=0.0,
+    max_value=1.0,
+    initial_step_size=0.1,
+    step_decay_rate=0.9,
+    is_integer=False,
+    enabled=True,
+    nt_key="/test",
+)
+
+
+def _make_coeff(**overrides) -> CoefficientConfig:
+    """Build a CoefficientConfig from the test defaults plus overrides."""
+    return CoefficientConfig(**{**_COEFF_DEFAULTS, **overrides})
+
+
+class TestTunerEnabledToggle(SharedConfigTestCase):
     """Test TUNER_ENABLED toggle in all scenarios."""
     
-    def test_tuner_enabled_true(self):
-        """Test tuner with TUNER_ENABLED = True."""
-        config = TunerConfig()
-        config.TUNER_ENABLED = True
-        
-        self.assertTrue(config.TUNER_ENABLED)
-    
-    def test_tuner_enabled_false(self):
-        """Test tuner with TUNER_ENABLED = False."""
-        config = TunerConfig()
-        config.TUNER_ENABLED = False
-        
-        self.assertFalse(config.TUNER_ENABLED)
-    
     def test_tuner_enabled_type_coercion(self):
         """Test type coercion for TUNER_ENABLED."""
-        config = TunerConfig()
+        config = self.config
         
-        # Integer coercion
-        config.TUNER_ENABLED = 1
-        self.assertTrue(bool(config.TUNER_ENABLED))
-        
-        config.TUNER_ENABLED = 0
-        self.assertFalse(bool(config.TUNER_ENABLED))
+        # Integer coercion, including values outside 0/1
+        for value in (0, 1, -1, 2, 10 ** 9, False, True):
+            with self.subTest(value=value):
+                config.TUNER_ENABLED = value
+                self.assertEqual(bool(config.TUNER_ENABLED), bool(value))
     
     def test_tuner_enabled_with_all_other_toggles_off(self):
         """Test TUNER_ENABLED=True with all other toggles off."""
-        config = TunerConfig()
+        config = self.config
         config.TUNER_ENABLED = True
         config.AUTOTUNE_ENABLED = False
         config.AUTO_ADVANCE_ON_SUCCESS = False
@@ -65,55 +68,17 @@ class TestTunerEnabledToggle(unittest.TestCase):
         self.assertFalse(config.AUTOTUNE_ENABLED)
 
 
-class TestAutotuneToggle(unittest.TestCase):
+class TestAutotuneToggle(SharedConfigTestCase):
     """Test AUTOTUNE_ENABLED toggle and related settings."""
     
-    def test_autotune_enabled_true(self):
-        """Test autotune enabled."""
-        config = TunerConfig()
-        config.AUTOTUNE_ENABLED = True
-        
-        self.assertTrue(config.AUTOTUNE_ENABLED)
-    
-    def test_autotune_enabled_false(self):
-        """Test autotune disabled (manual mode)."""
-        config = TunerConfig()
-        config.AUTOTUNE_ENABLED = False
-        
-        self.assertFalse(config.AUTOTUNE_ENABLED)
-    
-    def test_autotune_shot_threshold_minimum(self):
-        """Test minimum autotune shot threshold."""
-        config = TunerConfig()
-        config.AUTOTUNE_SHOT_THRESHOLD = 1
-        
-        self.assertEqual(config.AUTOTUNE_SHOT_THRESHOLD, 1)
-    
-    def test_autotune_shot_threshold_zero(self):
-        """Test zero autotune shot threshold."""
-        config = TunerConfig()
-        config.AUTOTUNE_SHOT_THRESHOLD = 0
-        
-        # Zero threshold edge case
-        self.assertEqual(config.AUTOTUNE_SHOT_THRESHOLD, 0)
-    
-    def test_autotune_shot_threshold_large(self):
-        """Test very large autotune shot threshold."""
-        config = TunerConfig()
-        config.AUTOTUNE_SHOT_THRESHOLD = 999999
-        
-        self.assertEqual(config.AUTOTUNE_SHOT_THRESHOLD, 999999)
-    
     def test_autotune_force_global_true(self):
         """Test autotune with force_global=True."""
-        config = TunerConfig()
+        config = self.config
         config.AUTOTUNE_ENABLED = True
         config.AUTOTUNE_FORCE_GLOBAL = True
         
         # All coefficients must use global
-        coeff = config.COEFFICIENTS["kDragCoefficient"]
-        coeff.autotune_override = True
-        coeff.autotune_enabled = False
+        coeff = _make_coeff(name="drag_test", autotune_override=True, autotune_enabled=False)
         
         enabled, _ = coeff.get_effective_autotune_settings(
             config.AUTOTUNE_ENABLED,
@@ -126,14 +91,12 @@ class TestAutotuneToggle(unittest.TestCase):
     
     def test_autotune_force_global_false(self):
         """Test autotune with force_global=False."""
-        config = TunerConfig()
+        config = self.config
         config.AUTOTUNE_ENABLED = True
         config.AUTOTUNE_FORCE_GLOBAL = False
         
         # Coefficients can override
-        coeff = config.COEFFICIENTS["kDragCoefficient"]
-        coeff.autotune_override = True
-        coeff.autotune_enabled = False
+        coeff = _make_coeff(name="drag_test", autotune_override=True, autotune_enabled=False)
         
         enabled, _ = coeff.get_effective_autotune_settings(
             config.AUTOTUNE_ENABLED,
@@ -144,53 +107,16 @@ class TestAutotuneToggle(unittest.TestCase):
         self.assertFalse(enabled)
 
 
-class TestAutoAdvanceToggle(unittest.TestCase):
+class TestAutoAdvanceToggle(SharedConfigTestCase):
     """Test AUTO_ADVANCE_ON_SUCCESS toggle and settings."""
     
-    def test_auto_advance_enabled_true(self):
-        """Test auto advance enabled."""
-        config = TunerConfig()
-        config.AUTO_ADVANCE_ON_SUCCESS = True
-        
-        self.assertTrue(config.AUTO_ADVANCE_ON_SUCCESS)
-    
-    def test_auto_advance_enabled_false(self):
-        """Test auto advance disabled."""
-        config = TunerConfig()
-        config.AUTO_ADVANCE_ON_SUCCESS = False
-        
-        self.assertFalse(config.AUTO_ADVANCE_ON_SUCCESS)
-    
-    def test_auto_advance_shot_threshold_minimum(self):
-        """Test minimum auto advance threshold."""
-        config = TunerConfig()
-        config.AUTO_ADVANCE_SHOT_THRESHOLD = 1
-        
-        self.assertEqual(config.AUTO_ADVANCE_SHOT_THRESHOLD, 1)
-    
-    def test_auto_advance_shot_threshold_zero(self):
-        """Test zero auto advance threshold."""
-        config = TunerConfig()
-        config.AUTO_ADVANCE_SHOT_THRESHOLD = 0
-        
-        self.assertEqual(config.AUTO_ADVANCE_SHOT_THRESHOLD, 0)
-    
-    def test_auto_advance_shot_threshold_large(self):
-        """Test large auto advance threshold."""
-        config = TunerConfig()
-        config.AUTO_ADVANCE_SHOT_THRESHOLD = 100000
-        
-        self.assertEqual(config.AUTO_ADVANCE_SHOT_THRESHOLD, 100000)
-    
     def test_auto_advance_force_global_true(self):
         """Test auto advance with force_global=True."""
-        config = TunerConfig()
+        config = self.config
         config.AUTO_ADVANCE_ON_SUCCESS = True
         config.AUTO_ADVANCE_FORCE_GLOBAL = True
         
-        coeff = config.COEFFICIENTS["kDragCoefficient"]
-        coeff.auto_advance_override = True
-        coeff.auto_advance_on_success = False
+        coeff = _make_coeff(name="drag_test", auto_advance_override=True, auto_advance_on_success=False)
         
         enabled, _ = coeff.get_effective_auto_advance_settings(
             config.AUTO_ADVANCE_ON_SUCCESS,
@@ -203,7 +129,7 @@ class TestAutoAdvanceToggle(unittest.TestCase):
     
     def test_auto_advance_independent_from_autotune(self):
         """Test auto advance works independently from autotune."""
-        config = TunerConfig()
+        config = self.config
         
         # Autotune off, auto advance on
         config.AUTOTUNE_ENABLED = False
@@ -213,40 +139,12 @@ class TestAutoAdvanceToggle(unittest.TestCase):
         self.assertTrue(config.AUTO_ADVANCE_ON_SUCCESS)
 
 
-class TestInterlockToggles(unittest.TestCase):
+class TestInterlockToggles(SharedConfigTestCase):
     """Test REQUIRE_SHOT_LOGGED and REQUIRE_COEFFICIENTS_UPDATED."""
     
-    def test_require_shot_logged_true(self):
-        """Test with shot logging required."""
-        config = TunerConfig()
-        config.REQUIRE_SHOT_LOGGED = True
-        
-        self.assertTrue(config.REQUIRE_SHOT_LOGGED)
-    
-    def test_require_shot_logged_false(self):
-        """Test with shot logging not required."""
-        config = TunerConfig()
-        config.REQUIRE_SHOT_LOGGED = False
-        
-        self.assertFalse(config.REQUIRE_SHOT_LOGGED)
-    
-    def test_require_coefficients_updated_true(self):
-        """Test with coefficient update required."""
-        config = TunerConfig()
-        config.REQUIRE_COEFFICIENTS_UPDATED = True
-        
-        self.assertTrue(config.REQUIRE_COEFFICIENTS_UPDATED)
-    
-    def test_require_coefficients_updated_false(self):
-        """Test with coefficient update not required."""
-        config = TunerConfig()
-        config.REQUIRE_COEFFICIENTS_UPDATED = False
-        
-        self.assertFalse(config.REQUIRE_COEFFICIENTS_UPDATED)
-    
     def test_both_interlocks_enabled(self):
         """Test with both interlocks enabled (most restrictive)."""
-        config = TunerConfig()
+        config = self.config
         config.REQUIRE_SHOT_LOGGED = True
         config.REQUIRE_COEFFICIENTS_UPDATED = True
         
@@ -255,25 +153,26 @@ class TestInterlockToggles(unittest.TestCase):
     
     def test_both_interlocks_disabled(self):
         """Test with both interlocks disabled (least restrictive)."""
-        config = TunerConfig()
+        config = self.config
         config.REQUIRE_SHOT_LOGGED = False
         config.REQUIRE_COEFFICIENTS_UPDATED = False
         
         self.assertFalse(config.REQUIRE_SHOT_LOGGED)
         self.assertFalse(config.REQUIRE_COEFFICIENTS_UPDATED)
     
+    # (REQUIRE_SHOT_LOGGED, REQUIRE_COEFFICIENTS_UPDATED) pairs
+    INTERLOCK_COMBINATIONS = (
+        (True, True),
+        (True, False),
+        (False, True),
+        (False, False)
+    )
+    
     def test_interlock_combinations(self):
         """Test all combinations of interlocks."""
-        config = TunerConfig()
-        
-        combinations = [
-            (True, True),
-            (True, False),
-            (False, True),
-            (False, False)
-        ]
+        config = self.config
         
-        for shot_logged, coeff_updated in combinations:
+        for shot_logged, coeff_updated in self.INTERLOCK_COMBINATIONS:
             config.REQUIRE_SHOT_LOGGED = shot_logged
             config.REQUIRE_COEFFICIENTS_UPDATED = coeff_updated
             
@@ -281,12 +180,21 @@ class TestInterlockToggles(unittest.TestCase):
             self.assertEqual(config.REQUIRE_COEFFICIENTS_UPDATED, coeff_updated)
 
 
-class TestCoefficientParameters(unittest.TestCase):
+class TestCoefficientParameters(SharedConfigTestCase):
     """Test all coefficient configuration parameters."""
     
+    @classmethod
+    def setUpClass(cls):
+        # Read-only tests share these instead of building their own
+        cls.FLOAT_COEFF = _make_coeff(name="float_coeff")
+        cls.INT_COEFF = _make_coeff(
+            name="int_coeff", default_value=20, min_value=10, max_value=30,
+            initial_step_size=1, is_integer=True
+        )
+    
     def test_coefficient_enabled_toggle(self):
         """Test coefficient enabled/disabled toggle."""
-        config = TunerConfig()
+        config = self.config
         
         # Test enabled
         coeff = config.COEFFICIENTS["kDragCoefficient"]
@@ -299,32 +207,15 @@ class TestCoefficientParameters(unittest.TestCase):
     
     def test_coefficient_default_value_boundaries(self):
         """Test coefficient default values at boundaries."""
-        coeff = CoefficientConfig(
-            name="boundary_test",
-            default_value=0.0,  # At minimum
-            min_value=0.0,
-            max_value=1.0,
-            initial_step_size=0.1,
-            step_decay_rate=0.9,
-            is_integer=False,
-            enabled=True,
-            nt_key="/test"
-        )
+        coeff = _make_coeff(name="boundary_test", default_value=0.0)  # At minimum
         
         self.assertEqual(coeff.default_value, 0.0)
     
     def test_coefficient_min_max_equal(self):
         """Test coefficient with min == max (fixed value)."""
-        coeff = CoefficientConfig(
-            name="fixed",
-            default_value=5.0,
-            min_value=5.0,
-            max_value=5.0,
-            initial_step_size=0.0,
-            step_decay_rate=0.9,
-            is_integer=False,
-            enabled=True,
-            nt_key="/test"
+        coeff = _make_coeff(
+            name="fixed", default_value=5.0, min_value=5.0, max_value=5.0,
+            initial_step_size=0.0
         )
         
         # Any value should clamp to 5.0
@@ -333,63 +224,23 @@ class TestCoefficientParameters(unittest.TestCase):
     
     def test_coefficient_initial_step_size_zero(self):
         """Test coefficient with zero step size."""
-        coeff = CoefficientConfig(
-            name="zero_step",
-            default_value=0.5,
-            min_value=0.0,
-            max_value=1.0,
-            initial_step_size=0.0,
-            step_decay_rate=0.9,
-            is_integer=False,
-            enabled=True,
-            nt_key="/test"
-        )
+        coeff = _make_coeff(name="zero_step", initial_step_size=0.0)
         
         self.assertEqual(coeff.initial_step_size, 0.0)
     
     def test_coefficient_step_decay_rate_boundaries(self):
         """Test step decay rate at boundaries."""
         # Minimum (approaches zero fast)
-        coeff_min = CoefficientConfig(
-            name="fast_decay",
-            default_value=0.5,
-            min_value=0.0,
-            max_value=1.0,
-            initial_step_size=0.1,
-            step_decay_rate=0.01,  # Very fast decay
-            is_integer=False,
-            enabled=True,
-            nt_key="/test"
-        )
+        coeff_min = _make_coeff(name="fast_decay", step_decay_rate=0.01)  # Very fast decay
         self.assertEqual(coeff_min.step_decay_rate, 0.01)
         
         # Maximum (slow decay)
-        coeff_max = CoefficientConfig(
-            name="slow_decay",
-            default_value=0.5,
-            min_value=0.0,
-            max_value=1.0,
-            initial_step_size=0.1,
-            step_decay_rate=0.999,  # Very slow decay
-            is_integer=False,
-            enabled=True,
-            nt_key="/test"
-        )
+        coeff_max = _make_coeff(name="slow_decay", step_decay_rate=0.999)  # Very slow decay
         self.assertEqual(coeff_max.step_decay_rate, 0.999)
     
     def test_coefficient_is_integer_true(self):
         """Test integer coefficient."""
-        coeff = CoefficientConfig(
-            name="int_coeff",
-            default_value=20,
-            min_value=10,
-            max_value=30,
-            initial_step_size=1,
-            step_decay_rate=0.9,
-            is_integer=True,
-            enabled=True,
-            nt_key="/test"
-        )
+        coeff = self.INT_COEFF
         
         # Should round floats
         self.assertEqual(coeff.clamp(20.7), 21)
@@ -397,17 +248,7 @@ class TestCoefficientParameters(unittest.TestCase):
     
     def test_coefficient_is_integer_false(self):
         """Test float coefficient."""
-        coeff = CoefficientConfig(
-            name="float_coeff",
-            default_value=0.5,
-            min_value=0.0,
-            max_value=1.0,
-            initial_step_size=0.1,
-            step_decay_rate=0.9,
-            is_integer=False,
-            enabled=True,
-            nt_key="/test"
-        )
+        coeff = self.FLOAT_COEFF
         
         # Should preserve decimals
         result = coeff.clamp(0.555)
@@ -423,20 +264,11 @@ class TestCoefficientParameters(unittest.TestCase):
             "no_leading_slash"
         ]
         
+        coeff = _make_coeff(name="key_test")
         for nt_key in formats:
-            coeff = CoefficientConfig(
-                name="key_test",
-                default_value=0.5,
-                min_value=0.0,
-                max_value=1.0,
-                initial_step_size=0.1,
-                step_decay_rate=0.9,
-                is_integer=False,
-                enabled=True,
-                nt_key=nt_key
-            )
-            
-            self.assertEqual(coeff.nt_key, nt_key)
+            with self.subTest(nt_key=nt_key):
+                coeff.nt_key = nt_key
+                self.assertEqual(coeff.nt_key, nt_key)
 
 
 class TestPerCoefficientOverrides(unittest.TestCase):
@@ -444,16 +276,8 @@ class TestPerCoefficientOverrides(unittest.TestCase):
     
     def test_autotune_override_enabled(self):
         """Test autotune override enabled."""
-        coeff = CoefficientConfig(
+        coeff = _make_coeff(
             name="override_test",
-            default_value=0.5,
-            min_value=0.0,
-            max_value=1.0,
-            initial_step_size=0.1,
-            step_decay_rate=0.9,
-            is_integer=False,
-            enabled=True,
-            nt_key="/test",
             autotune_override=True,
             autotune_enabled=True,
             autotune_shot_threshold=5
@@ -466,18 +290,7 @@ class TestPerCoefficientOverrides(unittest.TestCase):
     
     def test_autotune_override_disabled(self):
         """Test autotune override disabled."""
-        coeff = CoefficientConfig(
-            name="no_override",
-            default_value=0.5,
-            min_value=0.0,
-            max_value=1.0,
-            initial_step_size=0.1,
-            step_decay_rate=0.9,
-            is_integer=False,
-            enabled=True,
-            nt_key="/test",
-            autotune_override=False
-        )
+        coeff = _make_coeff(name="no_override", autotune_override=False)
         
         # Should use global settings
         enabled, threshold = coeff.get_effective_autotune_settings(True, 15)
@@ -486,16 +299,8 @@ class TestPerCoefficientOverrides(unittest.TestCase):
     
     def test_auto_advance_override_enabled(self):
         """Test auto advance override enabled."""
-        coeff = CoefficientConfig(
+        coeff = _make_coeff(
             name="advance_override",
-            default_value=0.5,
-            min_value=0.0,
-            max_value=1.0,
-            initial_step_size=0.1,
-            step_decay_rate=0.9,
-            is_integer=False,
-            enabled=True,
-            nt_key="/test",
             auto_advance_override=True,
             auto_advance_on_success=True,
             auto_advance_shot_threshold=7
@@ -508,16 +313,8 @@ class TestPerCoefficientOverrides(unittest.TestCase):
     
     def test_both_overrides_enabled(self):
         """Test both autotune and auto_advance overrides."""
-        coeff = CoefficientConfig(
+        coeff = _make_coeff(
             name="both_override",
-            default_value=0.5,
-            min_value=0.0,
-            max_value=1.0,
-            initial_step_size=0.1,
-            step_decay_rate=0.9,
-            is_integer=False,
-            enabled=True,
-            nt_key="/test",
             autotune_override=True,
             autotune_enabled=True,
             autotune_shot_threshold=5,
@@ -536,139 +333,72 @@ class TestPerCoefficientOverrides(unittest.TestCase):
         self.assertEqual(adv_thresh, 3)
 
 
-class TestOptimizationParameters(unittest.TestCase):
-    """Test optimization algorithm parameters."""
-    
-    def test_n_initial_points_minimum(self):
-        """Test minimum initial points."""
-        config = TunerConfig()
-        config.N_INITIAL_POINTS = 1
-        
-        self.assertEqual(config.N_INITIAL_POINTS, 1)
-    
-    def test_n_initial_points_zero(self):
-        """Test zero initial points."""
-        config = TunerConfig()
-        config.N_INITIAL_POINTS = 0
-        
-        self.assertEqual(config.N_INITIAL_POINTS, 0)
-    
-    def test_n_initial_points_large(self):
-        """Test large initial points."""
-        config = TunerConfig()
-        config.N_INITIAL_POINTS = 100
-        
-        self.assertEqual(config.N_INITIAL_POINTS, 100)
-    
-    def test_n_calls_per_coefficient_minimum(self):
-        """Test minimum calls per coefficient."""
-        config = TunerConfig()
-        config.N_CALLS_PER_COEFFICIENT = 1
-        
-        self.assertEqual(config.N_CALLS_PER_COEFFICIENT, 1)
-    
-    def test_n_calls_per_coefficient_large(self):
-        """Test large calls per coefficient."""
-        config = TunerConfig()
-        config.N_CALLS_PER_COEFFICIENT = 1000
-        
-        self.assertEqual(config.N_CALLS_PER_COEFFICIENT, 1000)
+class TestToggleValues(SharedConfigTestCase):
+    """Test boolean toggles can be switched on and off."""
+    
+    TOGGLES = (
+        "TUNER_ENABLED",
+        "AUTOTUNE_ENABLED",
+        "AUTO_ADVANCE_ON_SUCCESS",
+        "REQUIRE_SHOT_LOGGED",
+        "REQUIRE_COEFFICIENTS_UPDATED",
+        "NT_BATCH_WRITES",
+    )
+    
+    def test_toggles_round_trip(self):
+        """Test each toggle keeps True and False."""
+        config = self.config
+        for attr in self.TOGGLES:
+            for value in (True, False):
+                with self.subTest(attr=attr, value=value):
+                    setattr(config, attr, value)
+                    self.assertIs(getattr(config, attr), value)
 
 
-class TestRateLimitingParameters(unittest.TestCase):
-    """Test NetworkTables rate limiting parameters."""
-    
-    def test_max_write_rate_minimum(self):
-        """Test minimum write rate."""
-        config = TunerConfig()
-        config.MAX_NT_WRITE_RATE_HZ = 0.1  # Very slow
-        
-        self.assertEqual(config.MAX_NT_WRITE_RATE_HZ, 0.1)
-    
-    def test_max_write_rate_maximum(self):
-        """Test maximum write rate."""
-        config = TunerConfig()
-        config.MAX_NT_WRITE_RATE_HZ = 100.0  # Very fast
-        
-        self.assertEqual(config.MAX_NT_WRITE_RATE_HZ, 100.0)
-    
-    def test_max_read_rate_minimum(self):
-        """Test minimum read rate."""
-        config = TunerConfig()
-        config.MAX_NT_READ_RATE_HZ = 0.5
-        
-        self.assertEqual(config.MAX_NT_READ_RATE_HZ, 0.5)
-    
-    def test_max_read_rate_maximum(self):
-        """Test maximum read rate."""
-        config = TunerConfig()
-        config.MAX_NT_READ_RATE_HZ = 200.0
-        
-        self.assertEqual(config.MAX_NT_READ_RATE_HZ, 200.0)
-    
-    def test_batch_writes_enabled(self):
-        """Test batch writes enabled."""
-        config = TunerConfig()
-        config.NT_BATCH_WRITES = True
-        
-        self.assertTrue(config.NT_BATCH_WRITES)
-    
-    def test_batch_writes_disabled(self):
-        """Test batch writes disabled."""
-        config = TunerConfig()
-        config.NT_BATCH_WRITES = False
-        
-        self.assertFalse(config.NT_BATCH_WRITES)
+class TestParameterValues(SharedConfigTestCase):
+    """Test numeric parameters accept boundary and extreme values."""
+    
+    # (attribute, value) pairs: thresholds, optimization budget, NT rates
+    # and physical limits at their minimum, zero and large values
+    VALUES = [
+        ("AUTOTUNE_SHOT_THRESHOLD", 1),
+        ("AUTOTUNE_SHOT_THRESHOLD", 0),
+        ("AUTOTUNE_SHOT_THRESHOLD", 999999),
+        ("AUTO_ADVANCE_SHOT_THRESHOLD", 1),
+        ("AUTO_ADVANCE_SHOT_THRESHOLD", 0),
+        ("AUTO_ADVANCE_SHOT_THRESHOLD", 100000),
+        ("N_INITIAL_POINTS", 1),
+        ("N_INITIAL_POINTS", 0),
+        ("N_INITIAL_POINTS", 100),
+        ("N_CALLS_PER_COEFFICIENT", 1),
+        ("N_CALLS_PER_COEFFICIENT", 1000),
+        ("MAX_NT_WRITE_RATE_HZ", 0.1),  # Very slow
+        ("MAX_NT_WRITE_RATE_HZ", 100.0),  # Very fast
+        ("MAX_NT_READ_RATE_HZ", 0.5),
+        ("MAX_NT_READ_RATE_HZ", 200.0),
+        ("PHYSICAL_MAX_VELOCITY_MPS", 50.0),
+        ("PHYSICAL_MIN_VELOCITY_MPS", 0.1),
+        ("PHYSICAL_MAX_ANGLE_RAD", 1.57),  # ~90 degrees
+        ("PHYSICAL_MIN_ANGLE_RAD", 0.0),
+        ("PHYSICAL_MAX_DISTANCE_M", 20.0),
+        ("PHYSICAL_MIN_DISTANCE_M", 0.5),
+    ]
+    
+    def test_parameter_values_round_trip(self):
+        """Test each parameter keeps the value it is set to."""
+        config = self.config
+        for attr, value in self.VALUES:
+            with self.subTest(attr=attr, value=value):
+                setattr(config, attr, value)
+                self.assertEqual(getattr(config, attr), value)
 
 
-class TestPhysicalLimitParameters(unittest.TestCase):
+class TestPhysicalLimitParameters(SharedConfigTestCase):
     """Test physical limit safety parameters."""
     
-    def test_physical_max_velocity_boundary(self):
-        """Test physical max velocity at boundary."""
-        config = TunerConfig()
-        config.PHYSICAL_MAX_VELOCITY_MPS = 50.0
-        
-        self.assertEqual(config.PHYSICAL_MAX_VELOCITY_MPS, 50.0)
-    
-    def test_physical_min_velocity_boundary(self):
-        """Test physical min velocity at boundary."""
-        config = TunerConfig()
-        config.PHYSICAL_MIN_VELOCITY_MPS = 0.1
-        
-        self.assertEqual(config.PHYSICAL_MIN_VELOCITY_MPS, 0.1)
-    
-    def test_physical_max_angle_boundary(self):
-        """Test physical max angle."""
-        config = TunerConfig()
-        config.PHYSICAL_MAX_ANGLE_RAD = 1.57  # ~90 degrees
-        
-        self.assertAlmostEqual(config.PHYSICAL_MAX_ANGLE_RAD, 1.57)
-    
-    def test_physical_min_angle_boundary(self):
-        """Test physical min angle."""
-        config = TunerConfig()
-        config.PHYSICAL_MIN_ANGLE_RAD = 0.0
-        
-        self.assertEqual(config.PHYSICAL_MIN_ANGLE_RAD, 0.0)
-    
-    def test_physical_max_distance_boundary(self):
-        """Test physical max distance."""
-        config = TunerConfig()
-        config.PHYSICAL_MAX_DISTANCE_M = 20.0
-        
-        self.assertEqual(config.PHYSICAL_MAX_DISTANCE_M, 20.0)
-    
-    def test_physical_min_distance_boundary(self):
-        """Test physical min distance."""
-        config = TunerConfig()
-        config.PHYSICAL_MIN_DISTANCE_M = 0.5
-        
-        self.assertEqual(config.PHYSICAL_MIN_DISTANCE_M, 0.5)
-    
     def test_physical_limits_all_at_extremes(self):
         """Test all physical limits at extreme values."""
-        config = TunerConfig()
+        config = self.config
         
         # Set to extreme but valid values
         config.PHYSICAL_MAX_VELOCITY_MPS = 100.0
@@ -684,65 +414,58 @@ class TestPhysicalLimitParameters(unittest.TestCase):
         self.assertGreater(config.PHYSICAL_MAX_DISTANCE_M, 0)
 
 
-class TestAllToggleCombinations(unittest.TestCase):
+class TestAllToggleCombinations(SharedConfigTestCase):
     """Test all possible combinations of toggles."""
     
-    def test_all_toggles_matrix(self):
-        """Test all 2^6 = 64 combinations of 6 main toggles."""
-        config = TunerConfig()
-        
-        # Test all binary combinations
-        for tuner_en in [False, True]:
-            for autotune_en in [False, True]:
-                for auto_adv in [False, True]:
-                    for force_auto in [False, True]:
-                        for force_adv in [False, True]:
-                            for shot_log in [False, True]:
-                                config.TUNER_ENABLED = tuner_en
-                                config.AUTOTUNE_ENABLED = autotune_en
-                                config.AUTO_ADVANCE_ON_SUCCESS = auto_adv
-                                config.AUTOTUNE_FORCE_GLOBAL = force_auto
-                                config.AUTO_ADVANCE_FORCE_GLOBAL = force_adv
-                                config.REQUIRE_SHOT_LOGGED = shot_log
-                                
-                                # All should be valid states
-                                self.assertEqual(config.TUNER_ENABLED, tuner_en)
-                                self.assertEqual(config.AUTOTUNE_ENABLED, autotune_en)
-                                self.assertEqual(config.AUTO_ADVANCE_ON_SUCCESS, auto_adv)
+    # Every on/off assignment of a global toggle, its force-global flag and
+    # a coefficient's local override, for autotune and auto-advance
+    TOGGLE_COMBINATIONS = tuple(itertools.product((False, True), repeat=6))
     
-    def test_most_restrictive_combination(self):
-        """Test most restrictive toggle combination."""
-        config = TunerConfig()
-        
-        # Everything enabled/required
-        config.TUNER_ENABLED = True
-        config.AUTOTUNE_ENABLED = True
-        config.AUTO_ADVANCE_ON_SUCCESS = True
-        config.AUTOTUNE_FORCE_GLOBAL = True
-        config.AUTO_ADVANCE_FORCE_GLOBAL = True
-        config.REQUIRE_SHOT_LOGGED = True
-        config.REQUIRE_COEFFICIENTS_UPDATED = True
-        
-        # All should be True
-        self.assertTrue(config.TUNER_ENABLED)
-        self.assertTrue(config.AUTOTUNE_FORCE_GLOBAL)
-    
-    def test_most_permissive_combination(self):
-        """Test most permissive toggle combination."""
-        config = TunerConfig()
-        
-        # Everything disabled/not required
-        config.TUNER_ENABLED = False
-        config.AUTOTUNE_ENABLED = False
-        config.AUTO_ADVANCE_ON_SUCCESS = False
-        config.AUTOTUNE_FORCE_GLOBAL = False
-        config.AUTO_ADVANCE_FORCE_GLOBAL = False
-        config.REQUIRE_SHOT_LOGGED = False
-        config.REQUIRE_COEFFICIENTS_UPDATED = False
-        
-        # All should be False
-        self.assertFalse(config.TUNER_ENABLED)
-        self.assertFalse(config.AUTOTUNE_FORCE_GLOBAL)
+    def test_all_toggles_matrix(self):
+        """Test all 2^6 = 64 combinations resolve autotune and auto-advance by priority."""
+        config = self.config
+        coeff = config.COEFFICIENTS["kDragCoefficient"]
+        coeff.autotune_shot_threshold = config.AUTOTUNE_SHOT_THRESHOLD + 1
+        coeff.auto_advance_shot_threshold = config.AUTO_ADVANCE_SHOT_THRESHOLD + 1
+        
+        for combo in self.TOGGLE_COMBINATIONS:
+            autotune_en, force_auto, auto_override, auto_adv, force_adv, adv_override = combo
+            with self.subTest(autotune_en=autotune_en, force_auto=force_auto,
+                              auto_override=auto_override, auto_adv=auto_adv,
+                              force_adv=force_adv, adv_override=adv_override):
+                config.AUTOTUNE_ENABLED = autotune_en
+                config.AUTOTUNE_FORCE_GLOBAL = force_auto
+                config.AUTO_ADVANCE_ON_SUCCESS = auto_adv
+                config.AUTO_ADVANCE_FORCE_GLOBAL = force_adv
+                # Local settings always disagree with the global ones
+                coeff.autotune_override = auto_override
+                coeff.autotune_enabled = not autotune_en
+                coeff.auto_advance_override = adv_override
+                coeff.auto_advance_on_success = not auto_adv
+                
+                # Priority: force_global > local override > global default
+                if force_auto or not auto_override:
+                    expected_autotune = (autotune_en, config.AUTOTUNE_SHOT_THRESHOLD)
+                else:
+                    expected_autotune = (not autotune_en, coeff.autotune_shot_threshold)
+                if force_adv or not adv_override:
+                    expected_advance = (auto_adv, config.AUTO_ADVANCE_SHOT_THRESHOLD)
+                else:
+                    expected_advance = (not auto_adv, coeff.auto_advance_shot_threshold)
+                
+                self.assertEqual(
+                    (
+                        coeff.get_effective_autotune_settings(
+                            config.AUTOTUNE_ENABLED, config.AUTOTUNE_SHOT_THRESHOLD,
+                            config.AUTOTUNE_FORCE_GLOBAL),
+                        coeff.get_effective_auto_advance_settings(
+                            config.AUTO_ADVANCE_ON_SUCCESS, config.AUTO_ADVANCE_SHOT_THRESHOLD,
+                            config.AUTO_ADVANCE_FORCE_GLOBAL),
+                        coeff.get_effective_auto_advance(
+                            config.AUTO_ADVANCE_ON_SUCCESS, config.AUTO_ADVANCE_FORCE_GLOBAL),
+                    ),
+                    (expected_autotune, expected_advance, expected_advance[0]),
+                )
 
 
 if __name__ == '__main__':
@@ -2,9 +2,27 @@
 Unit tests for the configuration module.
 """
 
+import sys
+import os
 import unittest
-from tuner.config import TunerConfig, CoefficientConfig
+import numpy as np
 
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import TunerConfig, CoefficientConfig, _read_toggles
+from tests.shared_config import config_copy
+
+
+# Coefficients FiringSolver expects every config to define
+REQUIRED_COEFFICIENTS = frozenset({
+    "kDragCoefficient",
+    "kVelocityIterationCount",
+    "kAngleIterationCount",
+    "kVelocityTolerance",
+    "kAngleTolerance",
+    "kLaunchHeight",
+})
 
 class TestCoefficientConfig(unittest.TestCase):
     """Test CoefficientConfig class."""
@@ -45,14 +63,77 @@ class TestCoefficientConfig(unittest.TestCase):
         self.assertEqual(config.clamp(25.6), 26)  # Round
         self.assertEqual(config.clamp(5), 10)
         self.assertEqual(config.clamp(60), 50)
+    
+    def test_clamp_array_matches_clamp(self):
+        """Test batched clamp agrees with scalar clamp."""
+        for is_integer in (False, True):
+            config = CoefficientConfig(
+                name="test",
+                default_value=20,
+                min_value=10,
+                max_value=50,
+                initial_step_size=5,
+                step_decay_rate=0.85,
+                is_integer=is_integer,
+                enabled=True,
+                nt_key="/test"
+            )
+            
+            values = [5.0, 10.0, 24.5, 25.5, 25.6, 49.9, 60.0,
+                      float('nan'), float('inf'), float('-inf')]
+            clamped = config.clamp_array(values)
+            
+            self.assertIsInstance(clamped, np.ndarray)
+            self.assertEqual(clamped.tolist(), [config.clamp(v) for v in values])
 
+    
+    @unittest.skipIf(sys.version_info < (3, 10), "dataclass slots need Python 3.10+")
+    def test_no_instance_dict(self):
+        """Test coefficients are slotted, so instances carry no __dict__."""
+        config = CoefficientConfig(
+            name="test",
+            default_value=0.5,
+            min_value=0.0,
+            max_value=1.0,
+            initial_step_size=0.1,
+            step_decay_rate=0.9,
+            is_integer=False,
+            enabled=True,
+            nt_key="/test"
+        )
+        
+        self.assertFalse(hasattr(config, '__dict__'))
+        with self.assertRaises(AttributeError):
+            config.undeclared_field = 1
+    
+    def test_schedule_matches_scalar_decay(self):
+        """Test precomputed step schedule equals per-iteration decay with floor."""
+        config = CoefficientConfig(
+            name="test",
+            default_value=0.5,
+            min_value=0.0,
+            max_value=1.0,
+            initial_step_size=0.1,
+            step_decay_rate=0.5,
+            is_integer=False,
+            enabled=True,
+            nt_key="/test"
+        )
+        
+        steps = config.schedule(10, 0.05)
+        
+        self.assertEqual(len(steps), 10)
+        for i, step in enumerate(steps):
+            self.assertAlmostEqual(step, max(0.1 * 0.05, 0.1 * 0.5 ** i))
+        self.assertIs(config.schedule(10, 0.05), steps)
+        self.assertFalse(steps.flags.writeable)
 
 class TestTunerConfig(unittest.TestCase):
     """Test TunerConfig class."""
     
     def test_default_config(self):
         """Test default configuration."""
-        config = TunerConfig()
+        config = config_copy()
         
         # Tuner is disabled by default for safety - must be explicitly enabled
         self.assertFalse(config.TUNER_ENABLED)
@@ -61,9 +142,19 @@ class TestTunerConfig(unittest.TestCase):
         self.assertGreater(len(config.COEFFICIENTS), 0)
         self.assertGreater(len(config.TUNING_ORDER), 0)
     
+    def test_toggles_parsed_once(self):
+        """Test TUNER_TOGGLES.ini is not re-parsed for every TunerConfig."""
+        TunerConfig()
+        misses = _read_toggles.cache_info().misses
+        
+        config = TunerConfig()
+        
+        self.assertEqual(_read_toggles.cache_info().misses, misses)
+        self.assertIsInstance(config.TUNER_ENABLED, bool)
+    
     def test_get_enabled_coefficients_in_order(self):
         """Test getting enabled coefficients in order."""
-        config = TunerConfig()
+        config = config_copy()
         
         enabled = config.get_enabled_coefficients_in_order()
         
@@ -75,14 +166,61 @@ class TestTunerConfig(unittest.TestCase):
         expected_order = [n for n in config.TUNING_ORDER if n in names]
         self.assertEqual(names, expected_order)
     
+    def test_tuning_order_assignment_refreshes_caches(self):
+        """Test assigning TUNING_ORDER reorders coefficients and drops cached warnings."""
+        config = config_copy()
+        before = [c.name for c in config.get_enabled_coefficients_in_order()]
+        self.assertEqual(config.validation_warnings, ())
+        
+        config.TUNING_ORDER = config.TUNING_ORDER[::-1]
+        
+        self.assertEqual([c.name for c in config.get_enabled_coefficients_in_order()],
+                         before[::-1])
+        
+        config.TUNING_ORDER += ("NotDefined",)
+        
+        self.assertEqual(config.validation_warnings,
+                         ("Coefficient 'NotDefined' in TUNING_ORDER but not defined",))
+    
     def test_validate_config_valid(self):
         """Test config validation with valid config."""
-        config = TunerConfig()
+        config = config_copy()
         warnings = config.validate_config()
         
         # Should have no warnings for default config
         self.assertEqual(len(warnings), 0)
     
+    def test_validate_config_coefficient_checks(self):
+        """Test every failing coefficient check is reported, in check order."""
+        config = config_copy()
+        coeff = config.COEFFICIENTS["kLaunchHeight"]
+        coeff.min_value, coeff.max_value = coeff.max_value, coeff.min_value
+        coeff.step_decay_rate = 1.5
+        config.COEFFICIENTS["kDragCoefficient"].initial_step_size = 0
+        config.COEFFICIENTS["kDragCoefficient"].default_value = float('nan')
+        
+        warnings = config.validate_config()
+        
+        self.assertEqual(warnings, [
+            "kDragCoefficient: default_value outside valid range",
+            "kDragCoefficient: initial_step_size must be positive",
+            "kLaunchHeight: min_value must be < max_value",
+            "kLaunchHeight: default_value outside valid range",
+            "kLaunchHeight: step_decay_rate must be in (0, 1]",
+        ])
+    
+    def test_validation_warnings_cached(self):
+        """Test cached warnings are reused and refreshed by validate_config()."""
+        config = config_copy()
+        
+        self.assertEqual(config.validation_warnings, ())
+        self.assertIs(config.validation_warnings, config.validation_warnings)
+        
+        config.N_INITIAL_POINTS = 0
+        warnings = config.validate_config()
+        self.assertIn("N_INITIAL_POINTS must be >= 1", warnings)
+        self.assertEqual(config.validation_warnings, tuple(warnings))
+    
     def test_validate_config_invalid_range(self):
         """Test config validation with invalid range."""
         # Test validation logic by checking a coefficient with swapped min/max
@@ -103,7 +241,7 @@ class TestTunerConfig(unittest.TestCase):
                                "Test coefficient should have invalid range")
         
         # Also test that the default config is valid
-        config = TunerConfig()
+        config = config_copy()
         warnings = config.validate_config()
         # All default coefficients should be valid
         for name, c in config.COEFFICIENTS.items():
@@ -112,22 +250,44 @@ class TestTunerConfig(unittest.TestCase):
     
     def test_coefficient_definitions(self):
         """Test that all required coefficients are defined."""
-        config = TunerConfig()
+        config = config_copy()
+        
+        self.assertEqual(REQUIRED_COEFFICIENTS - config.COEFFICIENTS.keys(), set())
+        
+        # Each is registered under its own name and has an NT key
+        mismatched = sorted(
+            name for name in REQUIRED_COEFFICIENTS
+            if config.COEFFICIENTS[name].name != name or config.COEFFICIENTS[name].nt_key is None
+        )
+        self.assertEqual(mismatched, [])
+    
+    def test_configs_do_not_share_state(self):
+        """Test that the cached coefficient file never leaks edits between configs."""
+        config1 = TunerConfig()
+        config1.COEFFICIENTS["kDragCoefficient"].autotune_override = True
+        config1.TUNING_ORDER = config1.TUNING_ORDER[::-1]
+        
+        config2 = TunerConfig()
+        
+        self.assertIsNot(config1.COEFFICIENTS["kDragCoefficient"],
+                         config2.COEFFICIENTS["kDragCoefficient"])
+        self.assertFalse(config2.COEFFICIENTS["kDragCoefficient"].autotune_override)
+        self.assertEqual(config2.TUNING_ORDER[0], "kDragCoefficient")
+
+    def test_copy_does_not_share_state(self):
+        """Test that copy() gives independent coefficients and fresh caches."""
+        config1 = TunerConfig()
+        enabled = config1.get_enabled_coefficients_in_order()
+        
+        config2 = config1.copy()
+        config2.COEFFICIENTS["kDragCoefficient"].default_value = 999.0
         
-        required_coefficients = [
-            "kDragCoefficient",
-            "kVelocityIterationCount",
-            "kAngleIterationCount",
-            "kVelocityTolerance",
-            "kAngleTolerance",
-            "kLaunchHeight",
-        ]
-        
-        for name in required_coefficients:
-            self.assertIn(name, config.COEFFICIENTS)
-            coeff = config.COEFFICIENTS[name]
-            self.assertEqual(coeff.name, name)
-            self.assertIsNotNone(coeff.nt_key)
+        self.assertNotEqual(config1.COEFFICIENTS["kDragCoefficient"].default_value, 999.0)
+        self.assertEqual(config2.TUNING_ORDER, config1.TUNING_ORDER)
+        enabled2 = config2.get_enabled_coefficients_in_order()
+        self.assertEqual(len(enabled2), len(enabled))
+        for coeff in enabled2:
+            self.assertIs(coeff, config2.COEFFICIENTS[coeff.name])
 
 
 if __name__ == '__main__':
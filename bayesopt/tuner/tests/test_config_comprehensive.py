@@ -12,71 +12,87 @@ This test suite covers:
 """
 
 import unittest
-from unittest.mock import patch, mock_open, MagicMock
 import sys
 import os
 import tempfile
-import shutil
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import TunerConfig, CoefficientConfig
+from tests.shared_config import base_config, config_copy
 
 
 class TestCoefficientConfigEdgeCases(unittest.TestCase):
     """Comprehensive edge case tests for CoefficientConfig."""
     
-    def test_clamp_boundary_values_float(self):
-        """Test clamping at exact boundaries for floats."""
-        config = CoefficientConfig(
-            name="test",
-            default_value=0.5,
-            min_value=0.0,
-            max_value=1.0,
-            initial_step_size=0.1,
-            step_decay_rate=0.9,
-            is_integer=False,
-            enabled=True,
-            nt_key="/test"
-        )
-        
-        # Exact boundaries
-        self.assertEqual(config.clamp(0.0), 0.0)
-        self.assertEqual(config.clamp(1.0), 1.0)
-        
-        # Just inside boundaries
-        self.assertAlmostEqual(config.clamp(0.0001), 0.0001)
-        self.assertAlmostEqual(config.clamp(0.9999), 0.9999)
-        
-        # Just outside boundaries
-        self.assertEqual(config.clamp(-0.0001), 0.0)
-        self.assertEqual(config.clamp(1.0001), 1.0)
+    # Coefficients shared by the clamp cases, keyed by range; built once in setUpClass
+    CLAMP_CONFIGS = {
+        "float_unit": dict(default_value=0.5, min_value=0.0, max_value=1.0,
+                           initial_step_size=0.1, step_decay_rate=0.9, is_integer=False),
+        "signed_1e6": dict(default_value=0.0, min_value=-1e6, max_value=1e6,
+                           initial_step_size=1.0, step_decay_rate=0.9, is_integer=False),
+        "int_10_50": dict(default_value=20, min_value=10, max_value=50,
+                          initial_step_size=5, step_decay_rate=0.85, is_integer=True),
+        "zero_range": dict(default_value=5.0, min_value=5.0, max_value=5.0,
+                           initial_step_size=0.0, step_decay_rate=0.9, is_integer=False),
+        "negative_range": dict(default_value=-5.0, min_value=-10.0, max_value=-1.0,
+                               initial_step_size=1.0, step_decay_rate=0.9, is_integer=False),
+        "nan_default": dict(default_value=float('nan'), min_value=0.0, max_value=1.0,
+                            initial_step_size=0.1, step_decay_rate=0.9, is_integer=False),
+    }
     
-    def test_clamp_extreme_values(self):
-        """Test clamping with extreme values."""
-        config = CoefficientConfig(
-            name="test",
-            default_value=0.0,
-            min_value=-1e6,
-            max_value=1e6,
-            initial_step_size=1.0,
-            step_decay_rate=0.9,
-            is_integer=False,
-            enabled=True,
-            nt_key="/test"
-        )
-        
-        # Very large values
-        self.assertEqual(config.clamp(1e10), 1e6)
-        self.assertEqual(config.clamp(-1e10), -1e6)
-        
-        # Very small values
-        self.assertAlmostEqual(config.clamp(1e-10), 1e-10)
-        
-        # Infinity
-        self.assertEqual(config.clamp(float('inf')), 1e6)
-        self.assertEqual(config.clamp(float('-inf')), -1e6)
+    # (config key, input, expected clamp result)
+    CLAMP_CASES = [
+        # Exact boundaries, just inside and just outside
+        ("float_unit", 0.0, 0.0),
+        ("float_unit", 1.0, 1.0),
+        ("float_unit", 0.0001, 0.0001),
+        ("float_unit", 0.9999, 0.9999),
+        ("float_unit", -0.0001, 0.0),
+        ("float_unit", 1.0001, 1.0),
+        # Very large, very small and infinite values
+        ("signed_1e6", 1e10, 1e6),
+        ("signed_1e6", -1e10, -1e6),
+        ("signed_1e6", 1e-10, 1e-10),
+        ("signed_1e6", float('inf'), 1e6),
+        ("signed_1e6", float('-inf'), -1e6),
+        # Rounding at .5 (Python 3 uses banker's rounding: round half to even)
+        ("int_10_50", 25.5, 26),
+        ("int_10_50", 26.5, 26),
+        # Rounding just inside the boundaries
+        ("int_10_50", 10.4, 10),
+        ("int_10_50", 10.6, 11),
+        ("int_10_50", 49.4, 49),
+        ("int_10_50", 49.6, 50),
+        # Everything clamps to the single allowed value when min equals max
+        ("zero_range", 0.0, 5.0),
+        ("zero_range", 5.0, 5.0),
+        ("zero_range", 10.0, 5.0),
+        # Negative value ranges
+        ("negative_range", -5.0, -5.0),
+        ("negative_range", -15.0, -10.0),
+        ("negative_range", 0.0, -1.0),
+        # NaN falls back to the default, or to min_value when the default is NaN
+        ("float_unit", float('nan'), 0.5),
+        ("int_10_50", float('nan'), 20),
+        ("nan_default", float('nan'), 0.0),
+        ("nan_default", 0.25, 0.25),
+    ]
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.configs = {
+            key: CoefficientConfig(name=key, enabled=True, nt_key="/test", **kwargs)
+            for key, kwargs in cls.CLAMP_CONFIGS.items()
+        }
+    
+    def test_clamp_cases(self):
+        """Test clamping at boundaries, extremes, integer rounding and odd ranges."""
+        for key, value, expected in self.CLAMP_CASES:
+            with self.subTest(config=key, value=value):
+                self.assertEqual(self.configs[key].clamp(value), expected)
+                self.assertEqual(self.configs[key].clamp_array([value]).tolist(), [expected])
     
     def test_clamp_nan_handling(self):
         """Test that NaN is handled properly."""
@@ -92,73 +108,9 @@ class TestCoefficientConfigEdgeCases(unittest.TestCase):
             nt_key="/test"
         )
         
-        # NaN should be clamped (behavior may vary)
-        result = config.clamp(float('nan'))
-        # NaN comparisons are always False, so check if result is NaN
-        self.assertTrue(result != result or result == 0.0 or result == 1.0)
-    
-    def test_clamp_integer_rounding_edge_cases(self):
-        """Test integer rounding at boundaries."""
-        config = CoefficientConfig(
-            name="test",
-            default_value=20,
-            min_value=10,
-            max_value=50,
-            initial_step_size=5,
-            step_decay_rate=0.85,
-            is_integer=True,
-            enabled=True,
-            nt_key="/test"
-        )
-        
-        # Rounding at .5 (Python 3 uses banker's rounding: round half to even)
-        self.assertEqual(config.clamp(25.5), 26)  # 25.5 rounds to 26 (even)
-        self.assertEqual(config.clamp(26.5), 26)  # 26.5 rounds to 26 (even)
-        
-        # Rounding just below boundary
-        self.assertEqual(config.clamp(10.4), 10)
-        self.assertEqual(config.clamp(10.6), 11)
-        
-        # Rounding just above boundary
-        self.assertEqual(config.clamp(49.4), 49)
-        self.assertEqual(config.clamp(49.6), 50)
-    
-    def test_clamp_zero_range(self):
-        """Test clamping when min equals max."""
-        config = CoefficientConfig(
-            name="test",
-            default_value=5.0,
-            min_value=5.0,
-            max_value=5.0,
-            initial_step_size=0.0,
-            step_decay_rate=0.9,
-            is_integer=False,
-            enabled=True,
-            nt_key="/test"
-        )
-        
-        # Everything should clamp to the single allowed value
-        self.assertEqual(config.clamp(0.0), 5.0)
-        self.assertEqual(config.clamp(5.0), 5.0)
-        self.assertEqual(config.clamp(10.0), 5.0)
-    
-    def test_clamp_negative_range(self):
-        """Test clamping in negative value ranges."""
-        config = CoefficientConfig(
-            name="test",
-            default_value=-5.0,
-            min_value=-10.0,
-            max_value=-1.0,
-            initial_step_size=1.0,
-            step_decay_rate=0.9,
-            is_integer=False,
-            enabled=True,
-            nt_key="/test"
-        )
-        
-        self.assertEqual(config.clamp(-5.0), -5.0)
-        self.assertEqual(config.clamp(-15.0), -10.0)
-        self.assertEqual(config.clamp(0.0), -1.0)
+        # NaN falls back to the default value, for both the scalar and batched paths
+        self.assertEqual(config.clamp(float('nan')), config.default_value)
+        self.assertEqual(config.clamp_array([float('nan')]).tolist(), [config.default_value])
     
     def test_get_effective_autotune_settings_priority(self):
         """Test priority order for autotune settings."""
@@ -177,62 +129,50 @@ class TestCoefficientConfigEdgeCases(unittest.TestCase):
             autotune_shot_threshold=20
         )
         
-        # Local override should win
-        enabled, threshold = config.get_effective_autotune_settings(False, 10)
-        self.assertTrue(enabled)
-        self.assertEqual(threshold, 20)
-        
-        # Force global should override local
-        enabled, threshold = config.get_effective_autotune_settings(False, 10, force_global=True)
-        self.assertFalse(enabled)
-        self.assertEqual(threshold, 10)
-        
-        # Without override, should use global
-        config.autotune_override = False
-        enabled, threshold = config.get_effective_autotune_settings(False, 10)
-        self.assertFalse(enabled)
-        self.assertEqual(threshold, 10)
+        # (local override, force_global, expected): local override wins,
+        # force global beats it, and without override the global applies
+        cases = [
+            (True, False, (True, 20)),
+            (True, True, (False, 10)),
+            (False, False, (False, 10)),
+        ]
+        
+        for override, force_global, expected in cases:
+            with self.subTest(override=override, force_global=force_global):
+                config.autotune_override = override
+                self.assertEqual(
+                    config.get_effective_autotune_settings(False, 10, force_global=force_global),
+                    expected
+                )
+    
+    # Everything but nt_key for the key format test
+    NT_KEY_TEST_KWARGS = dict(
+        name="test",
+        default_value=0.5,
+        min_value=0.0,
+        max_value=1.0,
+        initial_step_size=0.1,
+        step_decay_rate=0.9,
+        is_integer=False,
+        enabled=True,
+    )
     
     def test_invalid_nt_key_formats(self):
         """Test handling of various NT key formats."""
-        # Valid keys
-        valid_keys = [
+        keys = [
+            # Valid keys
             "/test",
             "/Tuning/test",
             "/Tuning/BayesianTuner/test",
+            # Edge case keys (empty, special chars)
+            "", "/", "//", "/test/", "test",
         ]
         
-        for key in valid_keys:
-            config = CoefficientConfig(
-                name="test",
-                default_value=0.5,
-                min_value=0.0,
-                max_value=1.0,
-                initial_step_size=0.1,
-                step_decay_rate=0.9,
-                is_integer=False,
-                enabled=True,
-                nt_key=key
-            )
-            self.assertEqual(config.nt_key, key)
-        
-        # Edge case keys (empty, special chars)
-        edge_keys = ["", "/", "//", "/test/", "test"]
-        
-        for key in edge_keys:
-            config = CoefficientConfig(
-                name="test",
-                default_value=0.5,
-                min_value=0.0,
-                max_value=1.0,
-                initial_step_size=0.1,
-                step_decay_rate=0.9,
-                is_integer=False,
-                enabled=True,
-                nt_key=key
-            )
-            # Should accept any string
-            self.assertEqual(config.nt_key, key)
+        for key in keys:
+            with self.subTest(key=key):
+                config = CoefficientConfig(nt_key=key, **self.NT_KEY_TEST_KWARGS)
+                # Should accept any string
+                self.assertEqual(config.nt_key, key)
 
 
 class TestTunerConfigEdgeCases(unittest.TestCase):
@@ -240,7 +180,7 @@ class TestTunerConfigEdgeCases(unittest.TestCase):
     
     def test_config_with_no_enabled_coefficients(self):
         """Test behavior when all coefficients are disabled."""
-        config = TunerConfig()
+        config = config_copy()
         
         # Disable all coefficients
         for coeff in config.COEFFICIENTS.values():
@@ -253,7 +193,7 @@ class TestTunerConfigEdgeCases(unittest.TestCase):
     
     def test_config_with_empty_tuning_order(self):
         """Test behavior with empty tuning order."""
-        config = TunerConfig()
+        config = config_copy()
         config.TUNING_ORDER = []
         
         enabled = config.get_enabled_coefficients_in_order()
@@ -263,7 +203,7 @@ class TestTunerConfigEdgeCases(unittest.TestCase):
     
     def test_config_with_mismatched_tuning_order(self):
         """Test when tuning order contains non-existent coefficients."""
-        config = TunerConfig()
+        config = config_copy()
         config.TUNING_ORDER = ["NonExistent1", "NonExistent2"]
         
         enabled = config.get_enabled_coefficients_in_order()
@@ -273,7 +213,7 @@ class TestTunerConfigEdgeCases(unittest.TestCase):
     
     def test_config_validation_multiple_warnings(self):
         """Test that all validation warnings are collected."""
-        config = TunerConfig()
+        config = config_copy()
         
         # Create intentionally invalid coefficient for testing
         # (In practice, config should be valid, but we test validation logic)
@@ -284,7 +224,7 @@ class TestTunerConfigEdgeCases(unittest.TestCase):
     
     def test_config_boundary_values(self):
         """Test configuration with boundary values."""
-        config = TunerConfig()
+        config = config_copy()
         
         # Test with extreme but valid values
         config.N_INITIAL_POINTS = 1  # Minimum
@@ -303,7 +243,7 @@ class TestTunerConfigEdgeCases(unittest.TestCase):
     
     def test_config_negative_values(self):
         """Test configuration rejects negative values where inappropriate."""
-        config = TunerConfig()
+        config = config_copy()
         
         # These should be positive
         config.AUTOTUNE_SHOT_THRESHOLD = -5
@@ -316,7 +256,7 @@ class TestTunerConfigEdgeCases(unittest.TestCase):
     
     def test_config_float_vs_int_parameters(self):
         """Test that numeric parameters handle both float and int."""
-        config = TunerConfig()
+        config = config_copy()
         
         # These should accept integers
         config.AUTOTUNE_SHOT_THRESHOLD = 10
@@ -328,7 +268,7 @@ class TestTunerConfigEdgeCases(unittest.TestCase):
     
     def test_config_unicode_coefficient_names(self):
         """Test coefficient names with unicode characters."""
-        config = TunerConfig()
+        config = config_copy()
         
         # Create coefficient with unicode name
         unicode_coeff = CoefficientConfig(
@@ -350,27 +290,28 @@ class TestTunerConfigEdgeCases(unittest.TestCase):
     
     def test_config_special_characters_in_paths(self):
         """Test handling of special characters in paths."""
-        config = TunerConfig()
+        config = config_copy()
         
         # Try various special characters in log directory
         special_chars = ["spaces in name", "under_score", "dash-name", "dots.in.name"]
         
-        for char_test in special_chars:
-            temp_dir = tempfile.mkdtemp(suffix=char_test)
-            try:
-                config.LOG_DIRECTORY = temp_dir
-                # Should accept the path
-                self.assertEqual(config.LOG_DIRECTORY, temp_dir)
-            finally:
-                shutil.rmtree(temp_dir, ignore_errors=True)
+        # One temporary root for every case, removed in a single pass
+        with tempfile.TemporaryDirectory() as root:
+            for char_test in special_chars:
+                with self.subTest(path=char_test):
+                    temp_dir = os.path.join(root, char_test)
+                    os.mkdir(temp_dir)
+                    config.LOG_DIRECTORY = temp_dir
+                    # Should accept the path
+                    self.assertEqual(config.LOG_DIRECTORY, temp_dir)
     
     def test_config_very_long_coefficient_list(self):
         """Test configuration with many coefficients."""
-        config = TunerConfig()
+        config = config_copy()
         
-        # Add many coefficients
-        for i in range(100):
-            config.COEFFICIENTS[f"coeff_{i}"] = CoefficientConfig(
+        # Add many coefficients in one bulk update
+        config.COEFFICIENTS.update({
+            f"coeff_{i}": CoefficientConfig(
                 name=f"coeff_{i}",
                 default_value=0.5,
                 min_value=0.0,
@@ -381,13 +322,15 @@ class TestTunerConfigEdgeCases(unittest.TestCase):
                 enabled=True,
                 nt_key=f"/coeff_{i}"
             )
+            for i in range(100)
+        })
         
         # Should handle large number of coefficients
-        self.assertEqual(len(config.COEFFICIENTS), 100 + len(TunerConfig().COEFFICIENTS))
+        self.assertEqual(len(config.COEFFICIENTS), 100 + len(base_config().COEFFICIENTS))
     
     def test_config_duplicate_coefficient_names(self):
         """Test behavior with duplicate coefficient names."""
-        config = TunerConfig()
+        config = config_copy()
         
         # Add same coefficient twice
         coeff1 = CoefficientConfig(
@@ -424,19 +367,6 @@ class TestTunerConfigEdgeCases(unittest.TestCase):
 class TestTunerConfigResourceHandling(unittest.TestCase):
     """Test resource handling and cleanup."""
     
-    def test_config_multiple_instances(self):
-        """Test that multiple config instances don't interfere."""
-        config1 = TunerConfig()
-        config2 = TunerConfig()
-        
-        # Modify one
-        config1.AUTOTUNE_ENABLED = True
-        config2.AUTOTUNE_ENABLED = False
-        
-        # Should be independent
-        self.assertTrue(config1.AUTOTUNE_ENABLED)
-        self.assertFalse(config2.AUTOTUNE_ENABLED)
-    
     def test_config_modification_isolation(self):
         """Test that modifying coefficients doesn't affect original."""
         config = TunerConfig()
@@ -448,9 +378,10 @@ class TestTunerConfigResourceHandling(unittest.TestCase):
         # Create new config
         config2 = TunerConfig()
         
-        # New config should have original value (if loading from file)
-        # Or should be independent (if not shared)
-        self.assertIsNotNone(config2.COEFFICIENTS["kDragCoefficient"].default_value)
+        # New config is loaded with the original value, not the edit
+        self.assertEqual(config2.COEFFICIENTS["kDragCoefficient"].default_value, original_value)
+        self.assertNotEqual(config.COEFFICIENTS["kDragCoefficient"].default_value,
+                            config2.COEFFICIENTS["kDragCoefficient"].default_value)
 
 
 if __name__ == '__main__':
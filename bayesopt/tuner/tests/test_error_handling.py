@@ -77,14 +77,17 @@ class TestNetworkTablesErrorHandling(unittest.TestCase):
         self.interface.firing_solver_table = Mock()
         
         # Mock partial data (some fields throw exceptions)
-        def mock_get_number(key, default):
+        def mock_get_entry(key):
+            entry = Mock()
             if "Distance" in key:
-                raise Exception("Field missing")
-            return default
-        
-        self.interface.firing_solver_table.getNumber = mock_get_number
-        self.interface.firing_solver_table.getBoolean = Mock(return_value=True)
-        self.interface.firing_solver_table.getSubTable = Mock(return_value=Mock())
+                entry.getDouble = Mock(side_effect=Exception("Field missing"))
+            else:
+                entry.getDouble = Mock(side_effect=lambda default: default)
+            entry.getBoolean = Mock(return_value=True)
+            return entry
+        
+        self.interface.firing_solver_table.getEntry = mock_get_entry
+        self.interface.firing_solver_table.getSubTable = Mock(return_value=Mock(getEntry=mock_get_entry))
         
         # Should handle gracefully
         result = self.interface.read_shot_data()
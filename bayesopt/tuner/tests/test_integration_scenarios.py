@@ -69,8 +69,9 @@ class TestEndToEndWorkflows(unittest.TestCase):
                 timestamp=time.time() + i * 0.1
             )
             
+            # New value after each validation round
             coefficient_values = {
-                coeff_name: 0.003 + i * 0.0001
+                coeff_name: 0.003 + (i // self.config.MIN_VALID_SHOTS_BEFORE_UPDATE) * 0.0001
             }
             
             tuner.record_shot(shot_data, coefficient_values)
@@ -240,7 +241,7 @@ class TestStressScenarios(unittest.TestCase):
                 enabled=True,
                 nt_key=f"/test_{i}"
             )
-            config.TUNING_ORDER.append(f"kTestCoeff_{i}")
+            config.TUNING_ORDER += (f"kTestCoeff_{i}",)
         
         # Should handle many coefficients
         tuner = CoefficientTuner(config)
@@ -393,7 +394,7 @@ class TestComplexStateTransitions(unittest.TestCase):
         original_order = list(config.TUNING_ORDER)
         
         # Reverse the order
-        config.TUNING_ORDER.reverse()
+        config.TUNING_ORDER = config.TUNING_ORDER[::-1]
         
         # Create new tuner with modified order
         tuner2 = CoefficientTuner(config)
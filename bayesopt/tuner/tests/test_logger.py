@@ -7,10 +7,11 @@ import tempfile
 import shutil
 from pathlib import Path
 import csv
+import json
 import time
 
 from tuner.config import TunerConfig
-from tuner.logger import TunerLogger
+from tuner.logger import TunerLogger, read_binary_log
 from tuner.nt_interface import ShotData
 
 
@@ -44,6 +45,27 @@ class TestTunerLogger(unittest.TestCase):
         self.assertIsNotNone(log_file)
         self.assertTrue(log_file.exists())
         self.assertTrue(str(log_file).endswith('.csv'))
+        self.assertEqual(
+            log_file.name,
+            f"{self.config.LOG_FILENAME_PREFIX}_{self.logger.session_start_time.strftime('%Y%m%d_%H%M%S')}.csv"
+        )
+    
+    def test_header_row(self):
+        """Test the directly-written header parses as the expected CSV row."""
+        with open(self.logger.csv_file, 'r', newline='') as f:
+            header = next(csv.reader(f))
+        
+        self.assertEqual(header, list(TunerLogger._CSV_HEADERS))
+        self.assertTrue(TunerLogger._CSV_HEADER_LINE.endswith('\r\n'))
+    
+    def test_log_directory_recreated_after_removal(self):
+        """Test a cached log directory that was deleted is created again."""
+        self.logger.close()
+        shutil.rmtree(self.temp_dir)
+        
+        self.logger = TunerLogger(self.config)
+        
+        self.assertTrue(self.logger.csv_file.exists())
     
     def test_log_shot(self):
         """Test logging shot data."""
@@ -85,18 +107,160 @@ class TestTunerLogger(unittest.TestCase):
             # Check data row has correct number of columns
             self.assertEqual(len(rows[1]), len(rows[0]))
     
+    def test_log_shot_buffered_until_flush(self):
+        """Test shot rows are batched and written on flush()."""
+        shot_data = ShotData(
+            hit=False,
+            distance=4.0,
+            angle=0.4,
+            velocity=12.0,
+            timestamp=time.time()
+        )
+        
+        self.logger._last_flush = time.monotonic()
+        self.logger.log_shot(
+            coefficient_name='kDragCoefficient',
+            coefficient_value=0.003,
+            step_size=0.001,
+            iteration=1,
+            shot_data=shot_data,
+            nt_connected=True,
+            match_mode=False,
+            tuner_status='Tuning',
+            all_coefficient_values={'kDragCoefficient': 0.003}
+        )
+        
+        with open(self.logger.csv_file, 'r') as f:
+            self.assertEqual(len(list(csv.reader(f))), 1)  # Header only
+        
+        self.logger.flush()
+        
+        with open(self.logger.csv_file, 'r') as f:
+            self.assertEqual(len(list(csv.reader(f))), 2)
+    
+    def test_buffered_rows_flushed_when_due_or_on_event(self):
+        """Test idle rows are written by flush_if_due() and by log_event()."""
+        shot_data = ShotData(hit=True, distance=4.0, angle=0.4, velocity=12.0,
+                             timestamp=time.time())
+        
+        def log_one():
+            self.logger._last_flush = time.monotonic()
+            self.logger.log_shot(
+                coefficient_name='kDragCoefficient',
+                coefficient_value=0.003,
+                step_size=0.001,
+                iteration=1,
+                shot_data=shot_data,
+                nt_connected=True,
+                match_mode=False,
+                tuner_status='Tuning',
+                all_coefficient_values={'kDragCoefficient': 0.003}
+            )
+        
+        def csv_rows():
+            with open(self.logger.csv_file, 'r') as f:
+                return len(list(csv.reader(f)))
+        
+        log_one()
+        self.logger.flush_if_due(self.logger._last_flush + 0.5 * self.logger._FLUSH_EVERY_S)
+        self.assertEqual(csv_rows(), 1)  # Not due yet
+        self.logger.flush_if_due(self.logger._last_flush + self.logger._FLUSH_EVERY_S)
+        self.assertEqual(csv_rows(), 2)
+        
+        log_one()
+        self.logger.log_event('TEST', 'event after a shot')
+        self.assertEqual(csv_rows(), 3)
+    
+    def test_format_shot_columns(self):
+        """Test shot columns line up with the header and blank missing data."""
+        shot_data = ShotData(
+            hit=True,
+            distance=0.0,  # Not reported
+            angle=0.5,
+            velocity=15.0,
+            timestamp=time.time()
+        )
+        
+        columns = TunerLogger._format_shot_columns(shot_data)
+        
+        self.assertEqual(len(columns), len(TunerLogger._SHOT_FIELDS) + 1)
+        self.assertEqual(columns[:5], [True, '', '0.500000', '15.000', '0.000000'])
+        self.assertEqual(TunerLogger._format_shot_columns(None), [''] * len(columns))
+    
+    def test_binary_log_round_trip(self):
+        """Test shots written to the binary log decode back to the logged values."""
+        self.config.LOG_CSV = False
+        self.config.LOG_BINARY = True
+        bin_logger = TunerLogger(self.config)
+        
+        self.assertIsNone(bin_logger.csv_file)
+        self.assertTrue(str(bin_logger.get_log_file_path()).endswith('.bin'))
+        
+        shot_data = ShotData(
+            hit=True,
+            distance=5.0,
+            angle=0.5,
+            velocity=15.0,
+            timestamp=time.time()
+        )
+        bin_logger.log_shot(
+            coefficient_name='kDragCoefficient',
+            coefficient_value=0.003,
+            step_size=0.001,
+            iteration=2,
+            shot_data=shot_data,
+            nt_connected=True,
+            match_mode=False,
+            tuner_status="Tuning",
+            all_coefficient_values={'kDragCoefficient': 0.003}
+        )
+        bin_logger.log_shot('kLaunchHeight', 0.8, 0.01, 3, None, False, False, "Idle", {})
+        bin_logger.close()
+        
+        records = list(read_binary_log(bin_logger.bin_file))
+        
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[0]['coefficient_value'], 0.003)
+        self.assertEqual(records[0]['iteration'], 2)
+        self.assertEqual(records[0]['shot_hit'], 1)
+        self.assertEqual(records[0]['shot_distance'], 5.0)
+        self.assertEqual(records[0]['coeff:kDragCoefficient'], 0.003)
+        self.assertTrue(records[0]['nt_connected'])
+        self.assertEqual(records[1]['shot_hit'], -1)
+        self.assertNotEqual(records[1]['shot_distance'], records[1]['shot_distance'])  # NaN
+    
+    def test_binary_only_records_flushed_when_due(self):
+        """Test binary records are written by flush_if_due() when CSV logging is off."""
+        self.config.LOG_CSV = False
+        self.config.LOG_BINARY = True
+        bin_logger = TunerLogger(self.config)
+        self.addCleanup(bin_logger.close)
+        header_size = Path(bin_logger.bin_file).stat().st_size
+        
+        bin_logger.log_shot('kLaunchHeight', 0.8, 0.01, 1, None, False, False, "Idle", {})
+        bin_logger.flush_if_due(bin_logger._last_flush + 0.5 * bin_logger._FLUSH_EVERY_S)
+        self.assertEqual(Path(bin_logger.bin_file).stat().st_size, header_size)  # Not due yet
+        bin_logger.flush_if_due(bin_logger._last_flush + bin_logger._FLUSH_EVERY_S)
+        self.assertEqual(Path(bin_logger.bin_file).stat().st_size,
+                         header_size + bin_logger._bin_record.size)
+    
     def test_log_event(self):
         """Test logging events."""
-        self.logger.log_event('TEST', 'Test event message')
+        self.logger.log_event('TEST', 'Test event message', {'count': 3})
         
         self.logger.close()
         
+        with open(self.logger.events_file, 'r') as f:
+            events = [json.loads(line) for line in f]
+        
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]['type'], 'TEST')
+        self.assertEqual(events[0]['msg'], 'Test event message')
+        self.assertEqual(events[0]['data'], {'count': 3})
+        
+        # Events stay out of the shot CSV
         with open(self.logger.csv_file, 'r') as f:
-            reader = csv.reader(f)
-            rows = list(reader)
-            
-            # Should have header + event row
-            self.assertGreaterEqual(len(rows), 2)
+            self.assertEqual(len(list(csv.reader(f))), 1)
     
     def test_log_statistics(self):
         """Test logging statistics."""
@@ -111,7 +275,7 @@ class TestTunerLogger(unittest.TestCase):
         
         self.logger.close()
         
-        with open(self.logger.csv_file, 'r') as f:
+        with open(self.logger.events_file, 'r') as f:
             content = f.read()
             self.assertIn('STATISTICS', content)
     
@@ -16,6 +16,7 @@ from unittest.mock import Mock, patch, mock_open
 import tempfile
 import shutil
 import csv
+import json
 import time
 import sys
 import os
@@ -208,12 +209,13 @@ class TestTunerLoggerEdgeCases(unittest.TestCase):
         logger.close()
         
         # Should write successfully
-        with open(logger.csv_file, 'r') as f:
+        with open(logger.events_file, 'r') as f:
             content = f.read()
             self.assertIn('TEST', content)
+            self.assertIn(long_message, content)
     
     def test_log_event_with_special_csv_characters(self):
-        """Test event logging with CSV special characters."""
+        """Test event logging with CSV special characters (kept intact in JSONL)."""
         logger = TunerLogger(self.config)
         
         # Characters that can break CSV: comma, quote, newline
@@ -231,10 +233,9 @@ class TestTunerLoggerEdgeCases(unittest.TestCase):
         logger.close()
         
         # Verify all messages were written correctly
-        with open(logger.csv_file, 'r', newline='') as f:
-            reader = csv.reader(f)
-            rows = list(reader)
-            self.assertGreater(len(rows), len(special_messages))
+        with open(logger.events_file, 'r', newline='') as f:
+            messages = [json.loads(line)['msg'] for line in f]
+            self.assertEqual(messages, special_messages)
     
     def test_log_statistics_with_empty_dict(self):
         """Test logging statistics with empty dictionary."""
@@ -405,11 +406,10 @@ class TestTunerLoggerConcurrency(unittest.TestCase):
         # Should have no errors
         self.assertEqual(len(errors), 0)
         
-        # Verify file is valid CSV
-        with open(logger.csv_file, 'r') as f:
-            reader = csv.reader(f)
-            rows = list(reader)
-            self.assertGreater(len(rows), 50)  # At least 50 messages
+        # Verify every event line is intact JSON
+        with open(logger.events_file, 'r') as f:
+            events = [json.loads(line) for line in f]
+            self.assertEqual(len(events), 50)
 
 
 class TestTunerLoggerResourceManagement(unittest.TestCase):
@@ -5,6 +5,7 @@ Unit tests for the NetworkTables interface module.
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 import time
+import numpy as np
 import sys
 import os
 
@@ -12,6 +13,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import TunerConfig
+import nt_interface
 from nt_interface import NetworkTablesInterface, ShotData
 
 
@@ -142,6 +144,22 @@ class TestShotData(unittest.TestCase):
         self.assertEqual(shot.yaw, 0.1)
         self.assertEqual(shot.target_height, 2.64)
         self.assertEqual(shot.drag_coefficient, 0.003)
+    
+    def test_shot_data_coerces_field_types(self):
+        """Test fields are coerced at construction and bad types rejected."""
+        shot = ShotData(hit=1, distance=5, angle=np.float32(0.5), velocity=15, timestamp=1.0)
+        
+        self.assertIs(shot.hit, True)
+        self.assertIs(type(shot.distance), float)
+        self.assertIs(type(shot.angle), float)
+        self.assertIs(type(shot.velocity), float)
+        self.assertTrue(shot.is_valid(self.config))
+        
+        for bad in ({'hit': "yes"}, {'hit': 2}, {'distance': "5.0"}, {'velocity': None}):
+            fields = dict(hit=True, distance=5.0, angle=0.5, velocity=15.0, timestamp=1.0)
+            fields.update(bad)
+            with self.assertRaises(TypeError):
+                ShotData(**fields)
 
 
 class TestNetworkTablesInterface(unittest.TestCase):
@@ -152,6 +170,10 @@ class TestNetworkTablesInterface(unittest.TestCase):
         self.config = TunerConfig()
         self.interface = NetworkTablesInterface(self.config)
     
+    def tearDown(self):
+        """Cancel any flush timer so it cannot fire during a later test."""
+        self.interface.stop()
+    
     def test_initialization(self):
         """Test interface initialization."""
         self.assertIsNotNone(self.interface.config)
@@ -186,6 +208,225 @@ class TestNetworkTablesInterface(unittest.TestCase):
         
         self.assertTrue(self.interface.is_connected())
     
+    def test_poll_connection_reports_missing_backend_once(self):
+        """Test a missing NT library is logged once, not on every poll."""
+        with patch('nt_interface.NetworkTables', nt_interface._MissingNetworkTables), \
+                self.assertLogs('nt_interface', level='ERROR') as logs:
+            for _ in range(3):
+                self.assertFalse(self.interface.poll_connection())
+        
+        self.assertEqual(len(logs.records), 1)
+    
+    @patch('nt_interface.NetworkTables')
+    def test_start_waits_on_connection_listener(self, mock_nt):
+        """Test start() is woken by the connection listener instead of polling."""
+        mock_nt.addConnectionListener.side_effect = (
+            lambda listener, immediateNotify: listener(True, None)
+        )
+        
+        self.assertTrue(self.interface.start("127.0.0.1"))
+        mock_nt.isConnected.assert_not_called()
+        
+        # Connection state now comes from the listener
+        self.assertTrue(self.interface.is_connected())
+        self.interface._on_connection_changed(False)
+        self.assertFalse(self.interface.is_connected())
+        mock_nt.isConnected.assert_not_called()
+        
+        # The low-rate poll corrects a missed notification
+        mock_nt.isConnected.return_value = True
+        self.assertTrue(self.interface.poll_connection())
+        self.assertTrue(self.interface.is_connected())
+    
+    @patch('nt_interface.NetworkTables')
+    def test_entry_listeners_wake_tuning_loop(self, mock_nt):
+        """Test a new shot wakes wait_for_activity() instead of a fixed sleep."""
+        mock_nt.addConnectionListener.side_effect = (
+            lambda listener, immediateNotify: listener(True, None)
+        )
+        listeners = []
+        mock_nt.addValueListener.side_effect = lambda entry, listener: listeners.append(listener)
+        
+        self.assertTrue(self.interface.start("127.0.0.1"))
+        self.assertGreater(len(listeners), 1)
+        
+        # Idle: times out without work
+        self.assertFalse(self.interface.wait_for_activity(0.01, 1.0))
+        
+        # ShotTimestamp listener fires: returns immediately, then re-arms
+        listeners[0](12.5)
+        with patch('time.sleep') as mock_sleep:
+            self.assertTrue(self.interface.wait_for_activity(1.0, 1.0))
+            mock_sleep.assert_not_called()
+        self.assertFalse(self.interface.wait_for_activity(0.01, 1.0))
+    
+    @patch('nt_interface.NetworkTables')
+    def test_read_shot_data_from_listener_mirror(self, mock_nt):
+        """Test shots are assembled from listener-pushed values without NT reads."""
+        mock_nt.addConnectionListener.side_effect = (
+            lambda listener, immediateNotify: listener(True, None)
+        )
+        listeners = {}
+        mock_nt.addValueListener.side_effect = (
+            lambda entry, listener: listeners.setdefault(getattr(listener, 'args', (None,))[0], listener)
+        )
+        self.assertTrue(self.interface.start("127.0.0.1"))
+        
+        # Nothing published yet
+        self.assertIsNone(self.interface.read_shot_data())
+        
+        listeners["Hit"](True)
+        listeners["Distance"](5.0)
+        listeners["pitchRadians"](0.5)
+        listeners["exitVelocity"](15.0)
+        listeners["ShotTimestamp"](12.5)
+        
+        table = self.interface.firing_solver_table
+        table.getEntry.return_value.getDouble.reset_mock()
+        shot = self.interface.read_shot_data()
+        
+        self.assertIsNotNone(shot)
+        self.assertTrue(shot.hit)
+        self.assertEqual(shot.distance, 5.0)
+        self.assertEqual(shot.velocity, 15.0)
+        self.assertEqual(shot.timestamp, 12.5)
+        self.assertEqual(shot.air_density, 1.225)  # Unpublished key uses its default
+        table.getEntry.return_value.getDouble.assert_not_called()
+        
+        # Same timestamp: no new shot
+        self.assertIsNone(self.interface.read_shot_data())
+    
+    def test_read_shot_data_in_robot_publish_order(self):
+        """Test listeners fired in logShot()'s order never mix two shots."""
+        interface = NetworkTablesInterface(self.config)
+        interface._connection_listener_active = interface.connected = True
+        interface._shot_mirror_active = True
+        
+        # FiringSolutionSolver.logShot (heights overload): heights, result,
+        # solution, coefficients, then ShotTimestamp last
+        publish_order = (
+            "TargetHeight", "LaunchHeight", "Hit", "Distance",
+            "pitchRadians", "exitVelocity", "yawRadians",
+            "DragCoefficient", "AirDensity", "ProjectileMass", "ProjectileArea",
+            "ShotTimestamp",
+        )
+        shots = [
+            {"Hit": True, "Distance": 4.0, "exitVelocity": 14.0, "ShotTimestamp": 10.0},
+            {"Hit": False, "Distance": 6.0, "exitVelocity": 16.0, "ShotTimestamp": 11.0},
+        ]
+        
+        for values in shots:
+            for key in publish_order:
+                interface._on_shot_value(key, values.get(key, 1.0))
+                if key != "ShotTimestamp":
+                    # Loop woken mid-publish by something else: no shot yet
+                    self.assertIsNone(interface.read_shot_data())
+            
+            shot = interface.read_shot_data()
+            self.assertIsNotNone(shot)
+            self.assertEqual((shot.hit, shot.distance, shot.velocity, shot.timestamp),
+                             (values["Hit"], values["Distance"], values["exitVelocity"],
+                              values["ShotTimestamp"]))
+    
+    def test_bad_mirrored_shot_read_only_once(self):
+        """Test a shot whose values fail coercion is logged once and then skipped."""
+        interface = NetworkTablesInterface(self.config)
+        interface._connection_listener_active = interface.connected = True
+        interface._shot_mirror_active = True
+        
+        interface._on_shot_value("Distance", "not a number")
+        interface._on_shot_value("ShotTimestamp", 10.0)
+        with self.assertLogs('nt_interface', level='ERROR') as logs:
+            self.assertIsNone(interface.read_shot_data())
+        self.assertEqual(len(logs.records), 1)
+        
+        with patch.object(nt_interface.logger, 'error') as error:
+            self.assertIsNone(interface.read_shot_data())
+        error.assert_not_called()
+        
+        # The next good shot is read as usual
+        interface._on_shot_value("Distance", 4.0)
+        interface._on_shot_value("ShotTimestamp", 11.0)
+        self.assertEqual(interface.read_shot_data().distance, 4.0)
+    
+    def test_shot_history_keeps_most_recent_shots(self):
+        """Test captured shots fill a fixed-size ring buffer in capture order."""
+        with patch('nt_interface.SHOT_HISTORY_CAPACITY', 3):
+            interface = NetworkTablesInterface(self.config)
+        # As if start() registered the connection and shot entry listeners
+        interface._connection_listener_active = interface.connected = True
+        interface._shot_mirror_active = True
+        
+        for i in range(5):
+            interface._on_shot_value("Distance", 3.0 + i)
+            interface._on_shot_value("ShotTimestamp", 10.0 + i)
+            self.assertIsNotNone(interface.read_shot_data())
+        
+            if i == 1:
+                self.assertEqual(interface.get_shot_history()['distance'].tolist(), [3.0, 4.0])
+        
+        history = interface.get_shot_history()
+        self.assertEqual(len(interface._shot_history), 3)
+        self.assertEqual(history['distance'].tolist(), [5.0, 6.0, 7.0])
+        self.assertEqual(history['timestamp'][-1], 14.0)
+        self.assertEqual(history[-1]['air_density'], 1.225)
+    
+    def test_network_tables_backend_loaded_lazily(self):
+        """Test the NT backend is imported on first use, not at module import."""
+        import nt_interface
+        
+        lazy = nt_interface._LazyNetworkTables()
+        backend = MagicMock()
+        backend.isConnected.return_value = True
+        
+        with patch.object(nt_interface, 'NetworkTables', lazy):
+            with patch.object(nt_interface, '_load_network_tables', return_value=backend) as load:
+                load.assert_not_called()
+                self.assertTrue(self.interface.poll_connection())
+                
+                # Module global now points straight at the backend
+                self.assertIs(nt_interface.NetworkTables, backend)
+                load.assert_called_once()
+    
+    def test_missing_network_tables_raises(self):
+        """Test calls fail loudly when no NT library is installed."""
+        import nt_interface
+        
+        with self.assertRaises(ImportError):
+            nt_interface._MissingNetworkTables.getTable("/Tuning")
+        
+        with patch.object(nt_interface, 'NetworkTables', nt_interface._MissingNetworkTables):
+            self.assertFalse(self.interface.start("127.0.0.1"))
+            self.assertFalse(self.interface.poll_connection())
+    
+    @patch('nt_interface.NetworkTables')
+    def test_is_match_mode_from_fms_listener(self, mock_nt):
+        """Test match mode comes from the FMSControlData listener, not per-call reads."""
+        mock_nt.addConnectionListener.side_effect = (
+            lambda listener, immediateNotify: listener(True, None)
+        )
+        fms_listeners = []
+        mock_nt.addValueListener.side_effect = lambda entry, listener: (
+            fms_listeners.append(listener) if listener == self.interface._on_fms_value else None
+        )
+        self.assertTrue(self.interface.start("127.0.0.1"))
+        self.assertEqual(len(fms_listeners), 1)
+        
+        mock_nt.getTable.reset_mock()
+        self.assertFalse(self.interface.is_match_mode())
+        
+        fms_listeners[0](51)
+        self.assertTrue(self.interface.is_match_mode())
+        fms_listeners[0](0)
+        self.assertFalse(self.interface.is_match_mode())
+        mock_nt.getTable.assert_not_called()
+    
+    @patch('time.sleep')
+    def test_wait_for_activity_polls_without_listeners(self, mock_sleep):
+        """Test fixed-rate sleep is used when no entry listeners are registered."""
+        self.assertFalse(self.interface.wait_for_activity(1.0, 0.02))
+        mock_sleep.assert_called_once_with(0.02)
+    
     @patch('nt_interface.NetworkTables')
     def test_read_coefficient_when_disconnected(self, mock_nt):
         """Test reading coefficient when disconnected."""
@@ -226,6 +467,11 @@ class TestNetworkTablesInterface(unittest.TestCase):
         result2 = self.interface.write_coefficient("/test", 0.004)
         self.assertFalse(result2)
         
+        # The queued write goes out in the next write slot
+        time.sleep(self.interface.min_write_interval + 0.05)
+        self.assertEqual(len(self.interface.pending_writes), 0)
+        mock_table.getEntry.return_value.setDouble.assert_called_with(0.004)
+        
         # After waiting, write should succeed
         time.sleep(self.interface.min_write_interval + 0.01)
         result3 = self.interface.write_coefficient("/test", 0.005)
@@ -292,6 +538,108 @@ class TestNetworkTablesInterface(unittest.TestCase):
         self.assertEqual(count, 2)
         self.assertEqual(len(self.interface.pending_writes), 0)
     
+    @patch('nt_interface.NetworkTables')
+    def test_flush_requeues_failed_writes_behind_newer_values(self, mock_nt):
+        """Test a failed flush write is re-queued unless a newer value arrived."""
+        mock_nt.isConnected.return_value = True
+        self.interface.pending_writes.update({"/a": 1.0, "/b": 2.0, "/c": 3.0})
+        
+        def put(nt_key, value):
+            if nt_key == "/a":
+                # A newer value for /a is queued while the flush is running
+                self.interface.pending_writes["/a"] = 10.0
+            return nt_key == "/c"
+        
+        with patch.object(self.interface, '_put_coefficient', side_effect=put):
+            count = self.interface.flush_pending_writes()
+        
+        self.assertEqual(count, 1)
+        self.assertEqual(self.interface.pending_writes, {"/a": 10.0, "/b": 2.0})
+        # The flush timer is re-armed to retry them
+        self.assertIsNotNone(self.interface._flush_timer)
+    
+    @patch('nt_interface.NetworkTables')
+    def test_forced_write_drops_older_queued_value(self, mock_nt):
+        """Test a queued write cannot overwrite a later forced write of the same key."""
+        mock_nt.isConnected.return_value = True
+        self.interface.connected = True
+        self.config.NT_BATCH_WRITES = True
+        written = {}
+        
+        def put(nt_key, value):
+            written[nt_key] = value
+            return True
+        
+        with patch.object(self.interface, '_put_coefficient', side_effect=put):
+            self.assertTrue(self.interface.write_coefficient("/a", 1.0))
+            self.assertFalse(self.interface.write_coefficient("/a", 2.0))  # Queued
+            self.assertTrue(self.interface.write_coefficient("/a", 3.0, force=True))
+            
+            self.interface.stop()
+            self.interface._on_flush_timer()
+        
+        self.assertEqual(written, {"/a": 3.0})
+        self.assertEqual(self.interface.pending_writes, {})
+    
+    @patch('nt_interface.NetworkTables')
+    def test_reconnect_flushes_writes_queued_while_disconnected(self, mock_nt):
+        """Test writes left queued by a dropped link are sent once it comes back."""
+        self.interface._connection_listener_active = True
+        self.interface.tuning_table = Mock()
+        self.interface._on_connection_changed(True)
+        self.config.NT_BATCH_WRITES = True
+        
+        self.assertTrue(self.interface.write_coefficient("/a", 1.0))
+        self.assertFalse(self.interface.write_coefficient("/b", 2.0))
+        
+        # The flush timer fires while the link is down: nothing is sent
+        self.interface._on_connection_changed(False)
+        self.interface.stop()
+        self.interface._on_flush_timer()
+        self.assertEqual(self.interface.pending_writes, {"/b": 2.0})
+        
+        # Reconnecting arms the timer again, which drains the queue
+        self.interface._on_connection_changed(True)
+        timer = self.interface._flush_timer
+        self.assertIsNotNone(timer)
+        timer.join(2.0)
+        self.assertEqual(self.interface.pending_writes, {})
+    
+    @patch('nt_interface.NetworkTables')
+    def test_write_all_coefficients_single_flush(self, mock_nt):
+        """Test writing all coefficients sends them together in one flush."""
+        mock_nt.isConnected.return_value = True
+        self.interface.tuning_table = Mock()
+        
+        values = {name: coeff.default_value for name, coeff in self.config.COEFFICIENTS.items()}
+        result = self.interface.write_all_coefficients(values)
+        
+        self.assertTrue(result)
+        self.assertEqual(len(self.interface.pending_writes), 0)
+        self.assertEqual(
+            self.interface.tuning_table.getEntry.return_value.setDouble.call_count,
+            len(values)
+        )
+        mock_nt.flush.assert_called_once()
+    
+    @patch('nt_interface.NetworkTables')
+    def test_batched_writes_flush_once_on_exit(self, mock_nt):
+        """Test writes inside batched_writes() share one NT flush at block exit."""
+        mock_nt.isConnected.return_value = True
+        self.interface.tuning_table = Mock()
+        
+        with self.interface.batched_writes():
+            self.assertTrue(self.interface.write_coefficient("/a", 1.0, force=True))
+            with self.interface.batched_writes():
+                self.assertTrue(self.interface.write_coefficient("/b", 2.0, force=True))
+            mock_nt.flush.assert_not_called()
+        
+        mock_nt.flush.assert_called_once()
+        
+        # Outside a batch a single write adds no flush of its own
+        self.interface.write_coefficient("/c", 3.0, force=True)
+        mock_nt.flush.assert_called_once()
+    
     @patch('nt_interface.NetworkTables')
     def test_read_shot_data_when_disconnected(self, mock_nt):
         """Test reading shot data when disconnected."""
@@ -311,7 +659,7 @@ class TestNetworkTablesInterface(unittest.TestCase):
         
         # Mock table
         mock_table = Mock()
-        mock_table.getNumber = Mock(return_value=0.0)
+        mock_table.getEntry.return_value.getDouble = Mock(return_value=0.0)
         self.interface.firing_solver_table = mock_table
         
         # First read should attempt (though it may return None if no new data)
@@ -325,6 +673,24 @@ class TestNetworkTablesInterface(unittest.TestCase):
         # Read time should not have changed
         self.assertEqual(self.interface.last_read_time, first_read_time)
     
+    @patch('nt_interface.NetworkTables')
+    def test_rate_limiting_uses_caller_clock(self, mock_nt):
+        """Test rate limits use the monotonic tick time passed in by the caller."""
+        mock_nt.isConnected.return_value = True
+        self.interface.connected = True
+        self.interface.tuning_table = Mock()
+        self.config.NT_BATCH_WRITES = False
+        
+        now = 1000.0
+        self.assertTrue(self.interface.write_coefficient("/test", 0.003, now=now))
+        self.assertEqual(self.interface.last_write_time, now)
+        
+        # Same tick is rate limited, one interval later is not
+        self.assertFalse(self.interface.write_coefficient("/test", 0.004, now=now))
+        self.assertTrue(self.interface.write_coefficient(
+            "/test", 0.004, now=now + self.interface.min_write_interval
+        ))
+    
     @patch('nt_interface.NetworkTables')
     def test_read_shot_data_no_new_data(self, mock_nt):
         """Test reading shot data when timestamp hasn't changed."""
@@ -334,7 +700,7 @@ class TestNetworkTablesInterface(unittest.TestCase):
         
         # Mock table with same timestamp
         mock_table = Mock()
-        mock_table.getNumber = Mock(return_value=123.0)
+        mock_table.getEntry.return_value.getDouble = Mock(return_value=123.0)
         self.interface.firing_solver_table = mock_table
         self.interface.last_shot_timestamp = 123.0
         
@@ -345,6 +711,90 @@ class TestNetworkTablesInterface(unittest.TestCase):
         result = self.interface.read_shot_data()
         self.assertIsNone(result)
     
+    @patch('nt_interface.NetworkTables')
+    def test_read_all_coefficients_uses_cached_entries(self, mock_nt):
+        """Test bulk coefficient read resolves each entry handle only once."""
+        mock_nt.isConnected.return_value = True
+        
+        mock_table = Mock()
+        mock_table.getEntry.return_value.getDouble = Mock(side_effect=lambda default: default * 2)
+        self.interface.tuning_table = mock_table
+        
+        values = self.interface.read_all_coefficients(self.config.COEFFICIENTS)
+        self.interface.read_all_coefficients(self.config.COEFFICIENTS)
+        
+        for name, coeff in self.config.COEFFICIENTS.items():
+            self.assertEqual(values[name], coeff.default_value * 2)
+        self.assertEqual(mock_table.getEntry.call_count, len(self.config.COEFFICIENTS))
+        self.assertEqual(mock_nt.isConnected.call_count, 2)
+    
+    @patch('nt_interface.NetworkTables')
+    def test_read_all_coefficients_when_disconnected(self, mock_nt):
+        """Test bulk coefficient read returns defaults when disconnected."""
+        mock_nt.isConnected.return_value = False
+        
+        values = self.interface.read_all_coefficients(self.config.COEFFICIENTS)
+        
+        for name, coeff in self.config.COEFFICIENTS.items():
+            self.assertEqual(values[name], coeff.default_value)
+    
+    @patch('nt_interface.NetworkTables')
+    def test_read_shot_data_new_shot(self, mock_nt):
+        """Test a new shot is read through entry handles resolved once."""
+        mock_nt.isConnected.return_value = True
+        
+        values = {"ShotTimestamp": 10.0, "Distance": 5.0, "pitchRadians": 0.5, "exitVelocity": 15.0}
+        mock_table = Mock()
+        mock_solution = Mock()
+        mock_table.getSubTable.return_value = mock_solution
+        
+        def make_entry(key):
+            entry = Mock()
+            entry.getDouble = Mock(side_effect=lambda default: values.get(key, default))
+            entry.getBoolean = Mock(return_value=True)
+            return entry
+        
+        mock_table.getEntry.side_effect = make_entry
+        mock_solution.getEntry.side_effect = make_entry
+        self.interface.firing_solver_table = mock_table
+        
+        shot = self.interface.read_shot_data(now=1000.0)
+        
+        self.assertIsInstance(shot, ShotData)
+        self.assertTrue(shot.hit)
+        self.assertEqual((shot.distance, shot.angle, shot.velocity), (5.0, 0.5, 15.0))
+        self.assertEqual(shot.air_density, 1.225)
+        
+        # Same timestamp again: no new shot, no new entry lookups
+        lookups = mock_table.getEntry.call_count
+        self.assertIsNone(self.interface.read_shot_data(now=2000.0))
+        self.assertEqual(mock_table.getEntry.call_count, lookups)
+        mock_table.getSubTable.assert_called_once_with("Solution")
+    
+    @patch('nt_interface.NetworkTables')
+    def test_read_shot_data_unchanged_entry_fast_path(self, mock_nt):
+        """Test an unchanged ShotTimestamp entry skips the read entirely."""
+        mock_nt.isConnected.return_value = True
+        
+        mock_table = Mock()
+        timestamp_entry = mock_table.getEntry.return_value
+        timestamp_entry.getLastChange = Mock(return_value=42)
+        timestamp_entry.getDouble = Mock(return_value=0.0)
+        self.interface.firing_solver_table = mock_table
+        
+        self.assertIsNone(self.interface.read_shot_data(now=1000.0))
+        self.assertEqual(timestamp_entry.getDouble.call_count, 1)
+        
+        # Not rate limited (new tick), but the entry has not changed
+        self.assertIsNone(self.interface.read_shot_data(now=2000.0))
+        self.assertEqual(timestamp_entry.getDouble.call_count, 1)
+        self.assertEqual(self.interface.last_read_time, 1000.0)
+        
+        # A server update moves the change stamp and the timestamp is read again
+        timestamp_entry.getLastChange.return_value = 43
+        self.interface.read_shot_data(now=3000.0)
+        self.assertEqual(timestamp_entry.getDouble.call_count, 2)
+    
     @patch('nt_interface.NetworkTables')
     def test_is_match_mode_when_disconnected(self, mock_nt):
         """Test match mode check when disconnected."""
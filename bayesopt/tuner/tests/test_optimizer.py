@@ -2,14 +2,21 @@
 Unit tests for the optimizer module.
 """
 
+import importlib.util
 import unittest
 from unittest.mock import Mock, patch
 import numpy as np
 
 from tuner.config import TunerConfig, CoefficientConfig
 from tuner.optimizer import BayesianOptimizer, CoefficientTuner
+from tuner.optimizer_kernels import expected_improvement
 from tuner.nt_interface import ShotData
 
+# Tests of skopt's own behaviour; without it the optimizer uses placeholders
+requires_skopt = unittest.skipUnless(
+    importlib.util.find_spec("skopt") is not None, "scikit-optimize not installed"
+)
+
 
 class TestBayesianOptimizer(unittest.TestCase):
     """Test BayesianOptimizer class."""
@@ -46,6 +53,21 @@ class TestBayesianOptimizer(unittest.TestCase):
         self.assertEqual(self.optimizer.evaluation_history[0]['value'], value)
         self.assertEqual(self.optimizer.evaluation_history[0]['hit'], True)
     
+    def test_evaluation_history_grows_past_call_budget(self):
+        """Test history columns keep every result beyond N_CALLS_PER_COEFFICIENT."""
+        count = self.config.N_CALLS_PER_COEFFICIENT + 3
+        for i in range(count):
+            self.optimizer.report_result(0.001 + i * 1e-5, hit=(i % 4 == 0))
+        
+        history = self.optimizer.evaluation_history
+        self.assertEqual(len(history), count)
+        self.assertEqual([h['iteration'] for h in history], list(range(count)))
+        self.assertAlmostEqual(history[-1]['value'], 0.001 + (count - 1) * 1e-5)
+        
+        stats = self.optimizer.get_statistics()
+        self.assertEqual(stats['total_evaluations'], count)
+        self.assertAlmostEqual(stats['hit_rate'], sum(h['hit'] for h in history) / count)
+    
     def test_best_value_tracking(self):
         """Test that best value is tracked correctly."""
         # Report a miss
@@ -67,6 +89,57 @@ class TestBayesianOptimizer(unittest.TestCase):
         
         self.assertTrue(self.optimizer.is_converged())
     
+    def test_is_converged_cached_until_report(self):
+        """Test is_converged is evaluated once per state and reset by report_result."""
+        for i in range(self.config.N_CALLS_PER_COEFFICIENT - 1):
+            self.optimizer.report_result(0.003, hit=(i % 2 == 0))
+        
+        with patch.object(self.optimizer, '_check_converged', wraps=self.optimizer._check_converged) as check:
+            first = self.optimizer.is_converged()
+            self.optimizer.get_statistics()
+            self.assertEqual(check.call_count, 1)
+            
+            self.optimizer.report_result(0.003, hit=True)
+            self.assertTrue(self.optimizer.is_converged())
+            self.assertEqual(check.call_count, 2)
+        
+        self.assertFalse(first)
+    
+    def test_statistics_do_not_evaluate_convergence(self):
+        """Test get_statistics reports the last convergence result without rechecking."""
+        for i in range(self.config.N_CALLS_PER_COEFFICIENT):
+            self.optimizer.report_result(0.003, hit=True)
+        
+        with patch.object(self.optimizer, '_check_converged') as check:
+            self.assertFalse(self.optimizer.get_statistics()['is_converged'])
+            check.assert_not_called()
+        
+        self.assertTrue(self.optimizer.is_converged())
+        self.assertTrue(self.optimizer.get_statistics()['is_converged'])
+    
+    def test_convergence_logged_once(self):
+        """Test the convergence reason is logged on the first detection only."""
+        for i in range(self.config.N_CALLS_PER_COEFFICIENT):
+            self.optimizer.report_result(0.003, hit=True)
+        
+        with self.assertLogs('tuner.optimizer', level='INFO') as logs:
+            self.assertTrue(self.optimizer.is_converged())
+            self.optimizer.report_result(0.003, hit=True)
+            self.assertTrue(self.optimizer.is_converged())
+        
+        self.assertEqual(sum('max iterations' in line for line in logs.output), 1)
+    
+    def test_recent_score_variance_tracked_on_report(self):
+        """Test the convergence window variance is kept up to date by report_result."""
+        hits = [True, False, True, True, False, False, True]
+        for i, hit in enumerate(hits):
+            self.optimizer.report_result(0.003, hit=hit)
+            if i < 4:
+                self.assertEqual(self.optimizer._recent_score_var, float('inf'))
+        
+        scores = [h['score'] for h in self.optimizer.evaluation_history[-5:]]
+        self.assertAlmostEqual(self.optimizer._recent_score_var, np.var(scores))
+    
     def test_step_size_decay(self):
         """Test step size decay over iterations."""
         initial_step = self.optimizer.current_step_size
@@ -80,6 +153,24 @@ class TestBayesianOptimizer(unittest.TestCase):
         if self.config.STEP_SIZE_DECAY_ENABLED:
             self.assertLess(self.optimizer.current_step_size, initial_step)
     
+    def test_step_schedule_extends_past_call_budget(self):
+        """Test step sizes keep following the decay past N_CALLS_PER_COEFFICIENT."""
+        self.config.STEP_SIZE_DECAY_ENABLED = True
+        self.optimizer.optimizer = Mock(Xi=[], yi=[])
+        self.optimizer.optimizer.ask.return_value = [0.003]
+        count = self.config.N_CALLS_PER_COEFFICIENT + 2
+        for i in range(count):
+            self.optimizer.report_result(0.003, hit=True)
+        
+        self.optimizer.suggest_next_value()
+        
+        expected = max(
+            self.coeff_config.initial_step_size * self.coeff_config.step_decay_rate ** count,
+            self.coeff_config.initial_step_size * self.config.MIN_STEP_SIZE_RATIO,
+        )
+        self.assertAlmostEqual(self.optimizer.current_step_size, expected)
+        self.assertGreater(len(self.optimizer._step_schedule), count)
+    
     def test_integer_coefficient(self):
         """Test integer coefficient handling."""
         int_coeff = self.config.COEFFICIENTS["kVelocityIterationCount"]
@@ -92,6 +183,189 @@ class TestBayesianOptimizer(unittest.TestCase):
         self.assertGreaterEqual(value, int_coeff.min_value)
         self.assertLessEqual(value, int_coeff.max_value)
     
+    def test_integer_coefficient_grid_search(self):
+        """Test small integer domains are searched on the full candidate grid."""
+        int_coeff = self.config.COEFFICIENTS["kVelocityIterationCount"]
+        optimizer = BayesianOptimizer(int_coeff, self.config)
+        
+        self.assertEqual(optimizer.candidate_grid[0], int_coeff.min_value)
+        self.assertEqual(optimizer.candidate_grid[-1], int_coeff.max_value)
+        
+        # Past the initial random points the grid picks the value
+        for i in range(self.config.N_INITIAL_POINTS + 2):
+            value = optimizer.suggest_next_value()
+            optimizer.report_result(value, hit=(i % 2 == 0))
+        
+        value = optimizer.suggest_next_value()
+        self.assertEqual(value, int(value))
+        self.assertIn(value, optimizer.candidate_grid)
+    
+    @requires_skopt
+    def test_continuous_coefficient_dense_grid(self):
+        """Test continuous coefficients can be scored on a dense EI grid."""
+        self.config.CONTINUOUS_ACQUISITION_GRID_POINTS = 257
+        optimizer = BayesianOptimizer(self.coeff_config, self.config)
+        
+        self.assertEqual(len(optimizer.candidate_grid), 257)
+        self.assertEqual(optimizer.candidate_grid[0], self.coeff_config.min_value)
+        self.assertEqual(optimizer.candidate_grid[-1], self.coeff_config.max_value)
+        
+        for i in range(self.config.N_INITIAL_POINTS + 1):
+            value = optimizer.suggest_next_value()
+            optimizer.report_result(value, hit=(i % 2 == 0))
+        
+        value = optimizer._suggest_from_grid()[0]
+        self.assertIsInstance(value, float)
+        self.assertIn(value, optimizer.candidate_grid)
+    
+    @requires_skopt
+    def test_initial_points_stratified(self):
+        """Test the warm-up points cover the range with one point per stratum."""
+        n = self.config.N_INITIAL_POINTS
+        lo, hi = self.coeff_config.min_value, self.coeff_config.max_value
+        
+        values = []
+        for i in range(n):
+            value = self.optimizer.suggest_next_value()
+            self.optimizer.report_result(value, hit=True)
+            values.append(value)
+        
+        strata = sorted(min(int((v - lo) / (hi - lo) * n), n - 1) for v in values)
+        self.assertEqual(strata, list(range(n)))
+    
+    @requires_skopt
+    def test_acquisition_n_jobs_passed_to_skopt(self):
+        """Test ACQUISITION_N_JOBS reaches skopt's L-BFGS restart pool."""
+        self.assertEqual(self.optimizer.optimizer.n_jobs, 1)
+        
+        self.config.ACQUISITION_N_JOBS = -1
+        optimizer = BayesianOptimizer(self.coeff_config, self.config)
+        self.assertEqual(optimizer.optimizer.n_jobs, -1)
+    
+    def test_gp_observations_capped_to_window(self):
+        """Test the GP only keeps the most recent GP_MAX_OBSERVATIONS points."""
+        self.config.GP_MAX_OBSERVATIONS = 4
+        optimizer = BayesianOptimizer(self.coeff_config, self.config)
+        
+        values = [0.001 + 0.0005 * i for i in range(7)]
+        for value in values:
+            optimizer.report_result(value, hit=True)
+        
+        self.assertEqual([x[0] for x in optimizer.optimizer.Xi], values[-4:])
+        self.assertEqual(len(optimizer.optimizer.yi), 4)
+        self.assertEqual(optimizer.iteration, 7)
+    
+    @requires_skopt
+    def test_prior_observations_count_toward_initial_design(self):
+        """Test seeded priors shorten the initial design and the grid waits for it."""
+        int_coeff = self.config.COEFFICIENTS["kVelocityIterationCount"]
+        n = self.config.N_INITIAL_POINTS
+        lo = int(int_coeff.min_value)
+        
+        optimizer = BayesianOptimizer(int_coeff, self.config,
+                                      prior_observations=[(lo, 1.0), (lo + 1, -1.0)])
+        self.assertEqual(optimizer.optimizer._n_initial_points, n - 2)
+        
+        # Even with a fitted model, no grid pick until the design is sampled
+        optimizer.optimizer.models.append(Mock())
+        self.assertIsNone(optimizer._suggest_from_grid())
+        
+        # Priors covering the whole design go straight to the grid
+        prior = [(lo + i % 2, float(i % 2)) for i in range(n)]
+        optimizer = BayesianOptimizer(int_coeff, self.config, prior_observations=prior)
+        self.assertEqual(optimizer.optimizer._n_initial_points, 0)
+        self.assertIn(optimizer._suggest_from_grid()[0], optimizer.candidate_grid)
+    
+    @requires_skopt
+    def test_grid_posterior_cached_until_refit(self):
+        """Test the grid posterior is reused until a tell() refits the GP."""
+        int_coeff = self.config.COEFFICIENTS["kVelocityIterationCount"]
+        optimizer = BayesianOptimizer(int_coeff, self.config)
+        for i in range(self.config.N_INITIAL_POINTS + 1):
+            value = optimizer.suggest_next_value()
+            optimizer.report_result(value, hit=(i % 2 == 0))
+        
+        model = optimizer.optimizer.models[-1]
+        with patch.object(model, 'predict', wraps=model.predict) as predict:
+            first = optimizer._suggest_from_grid()
+            second = optimizer._suggest_from_grid()
+        
+        self.assertEqual(first, second)
+        self.assertEqual(predict.call_count, 1)
+        
+        optimizer.report_result(first[0], hit=True)
+        self.assertIsNone(optimizer._grid_posterior)
+    
+    def test_batched_suggestions_share_one_fit(self):
+        """Test a suggestion batch comes from one ask() and refits once used up."""
+        self.config.SUGGESTION_BATCH_SIZE = 3
+        optimizer = BayesianOptimizer(self.coeff_config, self.config)
+        optimizer.optimizer = Mock(Xi=[], yi=[])
+        optimizer.optimizer.ask.return_value = [[0.002], [0.003], [0.004]]
+        
+        values = []
+        for i in range(3):
+            value = optimizer.suggest_next_value()
+            optimizer.report_result(value, hit=True)
+            values.append(value)
+        
+        self.assertEqual(values, [0.002, 0.003, 0.004])
+        optimizer.optimizer.ask.assert_called_once_with(n_points=3, strategy="cl_min")
+        fits = [call.kwargs['fit'] for call in optimizer.optimizer.tell.call_args_list]
+        self.assertEqual(fits, [False, False, True])
+    
+    @requires_skopt
+    def test_grid_batch_uses_constant_liar(self):
+        """Test a grid batch spreads out instead of repeating the EI maximum."""
+        self.config.SUGGESTION_BATCH_SIZE = 3
+        int_coeff = self.config.COEFFICIENTS["kVelocityIterationCount"]
+        optimizer = BayesianOptimizer(int_coeff, self.config)
+        for i in range(self.config.N_INITIAL_POINTS + 1):
+            value = optimizer.suggest_next_value()
+            optimizer.report_result(value, hit=(i % 2 == 0))
+        
+        picks = optimizer._suggest_from_grid(3)
+        
+        self.assertEqual(len(set(picks)), 3)
+        self.assertEqual(picks[0], optimizer._suggest_from_grid()[0])
+        for value in picks:
+            self.assertIn(value, optimizer.candidate_grid)
+    
+    def test_batch_size_zero_uses_validation_round(self):
+        """Test a zero batch size draws one candidate per validation shot."""
+        self.config.SUGGESTION_BATCH_SIZE = 0
+        self.config.MIN_VALID_SHOTS_BEFORE_UPDATE = 4
+        optimizer = BayesianOptimizer(self.coeff_config, self.config)
+        self.assertEqual(optimizer.batch_size, 4)
+    
+    def test_fallback_when_skopt_missing(self):
+        """Test skopt is loaded on first optimizer and stand-ins used without it."""
+        import tuner.optimizer as optimizer_module
+        
+        optimizer_module._load_skopt.cache_clear()
+        try:
+            with patch.object(optimizer_module.importlib, 'import_module', side_effect=ImportError):
+                optimizer = BayesianOptimizer(self.coeff_config, self.config)
+        finally:
+            optimizer_module._load_skopt.cache_clear()
+        
+        self.assertIsInstance(optimizer.optimizer, optimizer_module._FallbackOptimizer)
+        value = optimizer.suggest_next_value()
+        self.assertEqual(value, self.coeff_config.clamp(0.5))
+    
+    def test_expected_improvement_kernel(self):
+        """Test EI kernel against known values."""
+        mu = np.array([0.0, 1.0, -1.0, 0.0])
+        sigma = np.array([1.0, 1.0, 1.0, 0.0])
+        
+        ei = expected_improvement(mu, sigma, 0.0, 0.0)
+        
+        # At mu == y_best, EI = sigma * pdf(0)
+        self.assertAlmostEqual(ei[0], 1.0 / np.sqrt(2.0 * np.pi))
+        self.assertLess(ei[1], ei[0])
+        self.assertGreater(ei[2], ei[0])
+        self.assertEqual(ei[3], 0.0)
+    
     def test_get_statistics(self):
         """Test getting optimization statistics."""
         # Run a few iterations
@@ -122,6 +396,16 @@ class TestCoefficientTuner(unittest.TestCase):
         self.assertIsNotNone(self.tuner.current_optimizer)
         self.assertGreater(len(self.tuner.coefficients), 0)
     
+    def test_sees_enabled_flag_edited_in_place(self):
+        """Test a new tuner skips a coefficient disabled after the last one was built."""
+        first = self.tuner.coefficients[0].name
+        self.config.COEFFICIENTS[first].enabled = False
+        
+        names = [coeff.name for coeff in CoefficientTuner(self.config).coefficients]
+        
+        self.assertNotIn(first, names)
+        self.assertEqual(len(names), len(self.tuner.coefficients) - 1)
+    
     def test_get_current_coefficient_name(self):
         """Test getting current coefficient name."""
         name = self.tuner.get_current_coefficient_name()
@@ -160,7 +444,7 @@ class TestCoefficientTuner(unittest.TestCase):
         self.tuner.record_shot(shot_data, coefficient_values)
         
         # Should have pending shots
-        self.assertGreater(len(self.tuner.pending_shots), 0)
+        self.assertGreater(self.tuner.pending_shot_count, 0)
     
     def test_record_shot_invalid(self):
         """Test recording invalid shot data."""
@@ -200,7 +484,7 @@ class TestCoefficientTuner(unittest.TestCase):
             self.tuner.record_shot(shot_data, coefficient_values)
         
         # Should still have pending shots
-        self.assertEqual(len(self.tuner.pending_shots), 
+        self.assertEqual(self.tuner.pending_shot_count, 
                         self.config.MIN_VALID_SHOTS_BEFORE_UPDATE - 1)
         
         # Add one more to trigger processing
@@ -214,7 +498,82 @@ class TestCoefficientTuner(unittest.TestCase):
         self.tuner.record_shot(shot_data, coefficient_values)
         
         # Pending shots should be cleared after processing
-        self.assertEqual(len(self.tuner.pending_shots), 0)
+        self.assertEqual(self.tuner.pending_shot_count, 0)
+    
+    def test_pending_shots_aggregated(self):
+        """Test accumulated shots are reported as majority hit and averages."""
+        self.config.MIN_VALID_SHOTS_BEFORE_UPDATE = 3
+        self.tuner.current_optimizer.report_result = Mock()
+        self.tuner.current_optimizer.is_converged = Mock(return_value=False)
+        name = self.tuner.get_current_coefficient_name()
+        
+        for i, (hit, distance) in enumerate([(True, 4.0), (False, 5.0), (True, 6.0)]):
+            shot_data = ShotData(
+                hit=hit,
+                distance=distance,
+                angle=0.5,
+                velocity=15.0,
+                timestamp=1234567890.0 + i
+            )
+            self.tuner.record_shot(shot_data, {name: 0.002})
+        
+        value, hit, additional_data = self.tuner.current_optimizer.report_result.call_args[0]
+        self.assertAlmostEqual(value, 0.002)
+        self.assertTrue(hit)
+        self.assertAlmostEqual(additional_data['distance'], 5.0)
+        self.assertEqual(additional_data['num_shots'], 3)
+        self.assertAlmostEqual(additional_data['hit_rate'], 2 / 3)
+        self.assertEqual(self.tuner.pending_shot_count, 0)
+    
+    def test_pending_shots_reported_per_value(self):
+        """Test a value is reported after a full round; a partial one is dropped."""
+        self.config.MIN_VALID_SHOTS_BEFORE_UPDATE = 3
+        self.tuner.current_optimizer.report_result = Mock(return_value=1.0)
+        self.tuner.current_optimizer.is_converged = Mock(return_value=False)
+        name = self.tuner.get_current_coefficient_name()
+        
+        shots = [(0.001, True), (0.001, True), (0.003, False), (0.003, False), (0.003, True)]
+        for i, (value, hit) in enumerate(shots):
+            shot_data = ShotData(
+                hit=hit,
+                distance=5.0,
+                angle=0.5,
+                velocity=15.0,
+                timestamp=1234567890.0 + i
+            )
+            self.tuner.record_shot(shot_data, {name: value})
+        
+        # The two shots at 0.001 never made a round, so they are not an observation
+        calls = [c[0] for c in self.tuner.current_optimizer.report_result.call_args_list]
+        self.assertEqual([(v, h, d['num_shots']) for v, h, d in calls], [(0.003, False, 3)])
+        self.assertEqual(len(self.tuner.observations), 1)
+        self.assertEqual(self.tuner.pending_shot_count, 0)
+    
+    def test_new_suggestion_drops_partial_round(self):
+        """Test shots left over when a new value is written are not stranded."""
+        self.config.MIN_VALID_SHOTS_BEFORE_UPDATE = 3
+        optimizer = self.tuner.current_optimizer
+        optimizer.report_result = Mock(return_value=1.0)
+        optimizer.is_converged = Mock(return_value=False)
+        optimizer.suggest_next_value = Mock(return_value=0.004)
+        name = self.tuner.get_current_coefficient_name()
+        
+        def shoot(value, count):
+            for i in range(count):
+                shot_data = ShotData(hit=True, distance=5.0, angle=0.5, velocity=15.0,
+                                     timestamp=1234567890.0 + i)
+                self.tuner.record_shot(shot_data, {name: value})
+        
+        # A manual "Run Optimization" after 2 shots of a 3-shot round
+        shoot(0.002, 2)
+        self.assertEqual(self.tuner.pending_shot_count, 2)
+        self.assertEqual(self.tuner.suggest_coefficient_update(), (name, 0.004))
+        self.assertEqual(self.tuner.pending_shot_count, 0)
+        
+        shoot(0.004, 3)
+        optimizer.report_result.assert_called_once()
+        self.assertEqual(optimizer.report_result.call_args[0][0], 0.004)
+        self.assertEqual(self.tuner.pending_shot_count, 0)
     
     def test_is_complete(self):
         """Test completion detection."""
@@ -252,7 +611,7 @@ class TestCoefficientTuner(unittest.TestCase):
         self.assertIsNotNone(self.tuner.current_optimizer)
         
         # Pending shots should be cleared
-        self.assertEqual(len(self.tuner.pending_shots), 0)
+        self.assertEqual(self.tuner.pending_shot_count, 0)
     
     def test_go_to_previous_at_beginning(self):
         """Test that going to previous at beginning doesn't go below 0."""
@@ -266,6 +625,43 @@ class TestCoefficientTuner(unittest.TestCase):
         # Should still have a current optimizer
         self.assertIsNotNone(self.tuner.current_optimizer)
     
+    @requires_skopt
+    def test_shared_observations_seed_only_varied_coefficient(self):
+        """Test shared rounds seed a coefficient only where it took several values."""
+        self.config.SHARE_OBSERVATIONS_ACROSS_COEFFICIENTS = True
+        self.config.MIN_VALID_SHOTS_BEFORE_UPDATE = 1
+        coefficient_values = {
+            coeff.name: coeff.default_value
+            for coeff in self.config.COEFFICIENTS.values()
+        }
+        first = self.tuner.coefficients[0]
+        low = first.clamp(first.min_value)
+        high = first.clamp(first.max_value)
+        
+        for i, (value, hit) in enumerate([(low, True), (high, False), (low, False)]):
+            shot_data = ShotData(
+                hit=hit,
+                distance=5.0,
+                angle=0.5,
+                velocity=15.0,
+                timestamp=1234567890.0 + i
+            )
+            self.tuner.record_shot(shot_data, {**coefficient_values, first.name: value})
+        scores = [score for _, score in self.tuner.observations]
+        self.assertEqual(len(scores), 3)
+        
+        # The next coefficient was held at one value the whole time: no seed
+        self.tuner.advance_to_next_coefficient()
+        self.assertEqual(self.tuner.current_optimizer.optimizer.Xi, [])
+        
+        # Going back: one mean point per value, counted toward the initial design
+        self.tuner.go_to_previous_coefficient()
+        optimizer = self.tuner.current_optimizer
+        self.assertEqual(optimizer.optimizer.Xi, [[low], [high]])
+        self.assertEqual(optimizer.optimizer.yi, [(scores[0] + scores[2]) / 2, scores[1]])
+        self.assertEqual(optimizer.optimizer._n_initial_points, self.config.N_INITIAL_POINTS - 2)
+        self.assertEqual(optimizer.iteration, 0)
+    
     def test_go_to_previous_clears_pending_shots(self):
         """Test that going to previous clears pending shots."""
         # Add some pending shots
@@ -283,14 +679,14 @@ class TestCoefficientTuner(unittest.TestCase):
         self.tuner.record_shot(shot_data, coefficient_values)
         
         # Verify we have pending shots
-        self.assertGreater(len(self.tuner.pending_shots), 0)
+        self.assertGreater(self.tuner.pending_shot_count, 0)
         
         # Advance then go back
         self.tuner.advance_to_next_coefficient()
         self.tuner.go_to_previous_coefficient()
         
         # Pending shots should be cleared
-        self.assertEqual(len(self.tuner.pending_shots), 0)
+        self.assertEqual(self.tuner.pending_shot_count, 0)
 
 
 if __name__ == '__main__':
@@ -15,6 +15,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import TunerConfig
 from nt_interface import ShotData
+from optimizer import CoefficientTuner
 from tuner import BayesianTunerCoordinator
 
 
@@ -301,6 +302,34 @@ class TestBayesianTunerCoordinator(unittest.TestCase):
         # Shots should be cleared
         self.assertEqual(len(self.coordinator.accumulated_shots), 0)
     
+    def test_suggestion_batch_spread_across_optimization_runs(self):
+        """Test each optimization run writes the next point of one batch."""
+        self.config.SUGGESTION_BATCH_SIZE = 3
+        self.config.MIN_VALID_SHOTS_BEFORE_UPDATE = 1
+        self.coordinator.optimizer = CoefficientTuner(self.config)
+        current = self.coordinator.optimizer.current_optimizer
+        current.optimizer = Mock(Xi=[], yi=[], models=[])
+        coeff = current.coeff_config
+        batch = [coeff.clamp(coeff.min_value + (coeff.max_value - coeff.min_value) * f)
+                 for f in (0.25, 0.5, 0.75)]
+        current.optimizer.ask.return_value = [[value] for value in batch]
+        
+        written = []
+        for i in range(3):
+            shot_data = ShotData(hit=True, distance=5.0, angle=0.5, velocity=15.0,
+                                 timestamp=time.time() + i)
+            self.coordinator.accumulated_shots = [{
+                'shot_data': shot_data,
+                'coefficient_values': self.coordinator.current_coefficient_values.copy(),
+            }]
+            with patch.object(self.coordinator.nt_interface, 'write_coefficient',
+                              return_value=True) as write:
+                self.coordinator._run_optimization()
+            written.append(write.call_args.args[1])
+        
+        self.assertEqual(written, batch)
+        current.optimizer.ask.assert_called_once_with(n_points=3, strategy="cl_min")
+    
     def test_skip_to_next_coefficient(self):
         """Test skipping to next coefficient."""
         initial_index = self.coordinator.optimizer.current_index
@@ -321,6 +350,53 @@ class TestBayesianTunerCoordinator(unittest.TestCase):
                 
                 # Should write status
                 mock_write.assert_called()
+    
+    def test_tuning_loop_error_backoff(self):
+        """Test repeated loop failures back off exponentially and log once."""
+        sleeps = []
+        
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            if len(sleeps) == 8:
+                self.coordinator.running = False
+        
+        self.coordinator.running = True
+        with patch.object(self.coordinator, '_check_runtime_toggle',
+                          side_effect=RuntimeError("NT reconnecting")):
+            with patch('time.sleep', side_effect=fake_sleep):
+                with self.assertLogs('tuner', level='ERROR') as logs:
+                    self.coordinator._tuning_loop()
+        
+        self.assertEqual([round(s, 1) for s in sleeps],
+                         [0.1, 0.2, 0.4, 0.8, 1.6, 3.2, 5.0, 5.0])
+        errors = [r for r in logs.records if r.getMessage().startswith("Error in tuning loop")]
+        self.assertEqual(len(errors), 1)
+        self.assertIsNotNone(errors[0].exc_info)
+
+    def test_tuning_loop_logs_distinct_errors(self):
+        """Test only repeats of the same loop error are suppressed."""
+        messages = ["first", "second", "second"]
+        
+        def fail():
+            if len(messages) == 1:
+                self.coordinator.running = False
+            raise RuntimeError(messages.pop(0))
+        
+        self.coordinator.running = True
+        module_logger = sys.modules[BayesianTunerCoordinator.__module__].logger
+        with patch.object(self.coordinator, '_check_runtime_toggle', side_effect=fail):
+            with patch('time.sleep'):
+                with self.assertLogs('tuner', level='ERROR') as logs:
+                    self.coordinator._tuning_loop()
+                    # Other errors from this module are not rate limited
+                    module_logger.error("Error in tuning loop: second")
+        
+        errors = [r.getMessage() for r in logs.records
+                  if r.getMessage().startswith("Error in tuning loop")]
+        self.assertEqual(errors,
+                         ["Error in tuning loop: first",
+                          "Error in tuning loop: second",
+                          "Error in tuning loop: second"])
 
 
 class TestBayesianTunerCoordinatorHotkeys(unittest.TestCase):
@@ -27,6 +27,19 @@ from .logger import TunerLogger, setup_logging
 
 logger = logging.getLogger(__name__)
 
+# How often the tuning loop double-checks the listener-maintained NT connection flag
+CONNECTION_POLL_INTERVAL_S = 1.0
+
+# Longest the tuning loop sleeps between NT wake-ups when nothing is happening
+IDLE_WAKE_INTERVAL_S = 1.0
+
+# Tuning loop error backoff: doubles per consecutive failure, reset on a good tick
+ERROR_BACKOFF_INITIAL_S = 0.1
+ERROR_BACKOFF_MAX_S = 5.0
+
+# Identical tuning loop errors are logged at most once per window
+ERROR_LOG_DUPLICATE_WINDOW_S = 5.0
+
 # ══════════════════════════════════════════════════════════════════════════════
 # KEYBOARD HOTKEYS
 # ══════════════════════════════════════════════════════════════════════════════
@@ -79,10 +92,10 @@ class BayesianTunerCoordinator:
         """
         self.config = config or TunerConfig()
         
-        # Validate configuration
-        warnings = self.config.validate_config()
+        # Validate configuration (cached on the config)
+        warnings = self.config.validation_warnings
         if warnings:
-            logger.warning(f"Configuration warnings: {warnings}")
+            logger.warning("Configuration warnings: %s", list(warnings))
         
         # ── Core Components ──
         self.nt_interface = NetworkTablesInterface(self.config)
@@ -93,6 +106,9 @@ class BayesianTunerCoordinator:
         self.running = False
         self.thread: Optional[threading.Thread] = None
         self.last_shot_timestamp = 0.0
+        self._last_connection_poll = float('-inf')
+        self._error_backoff = ERROR_BACKOFF_INITIAL_S
+        self._last_loop_error = None  # (message, monotonic time) of the last logged loop error
         
         # ── Runtime Enable/Disable Toggle ──
         # This can be changed at runtime via dashboard
@@ -197,6 +213,7 @@ class BayesianTunerCoordinator:
         self.data_logger.log_event('STOP', 'Tuner stopping')
         
         self.running = False
+        self.nt_interface.wake()
         
         # Wait for thread to finish
         if self.thread:
@@ -220,6 +237,17 @@ class BayesianTunerCoordinator:
         
         while self.running:
             try:
+                # One monotonic clock sample per tick, shared by the NT calls below
+                now = time.monotonic()
+                
+                # Low-rate direct connection check behind the NT listener
+                if now - self._last_connection_poll >= CONNECTION_POLL_INTERVAL_S:
+                    self._last_connection_poll = now
+                    self.nt_interface.poll_connection()
+                
+                # Write out buffered shot rows that have waited too long
+                self.data_logger.flush_if_due(now)
+                
                 # Check for runtime enable/disable toggle from dashboard
                 self._check_runtime_toggle()
                 
@@ -230,7 +258,8 @@ class BayesianTunerCoordinator:
                         self.runtime_enabled,
                         paused=not self.runtime_enabled or self.nt_interface.is_match_mode()
                     )
-                    time.sleep(1.0)
+                    self._error_backoff = ERROR_BACKOFF_INITIAL_S
+                    self.nt_interface.wait_for_activity(IDLE_WAKE_INTERVAL_S, 1.0)
                     continue
                 
                 # ── MANUAL COEFFICIENT ADJUSTMENT ──
@@ -242,7 +271,7 @@ class BayesianTunerCoordinator:
                 self._check_backtrack_request()
                 
                 # Check for new shot data
-                shot_data = self.nt_interface.read_shot_data()
+                shot_data = self.nt_interface.read_shot_data(now=now)
                 
                 if shot_data:
                     self._accumulate_shot(shot_data)
@@ -268,13 +297,23 @@ class BayesianTunerCoordinator:
                 
                 # Update status on dashboard
                 self._update_status()
+                self._error_backoff = ERROR_BACKOFF_INITIAL_S
                 
-                # Sleep until next update
-                time.sleep(update_period)
+                # Sleep until the next shot/dashboard change (or idle timeout)
+                self.nt_interface.wait_for_activity(IDLE_WAKE_INTERVAL_S, update_period)
                 
             except Exception as e:
-                logger.error(f"Error in tuning loop: {e}", exc_info=True)
-                time.sleep(1.0)
+                # Log each distinct error, repeats at most once per window
+                message = str(e)
+                error_time = time.monotonic()
+                last = self._last_loop_error
+                if (last is None or last[0] != message
+                        or error_time - last[1] >= ERROR_LOG_DUPLICATE_WINDOW_S):
+                    logger.exception("Error in tuning loop: %s", e)
+                    self._last_loop_error = (message, error_time)
+                # Back off while the failure persists (e.g. NT reconnecting)
+                time.sleep(self._error_backoff)
+                self._error_backoff = min(self._error_backoff * 2, ERROR_BACKOFF_MAX_S)
         
         logger.info("Tuning loop ended")
     
@@ -648,21 +687,23 @@ class BayesianTunerCoordinator:
         # Clear accumulated shots
         self.accumulated_shots = []
         
-        # Get and apply coefficient updates
-        self._update_coefficients()
-        
-        # NOTE: Auto-advance is now handled separately in _check_auto_advance()
-        # This allows auto-advance to work independently of autotune mode
-        
-        # Get current settings for dashboard update
-        current_autotune, current_threshold = self._get_current_autotune_settings()
-        
-        # Update dashboard status
-        self.nt_interface.write_autotune_status(
-            current_autotune,
-            len(self.accumulated_shots),
-            current_threshold
-        )
+        # Coefficient, interlock and status updates reach the robot in one flush
+        with self.nt_interface.batched_writes():
+            # Get and apply coefficient updates
+            self._update_coefficients()
+            
+            # NOTE: Auto-advance is now handled separately in _check_auto_advance()
+            # This allows auto-advance to work independently of autotune mode
+            
+            # Get current settings for dashboard update
+            current_autotune, current_threshold = self._get_current_autotune_settings()
+            
+            # Update dashboard status
+            self.nt_interface.write_autotune_status(
+                current_autotune,
+                len(self.accumulated_shots),
+                current_threshold
+            )
         
         logger.info("Optimization complete, coefficients updated")
     
@@ -102,7 +102,6 @@ public class FiringSolver extends SubsystemBase {
       double exitVelocityMps,
       double yawRadians) {
 
-    m_shotTimestampPub.set(Timer.getFPGATimestamp());
     m_hitPub.set(hit);
     m_distancePub.set(distanceMeters);
 
@@ -115,6 +114,10 @@ public class FiringSolver extends SubsystemBase {
     m_projectileMassPub.set(m_projectileMass.get());
     m_projectileAreaPub.set(m_projectileArea.get());
 
+    // Timestamp goes last: the tuner reads a shot when ShotTimestamp changes,
+    // so every other field of this shot must already be published
+    m_shotTimestampPub.set(Timer.getFPGATimestamp());
+
     // AdvantageKit/NT logging
     Logger.recordOutput("FiringSolver/Hit", hit);
     Logger.recordOutput("FiringSolver/Solution",
@@ -130,9 +133,10 @@ public class FiringSolver extends SubsystemBase {
       double yawRadians,
       double targetHeightMeters,
       double launchHeightMeters) {
-    logShot(hit, distanceMeters, pitchRadians, exitVelocityMps, yawRadians);
+    // Heights first, so they are in place before logShot publishes ShotTimestamp
     m_targetHeightPub.set(targetHeightMeters);
     m_launchHeightPub.set(launchHeightMeters);
+    logShot(hit, distanceMeters, pitchRadians, exitVelocityMps, yawRadians);
 
     Logger.recordOutput("FiringSolver/TargetHeight", targetHeightMeters);
     Logger.recordOutput("FiringSolver/LaunchHeight", launchHeightMeters);